@@ -3,19 +3,39 @@ import { spawn } from 'child_process';
 import path from 'path';
 import crypto from 'crypto';
 
-// Cache for SWOT analysis results (24 hour expiry)
-const swotCache = new Map<string, { data: any; timestamp: number }>();
+// Cache for SWOT analysis results (24 hour expiry). Results from the scoring server
+// are kept in its compact form (phrase IDs instead of text) and rendered on the way out.
+type CachedSWOT = { data: any; compact: boolean; metadata: any; timestamp: number };
+const swotCache = new Map<string, CachedSWOT>();
 const CACHE_DURATION = 24 * 60 * 60 * 1000; // 24 hours
 
+// Long-lived scoring server (`python3 services/swot-scoring.py serve`). When it is
+// reachable we reuse its warm model over pooled keep-alive connections instead of
+// spawning a fresh interpreter per request.
+const SWOT_SCORING_URL = process.env.SWOT_SCORING_URL || 'http://127.0.0.1:8765';
+const SWOT_SCORING_TIMEOUT = 10 * 1000; // 10 seconds
+
+// Analyses still being computed, by input hash: concurrent identical requests share one
+const swotInFlight = new Map<string, Promise<any>>();
+
+// The scoring server shed the request (503) or missed its deadline (504). Spawning an
+// interpreter would only add load, so these skip the per-request Python fallback.
+class ScoringServerBusyError extends Error {}
+
 function createSWOTHash(industry: string, location: string, audience: string, description: string): string {
   const input = `${industry}-${location}-${audience}-${description}`;
   return crypto.createHash('md5').update(input).digest('hex');
 }
 
+// Phrase table of the scoring server (GET /phrases), needed to render compact results
+type PhraseTable = { version: number; phrases: string[]; sections: string[]; metrics: string[]; features: string[] };
+let phraseTable: PhraseTable | null = null;
+
 function getCachedSWOT(hash: string): any | null {
   const cached = swotCache.get(hash);
   if (cached && Date.now() - cached.timestamp < CACHE_DURATION) {
-    return cached.data;
+    const result = cached.compact ? renderCompactSWOT(cached.data) : cached.data;
+    return { ...result, metadata: cached.metadata };
   }
   if (cached) {
     swotCache.delete(hash); // Remove expired cache
@@ -23,8 +43,81 @@ function getCachedSWOT(hash: string): any | null {
   return null;
 }
 
-function setCachedSWOT(hash: string, data: any): void {
-  swotCache.set(hash, { data, timestamp: Date.now() });
+function setCachedSWOT(hash: string, data: any, compact: boolean, metadata: any): void {
+  swotCache.set(hash, { data, compact, metadata, timestamp: Date.now() });
+}
+
+async function loadPhraseTable(compact: any): Promise<void> {
+  // Phrases are only ever appended, so a newer server just means a longer table
+  const ids = [...compact.p.flat(), ...compact.r];
+  if (phraseTable && phraseTable.version === compact.v && ids.every((id: number) => id < phraseTable.phrases.length)) {
+    return;
+  }
+  const response = await fetch(`${SWOT_SCORING_URL}/phrases`, { signal: AbortSignal.timeout(SWOT_SCORING_TIMEOUT) });
+  if (!response.ok) {
+    throw new Error(`Scoring server returned ${response.status} for /phrases`);
+  }
+  phraseTable = await response.json();
+  if (phraseTable.version !== compact.v) {
+    throw new Error(`Unsupported compact result version ${compact.v}`);
+  }
+}
+
+// Mirror of render_compact in services/swot-scoring.py, tagged like the route's other ML results
+function renderCompactSWOT(compact: any): any {
+  const text = (ids: number[]) => ids.map((id) => phraseTable.phrases[id].split('{industry}').join(String(compact.i)));
+  const [overall, success, strengths, weaknesses, opportunities, threats] = compact.s;
+  const result: any = {
+    overall_score: overall,
+    success_probability: success,
+    component_scores: { strengths, weaknesses, opportunities, threats },
+    swot_analysis: Object.fromEntries(phraseTable.sections.map((section, index) => [section, text(compact.p[index])])),
+    metrics: Object.fromEntries(phraseTable.metrics.map((name, index) => [name, compact.m[index]])),
+    recommendations: text(compact.r),
+    analysis_method: 'python_ml_model'
+  };
+  if ('x' in compact) {
+    result.explanation = compact.x && {
+      method: compact.x[3],
+      base_value: compact.x[0],
+      contributions: Object.fromEntries(compact.x[1].map((feature: number, index: number) => [
+        phraseTable.features[feature], compact.x[2][index]
+      ]))
+    };
+  }
+  return result;
+}
+
+// Compact result from the long-lived scoring server
+async function runScoringServerAnalysis(startupData: any): Promise<any> {
+  const response = await fetch(`${SWOT_SCORING_URL}/score?compact=1&deadline_ms=${SWOT_SCORING_TIMEOUT}`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(startupData),
+    signal: AbortSignal.timeout(SWOT_SCORING_TIMEOUT)
+  });
+
+  if (!response.ok) {
+    const errorData = await response.json().catch(() => ({}));
+    const message = `Scoring server returned ${response.status}: ${errorData.error || response.statusText}`;
+    throw response.status === 503 || response.status === 504 ? new ScoringServerBusyError(message) : new Error(message);
+  }
+
+  const compact = await response.json();
+  await loadPhraseTable(compact);
+  return compact;
+}
+
+async function getScoringServerStatus(): Promise<string> {
+  try {
+    const response = await fetch(`${SWOT_SCORING_URL}/readyz`, {
+      signal: AbortSignal.timeout(1000)
+    });
+    const { status } = await response.json();
+    return status;
+  } catch {
+    return 'unavailable';
+  }
 }
 
 async function runPythonSWOTAnalysis(startupData: any): Promise<any> {
@@ -129,6 +222,55 @@ function generateFallbackSWOTAnalysis(industry: string, location: string, audien
   };
 }
 
+async function computeSWOTAnalysis(
+  industry: string, location: string, audience: string, description: string, inputHash: string
+): Promise<any> {
+  // Prepare data for Python script
+  const startupData = { industry, location, audience, description };
+
+  let analysisResult;
+  let compactResult = null;
+  let serverBusy = false;
+
+  try {
+    try {
+      console.log('Requesting SWOT analysis from scoring server...');
+      compactResult = await runScoringServerAnalysis(startupData);
+      analysisResult = renderCompactSWOT(compactResult);
+      console.log('Scoring server SWOT analysis completed successfully');
+    } catch (serverError) {
+      compactResult = null;
+      if (serverError instanceof ScoringServerBusyError) {
+        serverBusy = true;
+        throw serverError;
+      }
+      console.warn('Scoring server unavailable, running Python SWOT analysis directly:', serverError);
+      analysisResult = await runPythonSWOTAnalysis(startupData);
+      console.log('Python SWOT analysis completed successfully');
+    }
+    analysisResult.analysis_method = 'python_ml_model';
+  } catch (error) {
+    console.error('Python SWOT analysis failed, using fallback:', error);
+    analysisResult = generateFallbackSWOTAnalysis(industry, location, audience, description);
+  }
+  
+  // Add metadata
+  const metadata = {
+    generatedAt: new Date().toISOString(),
+    industry,
+    location,
+    audience,
+    cacheKey: inputHash,
+    analysisType: 'comprehensive_swot_analysis'
+  };
+
+  // Cache the result; a fallback for an overloaded server is not worth keeping for a day
+  if (!serverBusy) {
+    setCachedSWOT(inputHash, compactResult || analysisResult, compactResult !== null, metadata);
+  }
+  return { ...analysisResult, metadata };
+}
+
 export async function POST(request: NextRequest) {
   try {
     const { industry, location, audience, description, forceFresh } = await request.json();
@@ -161,41 +303,16 @@ export async function POST(request: NextRequest) {
       console.log('Force refresh requested, bypassing cache');
     }
 
-    // Prepare data for Python script
-    const startupData = {
-      industry,
-      location,
-      audience,
-      description: description || ''
-    };
-
-    let analysisResult;
-
-    try {
-      console.log('Running Python SWOT analysis...');
-      analysisResult = await runPythonSWOTAnalysis(startupData);
-      console.log('Python SWOT analysis completed successfully');
-      analysisResult.analysis_method = 'python_ml_model';
-    } catch (error) {
-      console.error('Python SWOT analysis failed, using fallback:', error);
-      analysisResult = generateFallbackSWOTAnalysis(industry, location, audience, description || '');
+    // Join an identical analysis that is already running instead of starting another
+    let analysis = swotInFlight.get(inputHash);
+    if (analysis) {
+      console.log('Joining in-flight SWOT analysis');
+    } else {
+      analysis = computeSWOTAnalysis(industry, location, audience, description || '', inputHash)
+        .finally(() => swotInFlight.delete(inputHash));
+      swotInFlight.set(inputHash, analysis);
     }
-    
-    // Add metadata
-    const response = {
-      ...analysisResult,
-      metadata: {
-        generatedAt: new Date().toISOString(),
-        industry,
-        location,
-        audience,
-        cacheKey: inputHash,
-        analysisType: 'comprehensive_swot_analysis'
-      }
-    };
-
-    // Cache the result
-    setCachedSWOT(inputHash, response);
+    const response = await analysis;
     
     return NextResponse.json(response);
 
@@ -215,6 +332,8 @@ export async function POST(request: NextRequest) {
 
 // Health check endpoint
 export async function GET() {
+  const scoringServer = await getScoringServerStatus();
+
   return NextResponse.json({
     status: 'operational',
     service: 'swot-analysis',
@@ -222,6 +341,7 @@ export async function GET() {
     cacheSize: swotCache.size,
     features: {
       pythonMLModel: 'available',
+      scoringServer,
       deterministicFallback: 'available',
       caching: 'enabled',
       normalization: 'pandas/numpy',
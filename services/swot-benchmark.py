@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+SWOT Scoring Benchmark Harness
+Measures import time, model construction, per-call latency, batch throughput,
+memory high-water marks and cache hit/miss paths of services/swot-scoring.py,
+and compares the results against a previous run to catch regressions
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'swot-scoring.py')
+
+INDUSTRIES = ['FinTech', 'HealthTech', 'EdTech', 'E-commerce', 'SaaS', 'AI/ML', 'IoT', 'Blockchain', 'Retail']
+LOCATIONS = ['US', 'Europe', 'Asia', 'Global', 'India']
+AUDIENCES = ['small businesses', 'students', 'hospitals', 'developers', 'retail investors']
+
+# Metrics where a larger value is better; every other numeric metric is treated as a cost
+HIGHER_IS_BETTER = ('rows_per_second',)
+# Tail percentiles of sub-millisecond calls swing by multiples between identical runs, so they are reported, not gated
+UNGATED = ('.calls', 'budget_ms', '.p95_ms', '.p99_ms')
+# Timing changes smaller than this are noise, whatever their relative size
+NOISE_FLOOR_MS = 0.1
+
+
+def load_scoring_module():
+    """Import swot-scoring.py (its file name is not a valid module name)"""
+    spec = importlib.util.spec_from_file_location('swot_scoring', SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so worker processes can unpickle tasks defined in it
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_startups(count: int, seed: int = 7) -> List[Dict[str, str]]:
+    """Deterministic, distinct startup ideas so every call misses the result cache"""
+    rng = random.Random(seed)
+    return [
+        {
+            'industry': rng.choice(INDUSTRIES),
+            'location': rng.choice(LOCATIONS),
+            'audience': rng.choice(AUDIENCES),
+            'description': f"benchmark idea {i} {rng.getrandbits(32):08x}",
+        }
+        for i in range(count)
+    ]
+
+
+def percentiles(samples_ms: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples_ms)
+
+    def pick(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 4)
+
+    return {'p50_ms': pick(0.50), 'p95_ms': pick(0.95), 'p99_ms': pick(0.99),
+            'mean_ms': round(sum(ordered) / len(ordered), 4), 'calls': len(ordered)}
+
+
+def time_calls(fn: Callable[[Any], Any], inputs: List[Any]) -> Dict[str, float]:
+    samples = []
+    for item in inputs:
+        start = time.perf_counter()
+        fn(item)
+        samples.append((time.perf_counter() - start) * 1000)
+    return percentiles(samples)
+
+
+def peak_traced_mb(fn: Callable[[], Any]) -> float:
+    """Peak Python/NumPy allocation while running fn, measured separately from timing runs"""
+    tracemalloc.start()
+    try:
+        fn()
+        return round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+    finally:
+        tracemalloc.stop()
+
+
+def bench_import(swot) -> Dict[str, Any]:
+    report = swot.check_import_budget()
+    return {key: report[key] for key in ('elapsed_ms', 'numpy_ms', 'module_ms', 'budget_ms', 'within_budget')}
+
+
+def bench_construction(swot, model_path: str, repeats: int) -> Dict[str, Any]:
+    def best_of(fn: Callable[[], Any]) -> float:
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        return round(best * 1000, 2)
+
+    return {
+        'load_artifact_ms': best_of(lambda: swot.SWOTScoringEngine(model_path=model_path, use_cache=False)),
+        'train_in_process_ms': best_of(lambda: swot.SWOTScoringEngine(train=True, use_cache=False)),
+    }
+
+
+def bench_single_calls(swot, model_path: str, calls: int) -> Dict[str, Any]:
+    startups = make_startups(calls)
+    uncached = swot.SWOTScoringEngine(model_path=model_path, use_cache=False)
+    cached = swot.SWOTScoringEngine(model_path=model_path, use_cache=False)
+    cached.cache = swot.ResultCache(max_entries=calls)
+    cached.cache.bind_model(cached.model_version)
+
+    # Warm both engines on other inputs so first-call effects stay out of the percentiles
+    for startup in make_startups(50, seed=99):
+        uncached.calculate_swot_scores(startup)
+        cached._score(startup)
+
+    results = {'no_cache': time_calls(uncached.calculate_swot_scores, startups)}
+    results['cache_miss'] = time_calls(cached.calculate_swot_scores, startups)
+    results['cache_hit'] = time_calls(cached.calculate_swot_scores, startups)
+    results['cache_stats'] = cached.cache.stats()
+    return results
+
+
+def bench_batches(swot, model_path: str, sizes: List[int], repeats: int) -> Dict[str, Any]:
+    engine = swot.SWOTScoringEngine(model_path=model_path, use_cache=False)
+    engine.calculate_swot_scores_batch(make_startups(10, seed=99))
+    results = {}
+    for size in sizes:
+        startups = make_startups(size, seed=size)
+        # Small batches are too quick to time once; large ones are run a single time
+        elapsed = float('inf')
+        for _ in range(repeats if size < 10000 else 1):
+            start = time.perf_counter()
+            engine.calculate_swot_scores_batch(startups)
+            elapsed = min(elapsed, time.perf_counter() - start)
+        results[str(size)] = {
+            'seconds': round(elapsed, 4),
+            'rows_per_second': round(size / elapsed, 1),
+            'peak_traced_mb': peak_traced_mb(lambda: engine.calculate_swot_scores_batch(startups)),
+        }
+    return results
+
+
+def bench_subprocess(model_path: str, calls: int) -> Dict[str, Any]:
+    """The path app/api/swot-analysis/route.ts falls back to: one interpreter per request"""
+    env = dict(os.environ, SWOT_MODEL_PATH=model_path)
+    samples = []
+    for startup in make_startups(calls, seed=11):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, SCRIPT_PATH, json.dumps(startup)],
+                       env=env, check=True, capture_output=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return percentiles(samples)
+
+
+def run_benchmarks(model_path: Optional[str], batch_sizes: List[int], calls: int,
+                   subprocess_calls: int, repeats: int) -> Dict[str, Any]:
+    swot = load_scoring_module()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if model_path is None or not os.path.exists(os.path.join(model_path, swot.MANIFEST_NAME)):
+            model_path = os.path.join(tmp_dir, 'swot-model')
+            swot.train(model_path)
+
+        results = {
+            'python': sys.version.split()[0],
+            'generated_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'import': bench_import(swot),
+            'construction': bench_construction(swot, model_path, repeats),
+            'single_call': bench_single_calls(swot, model_path, calls),
+            'batch': bench_batches(swot, model_path, batch_sizes, repeats),
+            'subprocess': bench_subprocess(model_path, subprocess_calls) if subprocess_calls else None,
+        }
+        results['peak_rss_mb'] = swot._peak_rss_mb()
+        return results
+
+
+def flatten(results: Dict[str, Any], prefix: str = '') -> Dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, name))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], max_regression: float,
+            noise_floor_ms: float = NOISE_FLOOR_MS) -> List[str]:
+    """List timing/throughput/memory metrics that got worse than baseline by more than max_regression
+
+    Only stable statistics are gated: medians, means, throughput and memory.
+    Timings that moved by less than noise_floor_ms are ignored.
+    """
+    regressions = []
+    current_flat, baseline_flat = flatten(current), flatten(baseline)
+    for name, old in baseline_flat.items():
+        new = current_flat.get(name)
+        if new is None or old <= 0 or name.endswith(UNGATED) or '.cache_stats.' in name:
+            continue
+        unit_ms = 1 if name.endswith('_ms') else 1000 if name.endswith('.seconds') else None
+        if unit_ms is not None and abs(new - old) * unit_ms < noise_floor_ms:
+            continue
+        if name.endswith(HIGHER_IS_BETTER):
+            change = (old - new) / old
+        else:
+            change = (new - old) / old
+        if change > max_regression:
+            regressions.append(f"{name}: {old} -> {new} ({change:+.0%})")
+    return regressions
+
+
+def main():
+    """Main function for command-line usage"""
+    parser = argparse.ArgumentParser(description='Benchmark the SWOT scoring engine')
+    parser.add_argument('--model-path', help='Artifact to benchmark (a temporary one is trained if missing)')
+    parser.add_argument('--batch-sizes', default='1,100,10000,100000',
+                        help='Comma-separated batch sizes for throughput runs')
+    parser.add_argument('--calls', type=int, default=1000, help='Single-call latency samples')
+    parser.add_argument('--subprocess-calls', type=int, default=10,
+                        help='End-to-end subprocess samples (0 to skip)')
+    parser.add_argument('--repeats', type=int, default=3, help='Repeats for construction timings')
+    parser.add_argument('--output', help='Write results JSON here instead of stdout')
+    parser.add_argument('--baseline', help='Previous results JSON to compare against')
+    parser.add_argument('--max-regression', type=float, default=0.25,
+                        help='Allowed relative slowdown before failing (0.25 = 25%%)')
+    parser.add_argument('--noise-floor-ms', type=float, default=NOISE_FLOOR_MS,
+                        help='Ignore timing changes smaller than this many milliseconds')
+    args = parser.parse_args()
+
+    results = run_benchmarks(
+        args.model_path, [int(size) for size in args.batch_sizes.split(',') if size],
+        args.calls, args.subprocess_calls, args.repeats
+    )
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.max_regression, args.noise_floor_ms)
+        results['regressions'] = regressions
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
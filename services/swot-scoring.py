@@ -2,242 +2,1941 @@
 """
 Advanced SWOT Analysis Scoring System
 Uses ML models, normalization, and similarity search for startup evaluation
+
+Only NumPy is imported eagerly. pandas and scikit-learn are needed for
+training alone and the server, SQLite and CLI modules are imported by the
+code paths that use them, so scoring with a pre-trained artifact starts fast.
 """
 
-import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import StandardScaler, LabelEncoder
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error, r2_score
 import json
+import os
 import sys
 import hashlib
-from typing import Dict, List, Tuple, Any
+import struct
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import Dict, List, Tuple, Any, Iterator, Optional, Union
 import warnings
 warnings.filterwarnings('ignore')
 
-class SWOTScoringEngine:
+# Import-time budget for scoring, in milliseconds on top of NumPy's own import
+IMPORT_BUDGET_MS = 40.0
+# Modules that must stay off the inference import path: training, server, cache and file-format dependencies
+DEFERRED_MODULES = ('pandas', 'sklearn', 'scipy', 'pyarrow', 'http.server', 'sqlite3', 'concurrent.futures', 'asyncio')
+
+# Model artifact layout: a directory holding manifest.json plus one .npy file per
+# forest array, so the tree arrays can be memory-mapped and shared between processes
+ARTIFACT_FORMAT_VERSION = 2
+MANIFEST_NAME = 'manifest.json'
+DEFAULT_MODEL_PATH = os.environ.get(
+    'SWOT_MODEL_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models', 'swot-model')
+)
+
+CATEGORICAL_COLUMNS = ['industry', 'location', 'team_size']
+# Labels the synthetic training data is drawn from, in drawing order
+MOCK_CATEGORIES = {
+    'industry': ['FinTech', 'HealthTech', 'EdTech', 'E-commerce', 'SaaS', 'AI/ML', 'IoT', 'Blockchain'],
+    'location': ['US', 'Europe', 'Asia', 'Global'],
+    'team_size': ['1-5', '6-15', '16-50', '50+'],
+}
+# Rows generated per training chunk; bounds training memory independently of the data size
+DEFAULT_TRAINING_CHUNK_SIZE = 250000
+# Training rows checked against sklearn after exporting the forest
+PARITY_SAMPLE_ROWS = 10000
+# Grid points evaluated per chunk by SWOTScoringEngine.sweep
+DEFAULT_SWEEP_CHUNK_ROWS = 65536
+# Rows read, scored and written at a time by score_file; bounds its memory
+DEFAULT_BULK_BATCH_ROWS = 10000
+# score_file formats by file extension; Parquet and Arrow need pyarrow
+BULK_FORMATS = {
+    '.parquet': 'parquet', '.pq': 'parquet',
+    '.arrow': 'arrow', '.feather': 'arrow', '.ipc': 'arrow',
+    '.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl',
+}
+# Inverted lists probed per similarity query; more lists trade speed for recall
+DEFAULT_SIMILARITY_PROBES = 8
+# Training rows kept for the similarity index (a uniform sample beyond this); about 76 bytes a row while training
+DEFAULT_SIMILARITY_MAX_ROWS = 500000
+FEATURE_COLUMNS = [
+    'industry_encoded', 'location_encoded', 'team_size_encoded',
+    'market_growth_rate', 'competition_level', 'regulatory_difficulty',
+    'funding_availability', 'tech_complexity', 'market_size_billions',
+    'time_to_market_months', 'customer_acquisition_cost', 'revenue_potential'
+]
+
+# Names used for per-feature explanations, in FEATURE_COLUMNS order
+EXPLANATION_FEATURES = CATEGORICAL_COLUMNS + FEATURE_COLUMNS[3:]
+# Saabas costs about one extra predict; exact TreeSHAP costs milliseconds per row and is opt-in
+EXPLANATION_METHODS = ('saabas', 'tree_shap')
+DEFAULT_EXPLANATION_METHOD = 'saabas'
+
+METRIC_NAMES = [
+    'market_growth_rate', 'competition_level', 'regulatory_difficulty',
+    'funding_availability', 'tech_complexity', 'market_size_billions',
+    'time_to_market_months', 'customer_acquisition_cost', 'revenue_potential'
+]
+
+# Normalization ranges (min, max, higher_is_better)
+NORMALIZATION_RANGES = {
+    'market_growth_rate': (0, 50, True),
+    'competition_level': (1, 10, False),
+    'regulatory_difficulty': (1, 10, False),
+    'funding_availability': (1, 10, True),
+    'tech_complexity': (1, 10, True),
+    'market_size_billions': (0.1, 100, True),
+    'time_to_market_months': (1, 36, False),
+    'customer_acquisition_cost': (10, 1000, False),
+    'revenue_potential': (50000, 50000000, True)
+}
+
+# How each metric is derived from the input hash, in METRIC_NAMES order: a
+# normal-like draw with this mean and std (the first three means are scaled by
+# the industry's growth/competition/regulation factors), clipped to [lower, upper].
+# market_size_billions is log-normal: the draw is exponentiated before clipping.
+METRIC_HASH_MULTIPLIERS = np.array([3, 5, 7, 11, 13, 17, 19, 23, 29], dtype=np.int64)
+METRIC_HASH_MULTIPLIERS_LIST = METRIC_HASH_MULTIPLIERS.tolist()
+METRIC_MEANS = np.array([12, 5, 4, 6, 5, 1, 12, 200, 5000000], dtype=np.float64)
+METRIC_STDS = np.array([5, 2, 2, 2, 2, 0.5, 6, 100, 2000000], dtype=np.float64)
+METRIC_LOWER = np.array([0, 1, 1, 1, 1, 0.1, 1, 10, 50000], dtype=np.float64)
+METRIC_UPPER = np.array([np.inf, 10, 10, 10, 10, np.inf, np.inf, np.inf, np.inf], dtype=np.float64)
+LOG_NORMAL_METRIC = METRIC_NAMES.index('market_size_billions')
+
+
+class FlatForest:
+    """Random forest flattened into contiguous node arrays
+
+    All trees share one set of node arrays and ``roots`` holds the index of
+    each tree's root. The StandardScaler is folded into the split thresholds,
+    so rows are evaluated on raw (unscaled) features. ``children`` stores the
+    (left, right) pair of node i at 2*i and 2*i+1; leaves point back to
+    themselves with an infinite threshold, so every row can take exactly
+    ``max_depth`` steps with no branching or leaf checks. ``cover`` holds each
+    node's weighted training sample count, which explain(method='tree_shap')
+    needs; artifacts saved before it was exported load without it.
+    """
+    ARRAYS = ('feature', 'threshold', 'children', 'value', 'roots')
+    OPTIONAL_ARRAYS = ('cover',)
+
+    def __init__(self, feature: np.ndarray, threshold: np.ndarray, children: np.ndarray,
+                 value: np.ndarray, roots: np.ndarray, max_depth: int,
+                 cover: Optional[np.ndarray] = None):
+        self.feature = feature
+        self.threshold = threshold
+        self.children = children
+        self.value = value
+        self.roots = roots
+        self.max_depth = int(max_depth)
+        self.cover = cover
+        self._leaf_paths_cache = None
+
+    @classmethod
+    def from_sklearn(cls, model, scaler_mean: np.ndarray, scaler_scale: np.ndarray) -> 'FlatForest':
+        """Export a RandomForestRegressor fitted on StandardScaler output"""
+        features, thresholds, children, values, covers, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            node_ids = np.arange(tree.node_count)
+            is_leaf = tree.children_left == -1
+            feature = np.where(is_leaf, 0, tree.feature)
+
+            roots.append(offset)
+            features.append(feature.astype(np.int32))
+            thresholds.append(np.where(
+                is_leaf, np.inf,
+                _fold_thresholds(tree.threshold, scaler_mean[feature], scaler_scale[feature])
+            ))
+            children.append(np.column_stack([
+                np.where(is_leaf, node_ids, tree.children_left),
+                np.where(is_leaf, node_ids, tree.children_right),
+            ]).reshape(-1).astype(np.int32) + offset)
+            values.append(tree.value.reshape(-1).astype(np.float64))
+            covers.append(tree.weighted_n_node_samples.astype(np.float64))
+            offset += tree.node_count
+            max_depth = max(max_depth, tree.max_depth)
+
+        return cls(
+            np.concatenate(features), np.concatenate(thresholds).astype(np.float64),
+            np.concatenate(children), np.concatenate(values),
+            np.asarray(roots, dtype=np.int32), max_depth, cover=np.concatenate(covers)
+        )
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    def predict_one(self, x: np.ndarray) -> float:
+        """Evaluate a single row: one node index per tree, max_depth vector steps"""
+        x = np.asarray(x, dtype=np.float64)
+        nodes = self.roots
+        for _ in range(self.max_depth):
+            nodes = self.children[2 * nodes + (x[self.feature[nodes]] > self.threshold[nodes])]
+        return float(np.cumsum(self.value[nodes])[-1] / self.n_trees)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Average the leaf values reached by every row in every tree"""
+        X = np.asarray(X, dtype=np.float64)
+        # Row offsets let each (row, tree) pair read its split feature with one flat take
+        row_offsets = (np.arange(X.shape[0]) * X.shape[1])[:, None]
+        flat_X = X.reshape(-1)
+        nodes = np.tile(self.roots, (X.shape[0], 1))
+        for _ in range(self.max_depth):
+            go_right = flat_X[row_offsets + self.feature[nodes]] > self.threshold[nodes]
+            nodes = self.children[2 * nodes + go_right]
+
+        # Sequential sum over trees, in the same order sklearn accumulates them
+        return np.cumsum(self.value[nodes], axis=1)[:, -1] / self.n_trees
+
+    def explain(self, X: np.ndarray, method: str = DEFAULT_EXPLANATION_METHOD) -> Tuple[float, np.ndarray]:
+        """Split each row's prediction into a base value plus one contribution per feature
+
+        method is 'saabas' (path attribution, about the cost of a second
+        predict) or 'tree_shap' (exact path-dependent TreeSHAP, milliseconds
+        per row; needs node covers). Either way base +
+        contributions.sum(axis=1) equals predict(X) up to float rounding.
+        """
+        if method == 'saabas':
+            return self._explain_saabas(X)
+        if method != 'tree_shap':
+            raise ValueError(f"Unknown explanation method {method!r}; use one of {', '.join(EXPLANATION_METHODS)}")
+        if self.cover is None:
+            raise ValueError("tree_shap explanations need node covers; retrain the model artifact with this version")
+        return self._explain_tree_shap(X)
+
+    def _explain_saabas(self, X: np.ndarray) -> Tuple[float, np.ndarray]:
+        """Path attribution (Saabas)
+
+        Every split on the way to a leaf moves the running value from the node
+        mean to the child mean, and that change is credited to the split
+        feature. It takes the same max_depth steps as predict() using the node
+        values already stored, but credits features in path order, so features
+        split near the root can receive more credit than their Shapley value.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        n_rows, n_features = X.shape
+        row_offsets = (np.arange(n_rows) * n_features)[:, None]
+        flat_X = X.reshape(-1)
+        nodes = np.tile(self.roots, (n_rows, 1))
+        contributions = np.zeros(n_rows * n_features)
+        for _ in range(self.max_depth):
+            feature = self.feature[nodes]
+            go_right = flat_X[row_offsets + feature] > self.threshold[nodes]
+            next_nodes = self.children[2 * nodes + go_right]
+            # Leaves point at themselves, so finished trees add zero here
+            contributions += np.bincount((row_offsets + feature).reshape(-1),
+                                         weights=(self.value[next_nodes] - self.value[nodes]).reshape(-1),
+                                         minlength=n_rows * n_features)
+            nodes = next_nodes
+        base = float(np.asarray(self.value[self.roots]).sum() / self.n_trees)
+        return base, contributions.reshape(n_rows, n_features) / self.n_trees
+
+    def _explain_tree_shap(self, X: np.ndarray, block_entries: int = 1 << 21) -> Tuple[float, np.ndarray]:
+        """Exact path-dependent TreeSHAP, vectorized over rows and leaves
+
+        A leaf's path gives each feature j it splits on a cover fraction z_j
+        (the share of training samples its splits on j let through) and an
+        interval that x_j either falls in (o_j = 1) or not. With features
+        outside a coalition S marginalized by cover, the leaf contributes
+        v * prod_j (o_j if j in S else z_j), and the Shapley value of feature i
+        works out to v * (o_i - z_i) * integral_0^1 prod_{j != i} (z_j (1 - t) + o_j t) dt.
+        For a path on d features the integrand is a polynomial of degree d - 1,
+        so Gauss-Legendre quadrature with ceil(d / 2) nodes is exact.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        n_rows, n_features = X.shape
+        groups = self._leaf_paths(n_features)
+        base = float(sum(value @ zero.prod(axis=1) for value, _, zero, _, _, _ in groups))
+        contributions = np.empty((n_rows, n_features))
+        # Rows are taken in blocks so the (rows, leaves, path features) arrays stay bounded
+        block = max(1, block_entries // sum(features.size for _, features, _, _, _, _ in groups))
+        for start in range(0, n_rows, block):
+            x = X[start:start + block]
+            row_offsets = (np.arange(len(x)) * n_features)[:, None, None]
+            totals = np.zeros(len(x) * n_features)
+            for value, features, zero, lo, hi, quadrature in groups:
+                x_path = x[:, features]
+                delta = ((x_path > lo) & (x_path <= hi)) - zero
+                integrals = np.zeros_like(delta)
+                for t, weight in quadrature:
+                    factors = delta * t
+                    factors += zero
+                    integrals += (weight * factors.prod(axis=-1))[..., None] / factors
+                totals += np.bincount((row_offsets + features).reshape(-1),
+                                      weights=(value[:, None] * delta * integrals).reshape(-1),
+                                      minlength=len(totals))
+            contributions[start:start + len(x)] = totals.reshape(len(x), n_features)
+        return base, contributions
+
+    def _leaf_paths(self, n_features: int) -> List[Tuple[np.ndarray, ...]]:
+        """Leaves grouped by how many features their path splits on
+
+        Each group is (value / n_trees, path features, cover fractions z, lo,
+        hi, quadrature (t, weight) pairs); a row is in a leaf's (lo, hi] range
+        for a feature when that split sends it towards the leaf. Built
+        top-down one tree level at a time and cached on the forest.
+        """
+        if self._leaf_paths_cache is not None and self._leaf_paths_cache[0] == n_features:
+            return self._leaf_paths_cache[1]
+        nodes = np.asarray(self.roots, dtype=np.int64)
+        zero = np.ones((len(nodes), n_features))
+        lo = np.full((len(nodes), n_features), -np.inf)
+        hi = np.full((len(nodes), n_features), np.inf)
+        split = np.zeros((len(nodes), n_features), dtype=bool)
+        leaves = []
+        while len(nodes):
+            left, right = self.children[2 * nodes], self.children[2 * nodes + 1]
+            is_leaf = left == nodes
+            leaves.append((nodes[is_leaf], zero[is_leaf], lo[is_leaf], hi[is_leaf], split[is_leaf]))
+            nodes, left, right = nodes[~is_leaf], left[~is_leaf], right[~is_leaf]
+            zero, lo, hi, split = zero[~is_leaf], lo[~is_leaf], hi[~is_leaf], split[~is_leaf]
+
+            rows = np.arange(len(nodes))
+            feature = self.feature[nodes]
+            threshold = self.threshold[nodes]
+            split[rows, feature] = True
+            left_zero, right_zero = zero.copy(), zero
+            left_zero[rows, feature] *= self.cover[left] / self.cover[nodes]
+            right_zero[rows, feature] *= self.cover[right] / self.cover[nodes]
+            left_hi, right_lo = hi.copy(), lo.copy()
+            left_hi[rows, feature] = np.minimum(hi[rows, feature], threshold)
+            right_lo[rows, feature] = np.maximum(lo[rows, feature], threshold)
+
+            nodes = np.concatenate([left, right])
+            zero = np.concatenate([left_zero, right_zero])
+            lo = np.concatenate([lo, right_lo])
+            hi = np.concatenate([left_hi, hi])
+            split = np.concatenate([split, split])
+
+        leaf_nodes, zero, lo, hi, split = (np.concatenate(parts) for parts in zip(*leaves))
+        value = np.asarray(self.value[leaf_nodes]) / self.n_trees
+        depth = split.sum(axis=1)
+        groups = []
+        for d in np.unique(depth):
+            in_group = depth == d
+            # Path features first; only those d columns are kept
+            features = np.argsort(~split[in_group], axis=1, kind='stable')[:, :d]
+            nodes, weights = np.polynomial.legendre.leggauss(max(1, (int(d) + 1) // 2))
+            groups.append((value[in_group], features,
+                           *(np.take_along_axis(array[in_group], features, axis=1) for array in (zero, lo, hi)),
+                           list(zip((nodes + 1) / 2, weights / 2))))
+        self._leaf_paths_cache = (n_features, groups)
+        return groups
+
+
+def _fold_thresholds(threshold: np.ndarray, mean: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """Map split thresholds on scaled features back to raw feature space
+
+    sklearn routes a row left when float32((x - mean) / scale) <= threshold.
+    That predicate is monotone in x, so for each node we bisect for the
+    largest raw x that still goes left; ``x <= folded`` then reproduces
+    sklearn's decision exactly, float32 rounding included.
+    """
+    def goes_left(x):
+        return ((x - mean) / scale).astype(np.float32) <= threshold
+
+    estimate = threshold * scale + mean
+    margin = scale * (np.abs(threshold) + 1) * 1e-6
+    lo, hi = estimate - margin, estimate + margin
+    if not (goes_left(lo).all() and not goes_left(hi).any()):
+        raise ValueError("Could not bracket folded split thresholds")
+
+    # Bisection halves the gap until lo and hi are adjacent doubles
+    for _ in range(128):
+        mid = lo + (hi - lo) / 2
+        settled = (mid == lo) | (mid == hi)
+        if settled.all():
+            break
+        left = goes_left(mid)
+        lo = np.where(left & ~settled, mid, lo)
+        hi = np.where(~left & ~settled, mid, hi)
+    return lo
+
+
+class SimilarityIndex:
+    """IVF nearest-neighbour index over the scaled feature vectors of a reference set
+
+    Rows are clustered with k-means and stored grouped by cluster, so each
+    inverted list is one contiguous slice of ``vectors`` (list i spans
+    offsets[i]:offsets[i + 1]). A query ranks the centroids and scans only
+    the closest ``n_probe`` lists; probing every list is an exact search.
+    """
+    ARRAYS = ('centroids', 'offsets', 'vectors', 'scores', 'row_ids')
+
+    def __init__(self, centroids: np.ndarray, offsets: np.ndarray, vectors: np.ndarray,
+                 scores: np.ndarray, row_ids: np.ndarray):
+        self.centroids = centroids
+        self.offsets = offsets
+        self.vectors = vectors
+        self.scores = scores
+        self.row_ids = row_ids
+
+    @classmethod
+    def build(cls, vectors: np.ndarray, scores: np.ndarray, row_ids: Optional[np.ndarray] = None,
+              n_lists: Optional[int] = None, iterations: int = 10, seed: int = 42) -> 'SimilarityIndex':
+        """Cluster float32 vectors into about sqrt(n) inverted lists"""
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if row_ids is None:
+            row_ids = np.arange(len(vectors), dtype=np.int64)
+        if n_lists is None:
+            n_lists = int(np.sqrt(len(vectors)))
+        n_lists = max(1, min(n_lists, len(vectors)))
+
+        # k-means on a sample; 64 rows per centroid is plenty for placing the lists
+        rng = np.random.RandomState(seed)
+        sample = vectors[rng.choice(len(vectors), min(len(vectors), n_lists * 64), replace=False)]
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = _nearest_centroid(sample, centroids)
+            counts = np.bincount(assignment, minlength=n_lists)
+            sums = np.column_stack([np.bincount(assignment, weights=column, minlength=n_lists)
+                                    for column in sample.T])
+            filled = counts > 0
+            # Empty clusters keep their previous centroid
+            centroids[filled] = (sums[filled] / counts[filled, None]).astype(np.float32)
+
+        assignment = _nearest_centroid(vectors, centroids)
+        order = np.argsort(assignment, kind='stable')
+        offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignment, minlength=n_lists), out=offsets[1:])
+        return cls(centroids, offsets, vectors[order], np.asarray(scores, dtype=np.float32)[order],
+                   np.asarray(row_ids, dtype=np.int64)[order])
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.vectors)
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+    def search(self, queries: np.ndarray, k: int = 5,
+               n_probe: int = DEFAULT_SIMILARITY_PROBES) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions (into the index arrays) and distances of the k nearest rows to each query
+
+        Rows with fewer than k candidates are padded with position -1 and
+        distance inf; k is capped at the number of indexed rows. More lists
+        than n_probe are scanned when the closest ones hold fewer than k rows.
+        """
+        if k < 1:
+            raise ValueError('k must be at least 1')
+        k = min(k, max(self.n_rows, 1))
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        positions = np.full((len(queries), k), -1, dtype=np.int64)
+        distances = np.full((len(queries), k), np.inf, dtype=np.float32)
+        list_order = np.argsort(_squared_distances(queries, self.centroids), axis=1)
+        offsets = self.offsets.tolist()
+        for q, query in enumerate(queries):
+            ranges, found = [], 0
+            for list_id in list_order[q].tolist():
+                start, end = offsets[list_id], offsets[list_id + 1]
+                if start == end:
+                    continue
+                ranges.append((start, end))
+                found += end - start
+                if len(ranges) >= n_probe and found >= k:
+                    break
+            if not ranges:
+                continue
+            # Lists are contiguous, so each one is scanned as a slice without gathering rows
+            candidates = np.concatenate([np.arange(start, end) for start, end in ranges])
+            diff = np.concatenate([self.vectors[start:end] for start, end in ranges]) - query
+            squared = np.einsum('ij,ij->i', diff, diff)
+            top = np.argpartition(squared, k - 1)[:k] if len(squared) > k else np.arange(len(squared))
+            top = top[np.argsort(squared[top], kind='stable')]
+            positions[q, :len(top)] = candidates[top]
+            distances[q, :len(top)] = np.sqrt(squared[top])
+        return positions, distances
+
+
+class _ReferenceSample:
+    """Uniform sample of at most max_rows training rows, collected chunk by chunk
+
+    Every row gets a random key and the rows with the smallest keys are
+    kept, so memory stays bounded by max_rows plus one chunk. Kept rows stay
+    in the order they were added; when everything fits, the sample is
+    simply all rows.
+    """
+
+    def __init__(self, max_rows: int, seed: int = 42):
+        self.max_rows = max_rows
+        self.rng = np.random.RandomState(seed)
+        self.seen = 0
+        self.parts: Dict[str, np.ndarray] = {}
+
+    def add(self, vectors: np.ndarray, scores: np.ndarray, row_ids: np.ndarray):
+        chunk = {'vectors': vectors, 'scores': scores, 'row_ids': row_ids,
+                 'keys': self.rng.random_sample(len(vectors)),
+                 'positions': np.arange(self.seen, self.seen + len(vectors))}
+        self.seen += len(vectors)
+        parts = {name: np.concatenate([self.parts[name], part]) if self.parts else part
+                 for name, part in chunk.items()}
+        if len(parts['keys']) > self.max_rows:
+            keep = np.sort(np.argpartition(parts['keys'], self.max_rows - 1)[:self.max_rows])
+            parts = {name: part[keep] for name, part in parts.items()}
+        self.parts = parts
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(vectors, scores, row_ids) of the kept rows"""
+        return self.parts['vectors'], self.parts['scores'], self.parts['row_ids']
+
+
+def _squared_distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pairwise squared Euclidean distances between the rows of a and b"""
+    return (a * a).sum(axis=1)[:, None] - 2 * (a @ b.T) + (b * b).sum(axis=1)[None, :]
+
+
+def _nearest_centroid(vectors: np.ndarray, centroids: np.ndarray, block_entries: int = 1 << 22) -> np.ndarray:
+    """Index of the closest centroid per row, a block of rows at a time so the distance matrix stays small"""
+    rows = max(1, block_entries // len(centroids))
+    return np.concatenate([
+        np.argmin(_squared_distances(vectors[start:start + rows], centroids), axis=1)
+        for start in range(0, len(vectors), rows)
+    ])
+
+
+class ModelArtifact:
+    """Everything inference needs: scaler parameters, encoder vocabularies and the forest
+
+    ``similarity`` optionally holds the reference set index used by
+    find_similar; artifacts written before it existed simply have none.
+    """
+
+    def __init__(self, scaler_mean: np.ndarray, scaler_scale: np.ndarray,
+                 encoders: Dict[str, List[str]], forest: FlatForest,
+                 eval_metrics: Dict[str, float], model_version: Optional[str] = None,
+                 training_report: Optional[Dict[str, Any]] = None,
+                 similarity: Optional[SimilarityIndex] = None):
+        self.scaler_mean = np.asarray(scaler_mean, dtype=np.float64)
+        self.scaler_scale = np.asarray(scaler_scale, dtype=np.float64)
+        self.encoders = encoders
+        self.forest = forest
+        self.eval_metrics = eval_metrics
+        self.training_report = training_report
+        self.similarity = similarity
+        self.model_version = model_version or self._content_version()
+        # LabelEncoder assigns codes in sorted class order
+        self._vocabularies = {
+            col: {label: code for code, label in enumerate(classes)}
+            for col, classes in encoders.items()
+        }
+
+    def encode(self, column: str, label: Any) -> int:
+        """Encode a categorical value, falling back to 0 for unseen labels"""
+        return self._vocabularies.get(column, {}).get(label, 0)
+
+    def decode(self, column: str, code: Any) -> str:
+        return self.encoders[column][int(round(float(code)))]
+
+    def scale(self, features: np.ndarray) -> np.ndarray:
+        """Apply the fitted StandardScaler transform (the forest itself takes raw features)"""
+        return (np.asarray(features, dtype=np.float64) - self.scaler_mean) / self.scaler_scale
+
+    def unscale(self, scaled: np.ndarray) -> np.ndarray:
+        return np.asarray(scaled, dtype=np.float64) * self.scaler_scale + self.scaler_mean
+
+    def _arrays(self) -> Iterator[Tuple[str, np.ndarray]]:
+        """(file name, array) of every array stored next to the manifest"""
+        for name in FlatForest.ARRAYS:
+            yield f"{name}.npy", getattr(self.forest, name)
+        for name in FlatForest.OPTIONAL_ARRAYS:
+            if getattr(self.forest, name) is not None:
+                yield f"{name}.npy", getattr(self.forest, name)
+        if self.similarity is not None:
+            for name in SimilarityIndex.ARRAYS:
+                yield f"similarity_{name}.npy", getattr(self.similarity, name)
+
+    def _content_version(self) -> str:
+        """Version for a model that has not been saved yet, derived from its contents"""
+        digest = hashlib.sha256(json.dumps({
+            'scaler': [self.scaler_mean.tolist(), self.scaler_scale.tolist()],
+            'encoders': self.encoders,
+        }, sort_keys=True).encode())
+        for _, array in self._arrays():
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return f"unsaved-{digest.hexdigest()}"
+
+    def save(self, path: str) -> str:
+        """Write the artifact directory atomically and return its model version"""
+        import shutil
+
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+
+        checksums = {}
+        for filename, array in self._arrays():
+            np.save(os.path.join(tmp_path, filename), np.ascontiguousarray(array))
+            checksums[filename] = _file_sha256(os.path.join(tmp_path, filename))
+
+        manifest = {
+            'format_version': ARTIFACT_FORMAT_VERSION,
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'feature_schema': FEATURE_COLUMNS,
+            'scaler': {'mean': self.scaler_mean.tolist(), 'scale': self.scaler_scale.tolist()},
+            'encoders': self.encoders,
+            'forest': {'n_trees': self.forest.n_trees, 'n_nodes': self.forest.n_nodes,
+                       'max_depth': self.forest.max_depth},
+            'similarity': None if self.similarity is None else {
+                'n_rows': self.similarity.n_rows, 'n_lists': self.similarity.n_lists,
+            },
+            'eval_metrics': self.eval_metrics,
+            'training_report': self.training_report,
+            'checksums': checksums,
+        }
+        manifest['model_version'] = _manifest_version(manifest)
+        with open(os.path.join(tmp_path, MANIFEST_NAME), 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        # Each version gets its own directory under <path>.versions and path is a
+        # symlink swapped with os.replace, so there is always an artifact at path
+        versions_dir = f"{path}.versions"
+        os.makedirs(versions_dir, exist_ok=True)
+        version_name = manifest['model_version'][:16]
+        version_path = os.path.join(versions_dir, version_name)
+        if os.path.exists(os.path.join(version_path, MANIFEST_NAME)):
+            # Retraining produced the same model; keep the copy readers may have mapped
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        else:
+            shutil.rmtree(version_path, ignore_errors=True)
+            os.rename(tmp_path, version_path)
+
+        previous = os.path.realpath(path) if os.path.islink(path) else None
+        if os.path.isdir(path) and not os.path.islink(path):
+            # A directory written before artifacts were versioned; replaced once, non-atomically
+            shutil.rmtree(path)
+        link_path = f"{path}.link-{os.getpid()}"
+        if os.path.lexists(link_path):
+            os.remove(link_path)
+        os.symlink(os.path.join(os.path.basename(versions_dir), version_name), link_path)
+        os.replace(link_path, path)
+
+        # Keep the previous version for readers still loading it; older ones go
+        keep = {os.path.realpath(version_path), previous}
+        for name in os.listdir(versions_dir):
+            old_version = os.path.join(versions_dir, name)
+            if os.path.realpath(old_version) not in keep:
+                shutil.rmtree(old_version, ignore_errors=True)
+
+        self.model_version = manifest['model_version']
+        return self.model_version
+
+    @classmethod
+    def load(cls, path: str, verify: bool = True) -> 'ModelArtifact':
+        """Load an artifact, memory-mapping the forest arrays"""
+        # Resolve the symlink once so a concurrent save cannot swap versions mid-load
+        path = os.path.realpath(path)
+        with open(os.path.join(path, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+
+        if manifest.get('format_version') != ARTIFACT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported model artifact format: {manifest.get('format_version')}")
+        if manifest.get('feature_schema') != FEATURE_COLUMNS:
+            raise ValueError("Model artifact feature schema does not match this engine")
+        if manifest.get('model_version') != _manifest_version(manifest):
+            raise ValueError("Model artifact manifest checksum mismatch")
+
+        def load_array(filename):
+            array_path = os.path.join(path, filename)
+            if verify and _file_sha256(array_path) != manifest['checksums'].get(filename):
+                raise ValueError(f"Model artifact checksum mismatch for {filename}")
+            return np.load(array_path, mmap_mode='r')
+
+        forest = FlatForest(max_depth=manifest['forest']['max_depth'],
+                            **{name: load_array(f"{name}.npy") for name in FlatForest.ARRAYS},
+                            **{name: load_array(f"{name}.npy") for name in FlatForest.OPTIONAL_ARRAYS
+                               if f"{name}.npy" in manifest['checksums']})
+        if forest.n_trees != manifest['forest']['n_trees'] or forest.n_nodes != manifest['forest']['n_nodes']:
+            raise ValueError("Model artifact forest shape does not match its manifest")
+
+        similarity = None
+        if manifest.get('similarity'):
+            similarity = SimilarityIndex(
+                **{name: load_array(f"similarity_{name}.npy") for name in SimilarityIndex.ARRAYS})
+            if similarity.n_rows != manifest['similarity']['n_rows']:
+                raise ValueError("Model artifact similarity index does not match its manifest")
+
+        return cls(
+            manifest['scaler']['mean'], manifest['scaler']['scale'],
+            manifest['encoders'], forest, manifest['eval_metrics'],
+            model_version=manifest['model_version'], training_report=manifest.get('training_report'),
+            similarity=similarity
+        )
+
+
+# Industry-specific adjustments; the first key contained in the industry name wins
+INDUSTRY_FACTORS = {
+    'fintech': {'growth': 1.2, 'competition': 1.3, 'regulation': 1.8},
+    'healthtech': {'growth': 1.1, 'competition': 1.1, 'regulation': 2.0},
+    'edtech': {'growth': 1.0, 'competition': 1.2, 'regulation': 1.2},
+    'ecommerce': {'growth': 0.9, 'competition': 1.5, 'regulation': 1.0},
+    'saas': {'growth': 1.3, 'competition': 1.4, 'regulation': 1.1},
+    'ai': {'growth': 1.5, 'competition': 1.2, 'regulation': 1.3},
+    'blockchain': {'growth': 1.4, 'competition': 1.1, 'regulation': 1.9}
+}
+DEFAULT_INDUSTRY_FACTOR = {'growth': 1.0, 'competition': 1.0, 'regulation': 1.0}
+
+
+def _industry_factor(industry: str) -> Dict[str, float]:
+    """Find the adjustment factors for a lower-cased industry name"""
+    for key, values in INDUSTRY_FACTORS.items():
+        if key in industry:
+            return values
+    return DEFAULT_INDUSTRY_FACTOR
+
+
+@lru_cache(maxsize=4096)
+def _metric_factors(industry: str) -> Tuple[float, ...]:
+    """Per-metric mean multipliers for a lower-cased industry name
+
+    Matching is by substring (and 'ai' matches 'retail'), so rather than an
+    index the few distinct industry names seen in practice are memoised.
+    """
+    factor = _industry_factor(industry)
+    return (factor['growth'], factor['competition'], factor['regulation']) + (1.0,) * (len(METRIC_NAMES) - 3)
+
+
+def _input_hash(industry: str, location: str, audience: str, description: str) -> int:
+    """First 32 bits of the md5 of the lower-cased inputs, which seed every derived metric"""
+    digest = hashlib.md5(f"{industry}-{location}-{audience}-{description}".encode()).digest()
+    return int.from_bytes(digest[:4], 'big')
+
+
+def _box_muller(residues: np.ndarray) -> np.ndarray:
+    """Normal-like draw for each hash residue r = (hash * multiplier) % 1000000
+
+    u1 is r / 1e6 and u2 is (7 * r % 1e6) / 1e6. NumPy ufuncs rather than
+    math.log and math.cos, which differ from them in the last bit for some
+    residues.
+    """
+    u1 = np.maximum(0.000001, residues / 1000000.0)  # Avoid log(0)
+    u2 = ((residues * 7) % 1000000) / 1000000.0
+    return np.sqrt(-2.0 * np.log(u1)) * np.cos(2.0 * np.pi * u2)
+
+
+@lru_cache(maxsize=None)
+def _box_muller_table() -> np.ndarray:
+    """_box_muller of every residue, evaluated once
+
+    Tabulating all million residues (8 MB, about 40 ms to build) turns the
+    per-metric log/sqrt/cos into a lookup. Batch scoring builds it on first
+    use and servers at start-up; one-off single calls evaluate their nine
+    draws directly instead of paying for it.
+    """
+    table = _box_muller(np.arange(1000000, dtype=np.int64))
+    table.flags.writeable = False
+    return table
+
+
+@lru_cache(maxsize=None)
+def _box_muller_lookup() -> memoryview:
+    """The same table as a memoryview, whose items index straight to Python floats"""
+    return memoryview(_box_muller_table())
+
+
+@lru_cache(maxsize=4096)
+def _metric_specs(industry: str) -> Tuple[Tuple[float, float, float, float, bool], ...]:
+    """(mean, std, lower, upper, log_normal) per metric with the industry factor already applied"""
+    return tuple(
+        (mean * factor, std, lower, upper, i == LOG_NORMAL_METRIC)
+        for i, (mean, std, lower, upper, factor) in enumerate(zip(
+            METRIC_MEANS.tolist(), METRIC_STDS.tolist(), METRIC_LOWER.tolist(), METRIC_UPPER.tolist(),
+            _metric_factors(industry)
+        ))
+    )
+
+
+def _derive_metrics_one(hash_int: int, industry: str) -> List[float]:
+    """Raw metrics for one input hash, in METRIC_NAMES order"""
+    if _box_muller_table.cache_info().currsize:
+        table = _box_muller_lookup()
+        draws = [table[hash_int * multiplier % 1000000] for multiplier in METRIC_HASH_MULTIPLIERS_LIST]
+    else:
+        draws = _box_muller(hash_int * METRIC_HASH_MULTIPLIERS % 1000000).tolist()
+    values = []
+    for z0, (mean, std, lower, upper, log_normal) in zip(draws, _metric_specs(industry)):
+        value = mean + z0 * std
+        if log_normal:
+            value = float(np.exp(value))
+        # Same result as min(upper, max(lower, value)) without the builtin call overhead
+        if not value > lower:
+            value = lower
+        elif not value < upper:
+            value = upper
+        values.append(value)
+    return values
+
+
+def _derive_metrics(hash_ints: np.ndarray, factors: np.ndarray) -> np.ndarray:
+    """Raw metrics for each input hash, one row per input in METRIC_NAMES order"""
+    z0 = _box_muller_table()[(hash_ints[:, None] * METRIC_HASH_MULTIPLIERS) % 1000000]
+    values = METRIC_MEANS * factors + z0 * METRIC_STDS
+    values[:, LOG_NORMAL_METRIC] = np.exp(values[:, LOG_NORMAL_METRIC])
+    return np.minimum(np.maximum(values, METRIC_LOWER), METRIC_UPPER)
+
+
+def _as_records(startups) -> List[Dict[str, Any]]:
+    """Turn a list of dicts or a DataFrame into a list of dicts, dropping missing cells"""
+    if hasattr(startups, 'to_dict'):
+        return [
+            {key: value for key, value in row.items() if not (isinstance(value, float) and value != value)}
+            for row in startups.to_dict('records')
+        ]
+    return list(startups)
+
+
+def forest_parity(forest: FlatForest, model, X_raw: np.ndarray, X_scaled: np.ndarray,
+                  tolerance: float = 1e-9) -> Dict[str, Any]:
+    """Compare the exported forest on raw features with sklearn's predict on scaled ones"""
+    diff = np.abs(forest.predict(X_raw) - model.predict(X_scaled))
+    return {
+        'rows': len(diff),
+        'max_abs_diff': float(diff.max()) if len(diff) else 0.0,
+        'rows_above_tolerance': int((diff > tolerance).sum()),
+    }
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _manifest_version(manifest: Dict[str, Any]) -> str:
+    """Hash the manifest contents (which include the array checksums) into a model version
+
+    Creation time and training timings are left out so retraining the same
+    model yields the same version.
+    """
+    content = {k: v for k, v in manifest.items() if k not in ('model_version', 'created_at', 'training_report')}
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+
+class TrainingReport:
+    """Wall time and peak RSS of each training stage"""
+
     def __init__(self):
-        self.scaler = StandardScaler()
-        self.model = RandomForestRegressor(n_estimators=100, random_state=42)
-        self.label_encoders = {}
+        self.stages: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        yield
+        wall_seconds = time.perf_counter() - start
+        peak_rss_mb = _peak_rss_mb()
+        self.stages.append({'stage': name, 'wall_seconds': round(wall_seconds, 3), 'peak_rss_mb': peak_rss_mb})
+        print(f"Training stage {name}: {wall_seconds:.2f}s, peak RSS {peak_rss_mb} MB", file=sys.stderr)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """High-water resident set size of this process so far"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+class _StageTimer:
+    __slots__ = ('instrumentation', 'key', 'start')
+
+    def __init__(self, instrumentation: 'Instrumentation', key: Tuple[str, str]):
+        self.instrumentation = instrumentation
+        self.key = key
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.instrumentation._record(self.key, time.perf_counter() - self.start)
+
+
+class _NullStage:
+    """Shared do-nothing context used while instrumentation is disabled"""
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Instrumentation:
+    """Opt-in per-stage timers and counters for the scoring hot path
+
+    While disabled, stage() hands back a shared no-op context and count()
+    returns immediately, so it can stay wired in under production load.
+    Enable with SWOT_INSTRUMENTATION=1 or ``serve --instrument``.
+    """
+    COUNTERS = ('calls', 'batch_calls', 'batch_rows', 'errors', 'prediction_fallbacks')
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        # (path, stage) -> [calls, total seconds, max seconds]
+        self.stages: Dict[Tuple[str, str], List[float]] = {}
+
+    @classmethod
+    def from_env(cls) -> 'Instrumentation':
+        return cls(os.environ.get('SWOT_INSTRUMENTATION', '').lower() in ('1', 'true', 'yes'))
+
+    def stage(self, name: str, path: str = 'single'):
+        if not self.enabled:
+            return _NULL_STAGE
+        return _StageTimer(self, (path, name))
+
+    def count(self, name: str, amount: int = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] += amount
+
+    def _record(self, key: Tuple[str, str], seconds: float):
+        with self._lock:
+            entry = self.stages.get(key)
+            if entry is None:
+                self.stages[key] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] = max(entry[2], seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-friendly view of the counters and stage timings"""
+        with self._lock:
+            stages: Dict[str, Dict[str, Any]] = {}
+            for (path, name), (calls, total, longest) in sorted(self.stages.items()):
+                stages.setdefault(path, {})[name] = {
+                    'calls': calls,
+                    'total_seconds': round(total, 6),
+                    'mean_ms': round(total / calls * 1000, 4),
+                    'max_ms': round(longest * 1000, 4),
+                }
+            return {'enabled': self.enabled, 'counters': dict(self.counters), 'stages': stages}
+
+    def prometheus(self, cache_stats: Optional[Dict[str, Any]] = None) -> str:
+        """Prometheus text exposition of the same data"""
+        with self._lock:
+            lines = []
+            for name in self.COUNTERS:
+                lines += [f"# TYPE swot_{name}_total counter", f"swot_{name}_total {self.counters[name]}"]
+            lines += [
+                '# HELP swot_stage_seconds_total Time spent in each scoring stage',
+                '# TYPE swot_stage_seconds_total counter',
+            ]
+            lines += [f'swot_stage_seconds_total{{path="{path}",stage="{name}"}} {total:.6f}'
+                      for (path, name), (_, total, _) in sorted(self.stages.items())]
+            lines += ['# TYPE swot_stage_calls_total counter']
+            lines += [f'swot_stage_calls_total{{path="{path}",stage="{name}"}} {calls}'
+                      for (path, name), (calls, _, _) in sorted(self.stages.items())]
+        for name, value in (cache_stats or {}).items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                lines += [f"# TYPE swot_cache_{name} gauge", f"swot_cache_{name} {value}"]
+        return '\n'.join(lines) + '\n'
+
+
+class SamplingProfiler:
+    """Low-overhead profiler that samples every thread's stack on an interval
+
+    Unlike cProfile it sees the server's worker threads and costs nothing
+    while stopped. Results are collapsed stacks ("outer;inner count"), the
+    input format of flamegraph tools.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        # The caller normally just waits for stop(); its own stack is noise
+        self._ignored = {threading.get_ident()}
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='swot-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> str:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        ordered = sorted(self.samples.items(), key=lambda item: -item[1])
+        return ''.join(f"{stack} {count}\n" for stack, count in ordered)
+
+    def _run(self):
+        self._ignored.add(threading.get_ident())
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id in self._ignored:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(f"{frame.f_code.co_name} ({os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                key = ';'.join(reversed(stack))
+                self.samples[key] = self.samples.get(key, 0) + 1
+
+
+# Every SWOT point and recommendation the engine can produce, as (name, template).
+# Compact results refer to phrases by position, so only ever append to this table.
+PHRASES = (
+    ('high_growth_market', 'Operating in a high-growth {industry} market'),
+    ('technical_differentiation', 'Strong technical differentiation and barriers to entry'),
+    ('abundant_funding', 'Access to abundant funding opportunities'),
+    ('high_revenue_potential', 'High revenue generation potential'),
+    ('innovative_approach', 'Innovative approach to solving market problems'),
+    ('agile_development', 'Agile development and quick adaptation capabilities'),
+    ('extended_time_to_market', 'Extended time-to-market may delay competitive advantage'),
+    ('high_acquisition_cost', 'High customer acquisition costs may impact profitability'),
+    ('complex_regulation', 'Complex regulatory environment requires significant compliance investment'),
+    ('limited_brand_recognition', 'Limited brand recognition in competitive market'),
+    ('resource_constraints', 'Resource constraints typical of early-stage ventures'),
+    ('large_addressable_market', 'Large addressable market in {industry} sector'),
+    ('growing_demand', 'Market expansion driven by increasing demand'),
+    ('favorable_investment_climate', 'Favorable investment climate for scaling operations'),
+    ('strategic_partnerships', 'Potential for strategic partnerships and collaborations'),
+    ('emerging_trends', 'Emerging technology trends creating new market segments'),
+    ('intense_competition', 'Intense competition from established players'),
+    ('regulatory_changes', 'Regulatory changes could impact business model'),
+    ('rising_acquisition_costs', 'Rising customer acquisition costs in competitive market'),
+    ('economic_uncertainty', 'Economic uncertainty affecting investment and spending'),
+    ('rapid_technological_change', 'Rapid technological changes requiring continuous innovation'),
+    ('build_ip_portfolio', 'Leverage technical advantages to build strong IP portfolio'),
+    ('optimize_acquisition', 'Focus on optimizing customer acquisition channels and reducing CAC'),
+    ('accelerate_market_entry', 'Accelerate market entry to capture growth opportunities'),
+    ('differentiate', 'Develop unique value proposition to differentiate from competitors'),
+    ('track_kpis', 'Establish key performance indicators to track progress'),
+    ('build_partnerships', 'Build strategic partnerships to accelerate growth'),
+    ('lean_operations', 'Maintain lean operations while scaling capabilities'),
+)
+PHRASE_IDS = {name: i for i, (name, _) in enumerate(PHRASES)}
+PHRASE_TEMPLATES = tuple(template for _, template in PHRASES)
+SWOT_SECTIONS = ('strengths', 'weaknesses', 'opportunities', 'threats')
+
+# Threshold rules behind the SWOT points and recommendations, as (section, phrase,
+# normalized metric, '>' or '<', threshold) plus optionally a tuple of industry keys
+# the rule is limited to (matched by substring, like INDUSTRY_FACTORS). Within a
+# section the points keep the order of this table.
+RULES = (
+    ('strengths', 'high_growth_market', 'market_growth_rate', '>', 70),
+    ('strengths', 'technical_differentiation', 'tech_complexity', '>', 60),
+    ('strengths', 'abundant_funding', 'funding_availability', '>', 70),
+    ('strengths', 'high_revenue_potential', 'revenue_potential', '>', 75),
+    ('weaknesses', 'extended_time_to_market', 'time_to_market_months', '<', 40),
+    ('weaknesses', 'high_acquisition_cost', 'customer_acquisition_cost', '<', 50),
+    ('weaknesses', 'complex_regulation', 'regulatory_difficulty', '<', 30),
+    ('opportunities', 'large_addressable_market', 'market_size_billions', '>', 60),
+    ('opportunities', 'growing_demand', 'market_growth_rate', '>', 60),
+    ('opportunities', 'favorable_investment_climate', 'funding_availability', '>', 60),
+    ('threats', 'intense_competition', 'competition_level', '<', 40),
+    ('threats', 'regulatory_changes', 'regulatory_difficulty', '<', 40),
+    ('threats', 'rising_acquisition_costs', 'customer_acquisition_cost', '<', 40),
+    ('recommendations', 'build_ip_portfolio', 'tech_complexity', '>', 60),
+    ('recommendations', 'optimize_acquisition', 'customer_acquisition_cost', '<', 50),
+    ('recommendations', 'accelerate_market_entry', 'market_growth_rate', '>', 60),
+    ('recommendations', 'differentiate', 'competition_level', '<', 40),
+)
+# Per section: (name, fewest points before its fillers are added, most points kept, fillers),
+# in SWOT_SECTIONS order followed by the recommendations. The general recommendations
+# are always added; from five matches on they are cut anyway.
+RULE_SECTIONS = (
+    ('strengths', 2, 4, ('innovative_approach', 'agile_development')),
+    ('weaknesses', 2, 4, ('limited_brand_recognition', 'resource_constraints')),
+    ('opportunities', 2, 4, ('strategic_partnerships', 'emerging_trends')),
+    ('threats', 2, 4, ('economic_uncertainty', 'rapid_technological_change')),
+    ('recommendations', 5, 5, ('track_kpis', 'build_partnerships', 'lean_operations')),
+)
+
+
+class RuleTable:
+    """RULES and RULE_SECTIONS compiled into arrays
+
+    A rule fires when sign * metric > sign * threshold, with sign -1 for '<',
+    so a batch of metric rows is checked against every rule in one
+    comparison. Each section then takes its fired rules in order, adds its
+    fillers when fewer than the minimum fired and keeps the first max_items;
+    select() does that with masks and cumulative sums over the whole batch.
+    """
+
+    def __init__(self, rules=RULES, sections=RULE_SECTIONS):
+        section_names = [name for name, _, _, _ in sections]
+        for rule in rules:
+            if rule[0] not in section_names:
+                raise ValueError(f"Rule {rule[1]!r}: unknown section {rule[0]!r}")
+            if rule[3] not in ('>', '<'):
+                raise ValueError(f"Rule {rule[1]!r}: comparison must be '>' or '<', not {rule[3]!r}")
+        self.metric = np.array([METRIC_NAMES.index(rule[2]) for rule in rules], dtype=np.intp)
+        self.sign = np.array([1.0 if rule[3] == '>' else -1.0 for rule in rules])
+        self.signed_threshold = self.sign * np.array([rule[4] for rule in rules], dtype=np.float64)
+        self.industries = [tuple(rule[5]) if len(rule) > 5 else None for rule in rules]
+        self.industry_keys = sorted({key for keys in self.industries if keys is not None for key in keys})
+        self.industry_specific = bool(self.industry_keys)
+        # Keyed on the industry keys a name contains, not the caller's free-text
+        # name, so it holds at most one entry per combination of keys
+        self._applicable: Dict[Tuple[str, ...], Tuple[np.ndarray, List[Any]]] = {}
+
+        # Per section: its columns of the rule mask, then the phrase IDs of those rules followed by the fillers
+        self.layout = []
+        for name, min_items, max_items, fillers in sections:
+            columns = np.array([j for j, rule in enumerate(rules) if rule[0] == name], dtype=np.intp)
+            phrase_ids = np.array([PHRASE_IDS[rules[j][1]] for j in columns] + [PHRASE_IDS[f] for f in fillers],
+                                  dtype=np.intp)
+            self.layout.append((columns, len(fillers), min_items, max_items, phrase_ids))
+
+    def applicable(self, industry: str) -> Tuple[np.ndarray, List[Any]]:
+        """Rules that apply to a lower-cased industry name
+
+        Returned as a mask over all rules, and per section as plain Python
+        values for select_one.
+        """
+        matched = tuple(key for key in self.industry_keys if key in industry)
+        entry = self._applicable.get(matched)
+        if entry is None:
+            mask = np.array([keys is None or any(key in matched for key in keys) for keys in self.industries],
+                            dtype=bool)
+            plain = [
+                ([(METRIC_NAMES[self.metric[j]], float(self.sign[j]), float(self.signed_threshold[j]),
+                   int(phrase_ids[k])) for k, j in enumerate(columns) if mask[j]],
+                 phrase_ids[len(columns):].tolist(), min_items, max_items)
+                for columns, _, min_items, max_items, phrase_ids in self.layout
+            ]
+            entry = self._applicable[matched] = (mask, plain)
+        return entry
+
+    def select_one(self, metrics: Dict[str, float], industry: str) -> List[List[int]]:
+        """Phrase IDs per section for one startup's normalized metrics"""
+        selected = []
+        for rules, fillers, min_items, max_items in self.applicable(industry)[1]:
+            ids = [phrase_id for metric, sign, threshold, phrase_id in rules if metrics[metric] * sign > threshold]
+            if len(ids) < min_items:
+                ids.extend(fillers)
+            selected.append(ids[:max_items])
+        return selected
+
+    def select(self, metrics: np.ndarray, industries: List[str]) -> List[List[List[int]]]:
+        """Phrase IDs per section, then per row, for normalized metric rows in METRIC_NAMES order"""
+        fired = metrics[:, self.metric] * self.sign > self.signed_threshold
+        if self.industry_specific:
+            codes: Dict[str, int] = {}
+            rows = np.array([codes.setdefault(industry, len(codes)) for industry in industries], dtype=np.intp)
+            fired &= np.array([self.applicable(industry)[0] for industry in codes])[rows]
+
+        selected = []
+        for columns, n_fillers, min_items, max_items, phrase_ids in self.layout:
+            matched = fired[:, columns]
+            padded = np.repeat((matched.sum(axis=1) < min_items)[:, None], n_fillers, axis=1)
+            candidates = np.concatenate([matched, padded], axis=1)
+            keep = candidates & (np.cumsum(candidates, axis=1) <= max_items)
+            # Kept IDs of all rows back to back (row-major), then cut into one list per row
+            ids = phrase_ids[np.nonzero(keep)[1]].tolist()
+            ends = np.cumsum(keep.sum(axis=1)).tolist()
+            selected.append([ids[start:end] for start, end in zip([0] + ends[:-1], ends)])
+        return selected
+
+
+@lru_cache(maxsize=1)
+def _compiled_rules() -> RuleTable:
+    return RuleTable()
+
+
+# Compact result layout, bumped whenever the meaning of its fields changes:
+#   v  format version
+#   s  [overall, success_probability, strengths, weaknesses, opportunities, threats]
+#   m  normalized metrics in METRIC_NAMES order
+#   p  phrase IDs per SWOT section, in SWOT_SECTIONS order
+#   r  recommendation phrase IDs
+#   i  industry, the one template parameter
+#   x  explanation as [base_value, feature indices, contributions, method] (only when requested)
+COMPACT_FORMAT_VERSION = 2
+_PACKED_HEADER = struct.Struct('<BB6f9f')
+
+
+@lru_cache(maxsize=1024)
+def _phrase_texts(industry: str) -> Tuple[str, ...]:
+    """Every phrase rendered for one industry, so rendering a result is a lookup per ID"""
+    return tuple(template.format(industry=industry) for template in PHRASE_TEMPLATES)
+
+
+def render_compact(compact: Dict[str, Any]) -> Dict[str, Any]:
+    """Expand a compact result into the verbose shape of calculate_swot_scores"""
+    overall, success, strengths, weaknesses, opportunities, threats = compact['s']
+    texts = _phrase_texts(compact['i'])
+    strength_ids, weakness_ids, opportunity_ids, threat_ids = compact['p']
+    result = {
+        'overall_score': overall,
+        'success_probability': success,
+        'component_scores': {
+            'strengths': strengths,
+            'weaknesses': weaknesses,
+            'opportunities': opportunities,
+            'threats': threats
+        },
+        'swot_analysis': {
+            'strengths': [texts[i] for i in strength_ids],
+            'weaknesses': [texts[i] for i in weakness_ids],
+            'opportunities': [texts[i] for i in opportunity_ids],
+            'threats': [texts[i] for i in threat_ids]
+        },
+        'metrics': dict(zip(METRIC_NAMES, compact['m'])),
+        'recommendations': [texts[i] for i in compact['r']]
+    }
+    if 'x' in compact:
+        explanation = compact['x']
+        result['explanation'] = explanation and {
+            'method': explanation[3],
+            'base_value': explanation[0],
+            'contributions': dict(zip([EXPLANATION_FEATURES[j] for j in explanation[1]], explanation[2])),
+        }
+    return result
+
+
+def pack_compact(compact: Dict[str, Any]) -> bytes:
+    """Binary encoding of a compact result
+
+    Scores, metrics and contributions are packed as float32 and phrase IDs as
+    uint16. Scores and contributions carry few decimals and come back exactly;
+    metrics keep float32 precision (about seven significant digits). The
+    industry is free text from the request, so its length is a uint32.
+    """
+    explanation = compact.get('x')
+    flags = ('x' in compact) | (explanation is not None) << 1
+    parts = [_PACKED_HEADER.pack(compact['v'], flags, *compact['s'], *compact['m'])]
+    for ids in (*compact['p'], compact['r']):
+        parts.append(struct.pack(f'<B{len(ids)}H', len(ids), *ids))
+    # JSON keeps a missing or non-string industry distinct from its text
+    industry = json.dumps(compact['i']).encode()
+    parts.append(struct.pack('<I', len(industry)) + industry)
+    if explanation is not None:
+        base, features, contributions, method = explanation
+        parts.append(struct.pack(f'<fBB{len(features)}B{len(features)}f', base,
+                                 EXPLANATION_METHODS.index(method), len(features), *features, *contributions))
+    return b''.join(parts)
+
+
+def unpack_compact(data: bytes) -> Dict[str, Any]:
+    """Inverse of pack_compact"""
+    version, flags, *numbers = _PACKED_HEADER.unpack_from(data)
+    if version != COMPACT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported compact result version {version}")
+    offset = _PACKED_HEADER.size
+    lists = []
+    for _ in range(len(SWOT_SECTIONS) + 1):
+        count = data[offset]
+        lists.append(list(struct.unpack_from(f'<{count}H', data, offset + 1)))
+        offset += 1 + 2 * count
+    (length,) = struct.unpack_from('<I', data, offset)
+    offset += 4
+    compact = {
+        'v': version,
+        's': [round(score, 1) for score in numbers[:6]],
+        'm': numbers[6:],
+        'p': lists[:-1],
+        'r': lists[-1],
+        'i': json.loads(data[offset:offset + length]),
+    }
+    offset += length
+    if flags & 1:
+        compact['x'] = None
+    if flags & 2:
+        base, method, count = struct.unpack_from('<fBB', data, offset)
+        offset += 6
+        features = list(data[offset:offset + count])
+        contributions = struct.unpack_from(f'<{count}f', data, offset + count)
+        compact['x'] = [round(base, 2), features, [round(value, 3) for value in contributions],
+                        EXPLANATION_METHODS[method]]
+    return compact
+
+
+def cache_key(startup_data: Dict[str, Any], model_version: Optional[str], explain: Union[bool, str] = False) -> str:
+    """Content address of a scoring request
+
+    Audience and description only enter the scores lower-cased, while industry
+    and location are also used verbatim (encoders, report text), so those two
+    are kept as given; a missing field is distinct from any explicit value.
+    Results with an explanation are cached under a key per explanation
+    method, and since entries hold compact results the compact format
+    version is part of it.
+    """
+    audience = startup_data.get('audience', '')
+    description = startup_data.get('description', '')
+    canonical = [
+        model_version,
+        COMPACT_FORMAT_VERSION,
+        startup_data.get('industry'),
+        startup_data.get('location'),
+        audience.lower() if isinstance(audience, str) else audience,
+        description.lower() if isinstance(description, str) else description,
+    ]
+    method = _explanation_method(explain)
+    if method:
+        canonical.append(f"explain:{method}")
+    return hashlib.sha256(json.dumps(canonical).encode()).hexdigest()
+
+
+def _explanation_method(explain: Union[bool, str]) -> Optional[str]:
+    """None for no explanation, otherwise the method; True means DEFAULT_EXPLANATION_METHOD"""
+    if not explain:
+        return None
+    if explain is True:
+        return DEFAULT_EXPLANATION_METHOD
+    if explain not in EXPLANATION_METHODS:
+        raise ValueError(f"Unknown explanation method {explain!r}; use one of {', '.join(EXPLANATION_METHODS)}")
+    return explain
+
+
+def _explain_param(query: Dict[str, List[str]]) -> Union[bool, str]:
+    """?explain=1 asks for the default explanation, ?explain=tree_shap names the method"""
+    value = query.get('explain', ['0'])[0].lower()
+    if value in ('1', 'true', 'yes'):
+        return True
+    if value in ('', '0', 'false', 'no'):
+        return False
+    return value
+
+
+class ResultCache:
+    """Scoring result cache: in-process LRU with TTL plus an optional SQLite tier
+
+    The SQLite file can be shared by every worker on the host. Entries are
+    stored as JSON so callers always get a private copy, and each entry
+    records the model version it was computed with so results from an older
+    artifact are dropped when the bound model changes.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 24 * 60 * 60,
+                 disk_path: Optional[str] = None, max_disk_entries: int = 1000000):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_entries = max_disk_entries
+        self.model_version: Optional[str] = None
+        self._entries: 'OrderedDict[str, Tuple[float, str]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_writes_since_trim = 0
+        self.counters = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0}
+
+        self._db = None
+        if disk_path:
+            import sqlite3
+
+            os.makedirs(os.path.dirname(os.path.abspath(disk_path)), exist_ok=True)
+            self._db = sqlite3.connect(disk_path, timeout=5, check_same_thread=False, isolation_level=None)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                'key TEXT PRIMARY KEY, model_version TEXT NOT NULL, expires_at REAL NOT NULL, payload TEXT NOT NULL)'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS results_expires_at ON results (expires_at)')
+
+    @classmethod
+    def from_env(cls) -> Optional['ResultCache']:
+        """Build the cache configured by SWOT_CACHE_SIZE, SWOT_CACHE_TTL and SWOT_CACHE_PATH"""
+        max_entries = int(os.environ.get('SWOT_CACHE_SIZE', 10000))
+        disk_path = os.environ.get('SWOT_CACHE_PATH') or None
+        if max_entries <= 0 and not disk_path:
+            return None
+        return cls(max_entries, float(os.environ.get('SWOT_CACHE_TTL', 24 * 60 * 60)), disk_path)
+
+    def bind_model(self, model_version: Optional[str]):
+        """Invalidate every entry computed with a different model version"""
+        with self._lock:
+            if model_version == self.model_version:
+                return
+            self.model_version = model_version
+            self.counters['invalidations'] += len(self._entries)
+            self._entries.clear()
+            if self._db is not None:
+                cursor = self._db.execute('DELETE FROM results WHERE model_version != ?', (model_version or '',))
+                self.counters['invalidations'] += cursor.rowcount
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, payload = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.counters['hits'] += 1
+                    return json.loads(payload)
+                del self._entries[key]
+                self.counters['expirations'] += 1
+
+            if self._db is not None:
+                row = self._db.execute(
+                    'SELECT expires_at, payload FROM results WHERE key = ? AND model_version = ?',
+                    (key, self.model_version or '')
+                ).fetchone()
+                if row is not None and row[0] > now:
+                    self._store_memory(key, row[0], row[1])
+                    self.counters['disk_hits'] += 1
+                    return json.loads(row[1])
+
+            self.counters['misses'] += 1
+            return None
+
+    def put(self, key: str, result: Dict[str, Any]):
+        expires_at = time.time() + self.ttl_seconds
+        payload = json.dumps(result, separators=(',', ':'))
+        with self._lock:
+            self._store_memory(key, expires_at, payload)
+            if self._db is not None:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO results (key, model_version, expires_at, payload) VALUES (?, ?, ?, ?)',
+                    (key, self.model_version or '', expires_at, payload)
+                )
+                self._disk_writes_since_trim += 1
+                if self._disk_writes_since_trim >= 1000:
+                    self._trim_disk()
+
+    def _store_memory(self, key: str, expires_at: float, payload: str):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (expires_at, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.counters['evictions'] += 1
+
+    def _trim_disk(self):
+        """Drop expired rows, then the soonest-expiring rows beyond max_disk_entries"""
+        self._disk_writes_since_trim = 0
+        self.counters['expirations'] += self._db.execute(
+            'DELETE FROM results WHERE expires_at <= ?', (time.time(),)
+        ).rowcount
+        self.counters['evictions'] += self._db.execute(
+            'DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY expires_at DESC LIMIT -1 OFFSET ?)',
+            (self.max_disk_entries,)
+        ).rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.counters['hits'] + self.counters['disk_hits'] + self.counters['misses']
+            stats = dict(self.counters)
+            stats.update({
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hit_rate': round((stats['hits'] + stats['disk_hits']) / lookups, 4) if lookups else 0.0,
+                'model_version': self.model_version,
+                'disk_tier': self._db is not None,
+            })
+            return stats
+
+
+class SWOTScoringEngine:
+    def __init__(self, model_path: Optional[str] = None, train: bool = False, use_cache: bool = True,
+                 training_options: Optional[Dict[str, Any]] = None,
+                 instrumentation: Optional[Instrumentation] = None):
         self.is_trained = False
-        
-        # Load or create mock training data
-        self.training_data = self._create_mock_training_data()
-        self._train_model()
+        self.artifact: Optional[ModelArtifact] = None
+        # Fitted sklearn objects, only kept when the model was trained in this process
+        self.model = None
+        self.scaler = None
+        self.cache: Optional[ResultCache] = ResultCache.from_env() if use_cache else None
+        self.instrumentation = instrumentation or Instrumentation.from_env()
+
+        # Prefer the pre-trained artifact; fall back to training on mock data
+        model_path = model_path or DEFAULT_MODEL_PATH
+        if not train and os.path.exists(os.path.join(model_path, MANIFEST_NAME)):
+            try:
+                self.artifact = ModelArtifact.load(model_path)
+                self.is_trained = True
+                print(f"Loaded model artifact {self.artifact.model_version[:12]} from {model_path}", file=sys.stderr)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Could not load model artifact ({e}), training from scratch", file=sys.stderr)
+
+        if self.artifact is None:
+            self._train_model(**(training_options or {}))
+
+        if self.cache is not None:
+            self.cache.bind_model(self.model_version)
+
+    @property
+    def model_version(self) -> Optional[str]:
+        return self.artifact.model_version if self.artifact else None
     
-    def _create_mock_training_data(self) -> pd.DataFrame:
-        """Create mock training data based on typical startup metrics"""
-        np.random.seed(42)  # For reproducible results
-        
-        # Generate synthetic startup data
-        n_samples = 1000
-        
-        industries = ['FinTech', 'HealthTech', 'EdTech', 'E-commerce', 'SaaS', 'AI/ML', 'IoT', 'Blockchain']
-        locations = ['US', 'Europe', 'Asia', 'Global']
-        team_sizes = ['1-5', '6-15', '16-50', '50+']
-        
-        data = {
-            'industry': np.random.choice(industries, n_samples),
-            'location': np.random.choice(locations, n_samples),
-            'team_size': np.random.choice(team_sizes, n_samples),
-            'market_growth_rate': np.random.normal(15, 8, n_samples),  # % growth
-            'competition_level': np.random.uniform(1, 10, n_samples),  # 1-10 scale
-            'regulatory_difficulty': np.random.uniform(1, 10, n_samples),  # 1-10 scale
-            'funding_availability': np.random.uniform(1, 10, n_samples),  # 1-10 scale
-            'tech_complexity': np.random.uniform(1, 10, n_samples),  # 1-10 scale
-            'market_size_billions': np.random.lognormal(2, 1, n_samples),  # Market size in billions
-            'time_to_market_months': np.random.uniform(3, 36, n_samples),  # Months
-            'customer_acquisition_cost': np.random.uniform(10, 1000, n_samples),  # USD
-            'revenue_potential': np.random.uniform(100000, 50000000, n_samples),  # USD
+    def _iter_mock_training_chunks(self, n_samples: int, chunk_size: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Generate synthetic startup data chunk by chunk
+
+        Yields (features, raw_success_score) where features is a float64 matrix
+        in FEATURE_COLUMNS order with categoricals already label-encoded.
+        """
+        rng = np.random.RandomState(42)  # For reproducible results
+        # LabelEncoder codes are each label's rank in sorted order
+        codes = {
+            col: np.array([sorted(labels).index(label) for label in labels], dtype=np.float64)
+            for col, labels in MOCK_CATEGORIES.items()
         }
-        
-        df = pd.DataFrame(data)
-        
-        # Create success score based on weighted factors
-        df['success_score'] = (
-            (df['market_growth_rate'] * 0.2) +
-            ((11 - df['competition_level']) * 0.15) +  # Lower competition = higher score
-            ((11 - df['regulatory_difficulty']) * 0.1) +  # Lower difficulty = higher score
-            (df['funding_availability'] * 0.15) +
-            (df['tech_complexity'] * 0.1) +  # Higher complexity can be good for moats
-            (np.log(df['market_size_billions']) * 0.15) +
-            ((37 - df['time_to_market_months']) * 0.05) +  # Faster to market = higher score
-            (np.log(df['revenue_potential']) * 0.1)
-        )
-        
-        # Normalize success score to 0-100
-        df['success_score'] = ((df['success_score'] - df['success_score'].min()) / 
-                              (df['success_score'].max() - df['success_score'].min())) * 100
-        
-        return df
+
+        for start in range(0, n_samples, chunk_size):
+            n = min(chunk_size, n_samples - start)
+            X = np.empty((n, len(FEATURE_COLUMNS)), dtype=np.float64)
+            X[:, 0] = codes['industry'][rng.choice(len(codes['industry']), n)]
+            X[:, 1] = codes['location'][rng.choice(len(codes['location']), n)]
+            X[:, 2] = codes['team_size'][rng.choice(len(codes['team_size']), n)]
+            X[:, 3] = rng.normal(15, 8, n)  # market_growth_rate, % growth
+            X[:, 4] = rng.uniform(1, 10, n)  # competition_level, 1-10 scale
+            X[:, 5] = rng.uniform(1, 10, n)  # regulatory_difficulty, 1-10 scale
+            X[:, 6] = rng.uniform(1, 10, n)  # funding_availability, 1-10 scale
+            X[:, 7] = rng.uniform(1, 10, n)  # tech_complexity, 1-10 scale
+            X[:, 8] = rng.lognormal(2, 1, n)  # market_size_billions
+            X[:, 9] = rng.uniform(3, 36, n)  # time_to_market_months
+            X[:, 10] = rng.uniform(10, 1000, n)  # customer_acquisition_cost, USD
+            X[:, 11] = rng.uniform(100000, 50000000, n)  # revenue_potential, USD
+
+            # Create success score based on weighted factors
+            success_score = (
+                (X[:, 3] * 0.2) +
+                ((11 - X[:, 4]) * 0.15) +  # Lower competition = higher score
+                ((11 - X[:, 5]) * 0.1) +  # Lower difficulty = higher score
+                (X[:, 6] * 0.15) +
+                (X[:, 7] * 0.1) +  # Higher complexity can be good for moats
+                (np.log(X[:, 8]) * 0.15) +
+                ((37 - X[:, 9]) * 0.05) +  # Faster to market = higher score
+                (np.log(X[:, 11]) * 0.1)
+            )
+            yield X, success_score
     
-    def _train_model(self):
-        """Train the ML model on startup success data"""
-        df = self.training_data.copy()
-        
-        # Encode categorical variables
-        categorical_cols = ['industry', 'location', 'team_size']
-        for col in categorical_cols:
-            le = LabelEncoder()
-            df[col + '_encoded'] = le.fit_transform(df[col])
-            self.label_encoders[col] = le
-        
-        # Select features for training
-        feature_cols = [
-            'industry_encoded', 'location_encoded', 'team_size_encoded',
-            'market_growth_rate', 'competition_level', 'regulatory_difficulty',
-            'funding_availability', 'tech_complexity', 'market_size_billions',
-            'time_to_market_months', 'customer_acquisition_cost', 'revenue_potential'
-        ]
-        
-        X = df[feature_cols]
-        y = df['success_score']
-        
-        # Split and train
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-        
-        # Scale features
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_test_scaled = self.scaler.transform(X_test)
-        
-        # Train model
-        self.model.fit(X_train_scaled, y_train)
-        
-        # Evaluate model
-        y_pred = self.model.predict(X_test_scaled)
-        r2 = r2_score(y_test, y_pred)
-        mse = mean_squared_error(y_test, y_pred)
-        
+    def _train_model(self, n_samples: int = 1000, chunk_size: int = DEFAULT_TRAINING_CHUNK_SIZE,
+                     n_estimators: int = 100, n_jobs: int = -1, similarity_lists: Optional[int] = None,
+                     similarity_rows: int = DEFAULT_SIMILARITY_MAX_ROWS):
+        """Train the ML model on startup success data
+
+        Data is streamed in chunks so memory stays bounded by chunk_size and
+        similarity_rows. Each chunk grows its share of the forest (warm start)
+        on all cores; with a single chunk this is exactly the original one-shot
+        fit. The similarity index is built from a uniform sample of at most
+        similarity_rows scaled training rows (all of them in smaller training
+        sets); similarity_lists overrides its list count.
+        """
+        from sklearn.ensemble import RandomForestRegressor
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.model_selection import train_test_split
+
+        n_chunks = -(-n_samples // chunk_size)
+        if n_chunks > n_estimators:
+            raise ValueError(f"{n_chunks} chunks cannot share {n_estimators} trees; increase chunk_size")
+        report = TrainingReport()
+
+        def chunks():
+            for X, raw_score in self._iter_mock_training_chunks(n_samples, chunk_size):
+                train_idx, test_idx = train_test_split(np.arange(len(X)), test_size=0.2, random_state=42)
+                yield X, raw_score, train_idx, test_idx
+
+        # Pass 1: scaler statistics on the training rows and the success score range
+        with report.stage('scan'):
+            scaler = StandardScaler()
+            score_min, score_max = np.inf, -np.inf
+            for X, raw_score, train_idx, _ in chunks():
+                # Column-major like a DataFrame's values, so the statistics sum in the same order
+                scaler.partial_fit(np.asfortranarray(X[train_idx]))
+                score_min = min(score_min, raw_score.min())
+                score_max = max(score_max, raw_score.max())
+
+        def normalize_score(raw_score):
+            # Normalize success score to 0-100
+            return ((raw_score - score_min) / (score_max - score_min)) * 100
+
+        # Pass 2: grow the forest, each chunk fitting its share of the trees on compact float32 rows
+        with report.stage('fit'):
+            model = RandomForestRegressor(n_estimators=0, random_state=42, warm_start=True, n_jobs=n_jobs)
+            reference = _ReferenceSample(similarity_rows)
+            for chunk_index, (X, raw_score, train_idx, _) in enumerate(chunks()):
+                model.n_estimators += n_estimators // n_chunks + (chunk_index < n_estimators % n_chunks)
+                X_train = scaler.transform(X[train_idx]).astype(np.float32)
+                y_train = normalize_score(raw_score[train_idx])
+                model.fit(X_train, y_train)
+                reference.add(X_train, y_train.astype(np.float32), train_idx + chunk_index * chunk_size)
+
+        with report.stage('export'):
+            forest = FlatForest.from_sklearn(model, scaler.mean_, scaler.scale_)
+
+        with report.stage('similarity_index'):
+            similarity = SimilarityIndex.build(*reference.arrays(), n_lists=similarity_lists)
+            del reference
+
+        # Pass 3: held-out metrics, and a check that the export reproduces sklearn
+        with report.stage('evaluate'):
+            n_train = n_test = 0
+            sse = sum_y = sum_y2 = 0.0
+            parity = None
+            for X, raw_score, train_idx, test_idx in chunks():
+                y_test = normalize_score(raw_score[test_idx])
+                y_pred = model.predict(scaler.transform(X[test_idx]).astype(np.float32))
+                sse += float(((y_test - y_pred) ** 2).sum())
+                sum_y += float(y_test.sum())
+                sum_y2 += float((y_test ** 2).sum())
+                n_train += len(train_idx)
+                n_test += len(test_idx)
+                if parity is None:
+                    sample = X[:PARITY_SAMPLE_ROWS]
+                    parity = forest_parity(forest, model, sample, scaler.transform(sample))
+
+        mse = sse / n_test
+        r2 = 1 - sse / (sum_y2 - sum_y ** 2 / n_test)
         print(f"Model trained - R² Score: {r2:.3f}, MSE: {mse:.3f}", file=sys.stderr)
+        print(f"Forest export parity - max abs diff: {parity['max_abs_diff']:.2e}, "
+              f"rows above tolerance: {parity['rows_above_tolerance']}", file=sys.stderr)
+        if parity['rows_above_tolerance']:
+            raise ValueError(f"Exported forest disagrees with sklearn on {parity['rows_above_tolerance']} rows")
+
+        self.artifact = ModelArtifact(
+            scaler.mean_, scaler.scale_,
+            {col: sorted(labels) for col, labels in MOCK_CATEGORIES.items()}, forest,
+            {'r2': float(r2), 'mse': float(mse), 'n_train': n_train, 'n_test': n_test,
+             'export_max_abs_diff': parity['max_abs_diff']},
+            training_report={'n_samples': n_samples, 'chunk_size': chunk_size, 'n_chunks': n_chunks,
+                             'n_jobs': n_jobs, 'stages': report.stages},
+            similarity=similarity
+        )
+        self.model = model
+        self.scaler = scaler
         self.is_trained = True
     
-    def calculate_swot_scores(self, startup_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Calculate comprehensive SWOT scores for a startup"""
+    def calculate_swot_scores(self, startup_data: Dict[str, Any], explain: Union[bool, str] = False,
+                              compact: bool = False) -> Dict[str, Any]:
+        """Calculate comprehensive SWOT scores for a startup
+
+        With explain=True the result also carries an 'explanation' of
+        success_probability: its base value, each feature's contribution and
+        the attribution method; explain='tree_shap' asks for exact TreeSHAP
+        instead of the default Saabas (see FlatForest.explain). With
+        compact=True the result is returned in the compact layout (see
+        COMPACT_FORMAT_VERSION) instead of being rendered with render_compact.
+        """
+        self.instrumentation.count('calls')
+        explain = _explanation_method(explain)
+        try:
+            if self.cache is None:
+                result = self._score(startup_data, explain)
+            else:
+                key = cache_key(startup_data, self.model_version, explain)
+                with self.instrumentation.stage('cache_lookup'):
+                    result = self.cache.get(key)
+                if result is None:
+                    result = self._score(startup_data, explain)
+                    self.cache.put(key, result)
+            if compact:
+                return result
+            with self.instrumentation.stage('render'):
+                return render_compact(result)
+        except Exception:
+            self.instrumentation.count('errors')
+            raise
+
+    def _score(self, startup_data: Dict[str, Any], explain: Optional[str] = None) -> Dict[str, Any]:
+        """Score one startup without consulting the cache, returning the compact result"""
+        stage = self.instrumentation.stage
         
         # Extract and normalize metrics
-        metrics = self._extract_metrics(startup_data)
-        normalized_metrics = self._normalize_metrics(metrics)
+        with stage('extract_metrics'):
+            metrics = self._extract_metrics(startup_data)
+        with stage('normalize_metrics'):
+            normalized_metrics = self._normalize_metrics(metrics)
         
         # Calculate individual component scores
-        strengths_score = self._calculate_strengths_score(normalized_metrics)
-        weaknesses_score = self._calculate_weaknesses_score(normalized_metrics)
-        opportunities_score = self._calculate_opportunities_score(normalized_metrics)
-        threats_score = self._calculate_threats_score(normalized_metrics)
+        with stage('component_scores'):
+            strengths_score = self._calculate_strengths_score(normalized_metrics)
+            weaknesses_score = self._calculate_weaknesses_score(normalized_metrics)
+            opportunities_score = self._calculate_opportunities_score(normalized_metrics)
+            threats_score = self._calculate_threats_score(normalized_metrics)
         
         # Predict overall success probability using ML model
-        success_probability = self._predict_success_probability(startup_data)
+        with stage('predict'):
+            success_probability = self._predict_success_probability(startup_data, metrics)
         
-        # Generate detailed SWOT analysis
-        swot_analysis = self._generate_swot_analysis(normalized_metrics, startup_data)
+        # Pick the SWOT points and recommendations that apply
+        with stage('swot_analysis'):
+            *swot_points, recommendations = _compiled_rules().select_one(
+                normalized_metrics, startup_data.get('industry', 'SaaS').lower()
+            )
         
         # Calculate composite scores
         overall_score = (strengths_score * 0.3 + opportunities_score * 0.3 - 
                         weaknesses_score * 0.2 - threats_score * 0.2)
         
-        return {
-            'overall_score': round(max(0, min(100, overall_score)), 1),
-            'success_probability': round(success_probability, 1),
-            'component_scores': {
-                'strengths': round(strengths_score, 1),
-                'weaknesses': round(weaknesses_score, 1),
-                'opportunities': round(opportunities_score, 1),
-                'threats': round(threats_score, 1)
-            },
-            'swot_analysis': swot_analysis,
-            'metrics': normalized_metrics,
-            'recommendations': self._generate_recommendations(normalized_metrics, swot_analysis)
+        result = {
+            'v': COMPACT_FORMAT_VERSION,
+            's': [
+                round(max(0.0, min(100.0, overall_score)), 1),
+                round(success_probability, 1),
+                round(strengths_score, 1),
+                round(weaknesses_score, 1),
+                round(opportunities_score, 1),
+                round(threats_score, 1)
+            ],
+            'm': [normalized_metrics[name] for name in METRIC_NAMES],
+            'p': swot_points,
+            'r': recommendations,
+            'i': startup_data.get('industry', 'Technology')
         }
+        if explain:
+            with stage('explain'):
+                features = np.array([self._prepare_features_for_prediction(startup_data, metrics)])
+                result['x'] = self._explain_features(features, explain)[0]
+        return result
     
-    def _extract_metrics(self, startup_data: Dict[str, Any]) -> Dict[str, float]:
-        """Extract and estimate key metrics from startup data"""
-        industry = startup_data.get('industry', 'SaaS').lower()
-        location = startup_data.get('location', 'US').lower()
-        audience = startup_data.get('audience', '').lower()
+    def calculate_swot_scores_batch(self, startups, explain: Union[bool, str] = False,
+                                    compact: bool = False) -> List[Dict[str, Any]]:
+        """Score many startups at once, returning results in input order
+
+        Accepts a list of dicts or a pandas DataFrame. Metrics, normalization,
+        component scores and success probabilities are computed as array
+        operations with a single forest predict for the whole batch; explain
+        and compact work as in calculate_swot_scores.
+        """
+        explain = _explanation_method(explain)
+        records = _as_records(startups)
+        self.instrumentation.count('batch_calls')
+        self.instrumentation.count('batch_rows', len(records))
+        try:
+            if self.cache is None:
+                results = self._score_batch(records, explain)
+            else:
+                # Look every startup up first and only score the misses
+                with self.instrumentation.stage('cache_lookup', 'batch'):
+                    keys = [cache_key(startup_data, self.model_version, explain) for startup_data in records]
+                    results = [self.cache.get(key) for key in keys]
+                missing = [i for i, result in enumerate(results) if result is None]
+                for i, result in zip(missing, self._score_batch([records[i] for i in missing], explain)):
+                    self.cache.put(keys[i], result)
+                    results[i] = result
+            if compact:
+                return results
+            with self.instrumentation.stage('render', 'batch'):
+                return [render_compact(result) for result in results]
+        except Exception:
+            self.instrumentation.count('errors')
+            raise
+
+    def _score_batch(self, records: List[Dict[str, Any]], explain: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Score a list of startups without consulting the cache, returning compact results"""
+        if not records:
+            return []
+        stage = self.instrumentation.stage
+
+        with stage('extract_metrics', 'batch'):
+            metrics = self._extract_metrics_batch(records)
+        with stage('normalize_metrics', 'batch'):
+            normalized_metrics = self._normalize_metrics_batch(metrics)
+
+        # The component score formulas are plain arithmetic, so they apply to arrays unchanged
+        with stage('component_scores', 'batch'):
+            strengths_scores = self._calculate_strengths_score(normalized_metrics)
+            weaknesses_scores = self._calculate_weaknesses_score(normalized_metrics)
+            opportunities_scores = self._calculate_opportunities_score(normalized_metrics)
+            threats_scores = self._calculate_threats_score(normalized_metrics)
+            overall_scores = np.clip(
+                strengths_scores * 0.3 + opportunities_scores * 0.3 -
+                weaknesses_scores * 0.2 - threats_scores * 0.2,
+                0, 100
+            )
+
+        with stage('predict', 'batch'):
+            success_probabilities = self._predict_success_probability_batch(records, metrics)
+
+        # One list of Python floats per startup; Python's round matches the single-call path
+        scores = np.column_stack([
+            overall_scores, success_probabilities,
+            strengths_scores, weaknesses_scores, opportunities_scores, threats_scores
+        ]).tolist()
+        metrics_matrix = np.column_stack([normalized_metrics[name] for name in METRIC_NAMES])
+        with stage('swot_analysis', 'batch'):
+            *swot_points, recommendations = _compiled_rules().select(
+                metrics_matrix, [startup_data.get('industry', 'SaaS').lower() for startup_data in records]
+            )
+
+        rows_metrics = metrics_matrix.tolist()
+        results = [
+            {
+                'v': COMPACT_FORMAT_VERSION,
+                's': [round(score, 1) for score in scores[i]],
+                'm': rows_metrics[i],
+                'p': [section[i] for section in swot_points],
+                'r': recommendations[i],
+                'i': startup_data.get('industry', 'Technology')
+            }
+            for i, startup_data in enumerate(records)
+        ]
+
+        if explain:
+            with stage('explain', 'batch'):
+                explanations = self._explain_features(self._prepare_features_batch(records, metrics), explain)
+            for result, explanation in zip(results, explanations):
+                result['x'] = explanation
+
+        return results
+
+    def _explain_features(self, features: np.ndarray,
+                          method: str = DEFAULT_EXPLANATION_METHOD) -> List[Optional[List[Any]]]:
+        """Per-feature contributions to success_probability for rows of raw features
+
+        Each explanation is [base_value, feature indices, contributions, method]
+        with contributions sorted by size (render_compact names the features).
+        They add up to the unclipped model output; success_probability is that
+        output clipped to 0-100.
+        """
+        if not self.is_trained:
+            return [None] * len(features)
+        base, contributions = self.artifact.forest.explain(features, method)
+        base = round(base, 2)
+        explanations = []
+        for row in contributions:
+            order = np.argsort(-np.abs(row), kind='stable')
+            explanations.append([base, order.tolist(), [round(value, 3) for value in row[order].tolist()], method])
+        return explanations
+
+    def sweep(self, startup_data: Dict[str, Any], grid: Dict[str, Any],
+              chunk_size: int = DEFAULT_SWEEP_CHUNK_ROWS) -> Iterator[Dict[str, np.ndarray]]:
+        """What-if scores over a grid of raw metric values, streamed in chunks
+
+        grid maps metric names to the values to try, e.g.
+        {'competition_level': np.linspace(1, 10, 10), 'funding_availability': [2, 6, 10]};
+        every other metric keeps the startup's own value. The Cartesian
+        product is walked in C order and each chunk is a dict of equal-length
+        arrays: one column per swept metric, then overall_score,
+        success_probability and the four component scores, unrounded.
+        pandas.DataFrame(chunk) turns a chunk into a frame.
+        """
+        unknown = [name for name in grid if name not in METRIC_NAMES]
+        if unknown:
+            raise ValueError(f"Unknown metrics in sweep grid: {', '.join(unknown)}")
+        names = list(grid)
+        axes = [np.asarray(grid[name], dtype=np.float64).reshape(-1) for name in names]
+        shape = tuple(len(axis) for axis in axes)
+        total = int(np.prod(shape, dtype=np.int64))
+
+        # Hash the input and encode its categoricals once; only the swept columns vary
+        base_metrics = self._extract_metrics(startup_data)
+        base_features = None
+        if self.is_trained:
+            base_features = np.array(self._prepare_features_for_prediction(startup_data, base_metrics))
+
+        for start in range(0, total, chunk_size):
+            # An empty grid is a single point: the startup's own metrics
+            positions = np.unravel_index(np.arange(start, min(start + chunk_size, total)), shape) if shape else ()
+            n_rows = len(positions[0]) if positions else 1
+            metrics = {name: np.full(n_rows, base_metrics[name]) for name in METRIC_NAMES}
+            for name, axis, position in zip(names, axes, positions):
+                metrics[name] = axis[position]
+
+            normalized_metrics = self._normalize_metrics_batch(metrics)
+            strengths = self._calculate_strengths_score(normalized_metrics)
+            weaknesses = self._calculate_weaknesses_score(normalized_metrics)
+            opportunities = self._calculate_opportunities_score(normalized_metrics)
+            threats = self._calculate_threats_score(normalized_metrics)
+
+            if base_features is None:
+                success_probability = np.full(n_rows, 50.0)
+            else:
+                features = np.tile(base_features, (n_rows, 1))
+                for j, name in enumerate(METRIC_NAMES, start=3):
+                    features[:, j] = metrics[name]
+                success_probability = np.clip(self.artifact.forest.predict(features), 0, 100)
+
+            chunk = {name: metrics[name] for name in names}
+            chunk.update({
+                'overall_score': np.clip(strengths * 0.3 + opportunities * 0.3 -
+                                         weaknesses * 0.2 - threats * 0.2, 0, 100),
+                'success_probability': success_probability,
+                'strengths': strengths,
+                'weaknesses': weaknesses,
+                'opportunities': opportunities,
+                'threats': threats,
+            })
+            yield chunk
+
+    def find_similar(self, startup_data: Dict[str, Any], k: int = 5,
+                     n_probe: int = DEFAULT_SIMILARITY_PROBES) -> List[Dict[str, Any]]:
+        """The k reference startups closest to this one in scaled feature space"""
+        return self.find_similar_batch([startup_data], k, n_probe)[0]
+
+    def find_similar_batch(self, startups, k: int = 5,
+                           n_probe: int = DEFAULT_SIMILARITY_PROBES) -> List[List[Dict[str, Any]]]:
+        """find_similar for a list or DataFrame of startups, e.g. to compare a portfolio"""
+        if self.artifact is None or self.artifact.similarity is None:
+            raise ValueError("Model artifact has no similarity index; retrain it with this version")
+        records = _as_records(startups)
+        if not records:
+            return []
+        index = self.artifact.similarity
+        queries = self.artifact.scale(self._prepare_features_batch(records)).astype(np.float32)
+        positions, distances = index.search(queries, k, n_probe)
+
+        results = []
+        for row_positions, row_distances in zip(positions, distances):
+            found = row_positions >= 0
+            raw = self.artifact.unscale(index.vectors[row_positions[found]])
+            neighbours = []
+            for position, distance, features in zip(row_positions[found], row_distances[found], raw):
+                neighbours.append({
+                    'reference_id': int(index.row_ids[position]),
+                    'distance': round(float(distance), 4),
+                    'industry': self.artifact.decode('industry', features[0]),
+                    'location': self.artifact.decode('location', features[1]),
+                    'team_size': self.artifact.decode('team_size', features[2]),
+                    'success_score': round(float(index.scores[position]), 2),
+                    'metrics': {name: round(float(value), 2) for name, value in zip(METRIC_NAMES, features[3:])},
+                })
+            results.append(neighbours)
+        return results
+
+    def _extract_metrics(self, startup_data: Dict[str, Any]) -> Dict[str, float]:
+        """Extract and estimate key metrics from startup data"""
+        industry = startup_data.get('industry', 'SaaS').lower()
+        location = startup_data.get('location', 'US').lower()
+        audience = startup_data.get('audience', '').lower()
         description = startup_data.get('description', '').lower()
         
-        # Create deterministic hash for consistent results
-        combined_input = f"{industry}-{location}-{audience}-{description}"
-        data_hash = hashlib.md5(combined_input.encode()).hexdigest()
-        hash_int = int(data_hash[:8], 16)
-        
-        # Industry-specific adjustments
-        industry_factors = {
-            'fintech': {'growth': 1.2, 'competition': 1.3, 'regulation': 1.8},
-            'healthtech': {'growth': 1.1, 'competition': 1.1, 'regulation': 2.0},
-            'edtech': {'growth': 1.0, 'competition': 1.2, 'regulation': 1.2},
-            'ecommerce': {'growth': 0.9, 'competition': 1.5, 'regulation': 1.0},
-            'saas': {'growth': 1.3, 'competition': 1.4, 'regulation': 1.1},
-            'ai': {'growth': 1.5, 'competition': 1.2, 'regulation': 1.3},
-            'blockchain': {'growth': 1.4, 'competition': 1.1, 'regulation': 1.9}
-        }
-        
-        # Find matching industry factor
-        factor = {'growth': 1.0, 'competition': 1.0, 'regulation': 1.0}
-        for key, values in industry_factors.items():
-            if key in industry:
-                factor = values
-                break
-        
-        # Generate deterministic values using hash-based calculations
-        # Use different parts of hash for different metrics to ensure variation
-        def get_deterministic_value(base_hash: int, multiplier: int, min_val: float, max_val: float) -> float:
-            """Generate deterministic value within range using hash"""
-            hash_part = (base_hash * multiplier) % 1000000
-            normalized = hash_part / 1000000.0  # 0 to 1
-            return min_val + (normalized * (max_val - min_val))
-        
-        def get_normal_like_value(base_hash: int, multiplier: int, mean: float, std: float) -> float:
-            """Generate deterministic normal-like distribution using hash"""
-            # Use Box-Muller-like transformation with hash
-            hash1 = ((base_hash * multiplier) % 1000000) / 1000000.0
-            hash2 = ((base_hash * multiplier * 7) % 1000000) / 1000000.0
-            
-            # Simple approximation of normal distribution
-            u1 = max(0.000001, hash1)  # Avoid log(0)
-            u2 = hash2
-            
-            # Box-Muller transformation
-            z0 = np.sqrt(-2.0 * np.log(u1)) * np.cos(2.0 * np.pi * u2)
-            return mean + (z0 * std)
-        
-        return {
-            'market_growth_rate': max(0, get_normal_like_value(hash_int, 3, 12 * factor['growth'], 5)),
-            'competition_level': min(10, max(1, get_normal_like_value(hash_int, 5, 5 * factor['competition'], 2))),
-            'regulatory_difficulty': min(10, max(1, get_normal_like_value(hash_int, 7, 4 * factor['regulation'], 2))),
-            'funding_availability': min(10, max(1, get_normal_like_value(hash_int, 11, 6, 2))),
-            'tech_complexity': min(10, max(1, get_normal_like_value(hash_int, 13, 5, 2))),
-            'market_size_billions': max(0.1, np.exp(get_normal_like_value(hash_int, 17, 1, 0.5))),
-            'time_to_market_months': max(1, get_normal_like_value(hash_int, 19, 12, 6)),
-            'customer_acquisition_cost': max(10, get_normal_like_value(hash_int, 23, 200, 100)),
-            'revenue_potential': max(50000, get_normal_like_value(hash_int, 29, 5000000, 2000000))
-        }
+        # Deterministic hash-based values, so the same idea always gets the same metrics
+        hash_int = _input_hash(industry, location, audience, description)
+        return dict(zip(METRIC_NAMES, _derive_metrics_one(hash_int, industry)))
     
+    def _extract_metrics_batch(self, records: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Vectorized _extract_metrics: one array per metric, one entry per startup"""
+        hash_ints = np.empty(len(records), dtype=np.int64)
+        factors = np.empty((len(records), len(METRIC_NAMES)), dtype=np.float64)
+        for i, startup_data in enumerate(records):
+            industry = startup_data.get('industry', 'SaaS').lower()
+            hash_ints[i] = _input_hash(
+                industry,
+                startup_data.get('location', 'US').lower(),
+                startup_data.get('audience', '').lower(),
+                startup_data.get('description', '').lower(),
+            )
+            factors[i] = _metric_factors(industry)
+
+        values = _derive_metrics(hash_ints, factors)
+        return {name: values[:, i] for i, name in enumerate(METRIC_NAMES)}
+
     def _normalize_metrics(self, metrics: Dict[str, float]) -> Dict[str, float]:
         """Normalize metrics to 0-100 scale for consistent scoring"""
         normalized = {}
         
-        # Define normalization ranges (min, max, higher_is_better)
-        ranges = {
-            'market_growth_rate': (0, 50, True),
-            'competition_level': (1, 10, False),
-            'regulatory_difficulty': (1, 10, False),
-            'funding_availability': (1, 10, True),
-            'tech_complexity': (1, 10, True),
-            'market_size_billions': (0.1, 100, True),
-            'time_to_market_months': (1, 36, False),
-            'customer_acquisition_cost': (10, 1000, False),
-            'revenue_potential': (50000, 50000000, True)
-        }
-        
         for metric, value in metrics.items():
-            min_val, max_val, higher_better = ranges.get(metric, (0, 100, True))
+            min_val, max_val, higher_better = NORMALIZATION_RANGES.get(metric, (0, 100, True))
             
             # Normalize to 0-1
             normalized_val = (value - min_val) / (max_val - min_val)
-            normalized_val = max(0, min(1, normalized_val))
+            normalized_val = max(0.0, min(1.0, normalized_val))
             
             # Convert to 0-100 and flip if lower is better
             if higher_better:
@@ -246,6 +1945,15 @@ class SWOTScoringEngine:
                 normalized[metric] = (1 - normalized_val) * 100
         
         return normalized
+
+    def _normalize_metrics_batch(self, metrics: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Vectorized _normalize_metrics"""
+        normalized = {}
+        for metric, values in metrics.items():
+            min_val, max_val, higher_better = NORMALIZATION_RANGES.get(metric, (0, 100, True))
+            normalized_val = np.clip((values - min_val) / (max_val - min_val), 0, 1)
+            normalized[metric] = normalized_val * 100 if higher_better else (1 - normalized_val) * 100
+        return normalized
     
     def _calculate_strengths_score(self, metrics: Dict[str, float]) -> float:
         """Calculate strengths score based on positive factors"""
@@ -280,27 +1988,61 @@ class SWOTScoringEngine:
             (100 - metrics['customer_acquisition_cost']) * 0.25
         )
     
-    def _predict_success_probability(self, startup_data: Dict[str, Any]) -> float:
+    def _predict_success_probability(self, startup_data: Dict[str, Any],
+                                     metrics: Optional[Dict[str, float]] = None) -> float:
         """Use ML model to predict startup success probability"""
         if not self.is_trained:
+            self.instrumentation.count('prediction_fallbacks')
             return 50.0  # Default if model not trained
         
         try:
             # Prepare features for prediction
-            features = self._prepare_features_for_prediction(startup_data)
-            features_scaled = self.scaler.transform([features])
+            features = self._prepare_features_for_prediction(startup_data, metrics)
             
             # Predict using trained model
-            prediction = self.model.predict(features_scaled)[0]
-            return max(0, min(100, prediction))
+            prediction = self.artifact.forest.predict_one(features)
+            return max(0.0, min(100.0, prediction))
             
         except Exception as e:
             print(f"Prediction error: {e}", file=sys.stderr)
+            self.instrumentation.count('prediction_fallbacks')
             return 50.0
     
-    def _prepare_features_for_prediction(self, startup_data: Dict[str, Any]) -> List[float]:
+    def _predict_success_probability_batch(self, records: List[Dict[str, Any]],
+                                           metrics: Dict[str, np.ndarray]) -> np.ndarray:
+        """Predict success probabilities for a batch with one forest evaluation"""
+        if not self.is_trained:
+            self.instrumentation.count('prediction_fallbacks', len(records))
+            return np.full(len(records), 50.0)
+
+        try:
+            predictions = self.artifact.forest.predict(self._prepare_features_batch(records, metrics))
+            return np.clip(predictions, 0, 100)
+
+        except Exception as e:
+            print(f"Prediction error: {e}", file=sys.stderr)
+            self.instrumentation.count('prediction_fallbacks', len(records))
+            return np.full(len(records), 50.0)
+
+    def _prepare_features_batch(self, records: List[Dict[str, Any]],
+                                metrics: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+        """Vectorized _prepare_features_for_prediction: one FEATURE_COLUMNS row per startup"""
+        if metrics is None:
+            metrics = self._extract_metrics_batch(records)
+        features = np.empty((len(records), len(FEATURE_COLUMNS)), dtype=np.float64)
+        for i, startup_data in enumerate(records):
+            features[i, 0] = self.artifact.encode('industry', startup_data.get('industry', 'SaaS'))
+            features[i, 1] = self.artifact.encode('location', startup_data.get('location', 'US'))
+            features[i, 2] = self.artifact.encode('team_size', '1-5')
+        for j, metric in enumerate(METRIC_NAMES, start=3):
+            features[:, j] = metrics[metric]
+        return features
+
+    def _prepare_features_for_prediction(self, startup_data: Dict[str, Any],
+                                         metrics: Optional[Dict[str, float]] = None) -> List[float]:
         """Prepare features for ML model prediction"""
-        metrics = self._extract_metrics(startup_data)
+        if metrics is None:
+            metrics = self._extract_metrics(startup_data)
         
         # Encode categorical variables
         industry = startup_data.get('industry', 'SaaS')
@@ -308,20 +2050,9 @@ class SWOTScoringEngine:
         team_size = '1-5'  # Default assumption
         
         # Use label encoders (with fallback for unknown categories)
-        try:
-            industry_encoded = self.label_encoders['industry'].transform([industry])[0]
-        except:
-            industry_encoded = 0
-        
-        try:
-            location_encoded = self.label_encoders['location'].transform([location])[0]
-        except:
-            location_encoded = 0
-        
-        try:
-            team_size_encoded = self.label_encoders['team_size'].transform([team_size])[0]
-        except:
-            team_size_encoded = 0
+        industry_encoded = self.artifact.encode('industry', industry)
+        location_encoded = self.artifact.encode('location', location)
+        team_size_encoded = self.artifact.encode('team_size', team_size)
         
         return [
             industry_encoded, location_encoded, team_size_encoded,
@@ -331,125 +2062,1666 @@ class SWOTScoringEngine:
             metrics['time_to_market_months'], metrics['customer_acquisition_cost'],
             metrics['revenue_potential']
         ]
-    
-    def _generate_swot_analysis(self, metrics: Dict[str, float], startup_data: Dict[str, Any]) -> Dict[str, List[str]]:
-        """Generate detailed SWOT analysis points"""
-        industry = startup_data.get('industry', 'Technology')
-        
-        strengths = []
-        weaknesses = []
-        opportunities = []
-        threats = []
-        
-        # Strengths based on metrics
-        if metrics['market_growth_rate'] > 70:
-            strengths.append(f"Operating in a high-growth {industry} market")
-        if metrics['tech_complexity'] > 60:
-            strengths.append("Strong technical differentiation and barriers to entry")
-        if metrics['funding_availability'] > 70:
-            strengths.append("Access to abundant funding opportunities")
-        if metrics['revenue_potential'] > 75:
-            strengths.append("High revenue generation potential")
-        
-        # Weaknesses
-        if metrics['time_to_market_months'] < 40:
-            weaknesses.append("Extended time-to-market may delay competitive advantage")
-        if metrics['customer_acquisition_cost'] < 50:
-            weaknesses.append("High customer acquisition costs may impact profitability")
-        if metrics['regulatory_difficulty'] < 30:
-            weaknesses.append("Complex regulatory environment requires significant compliance investment")
-        
-        # Opportunities
-        if metrics['market_size_billions'] > 60:
-            opportunities.append(f"Large addressable market in {industry} sector")
-        if metrics['market_growth_rate'] > 60:
-            opportunities.append("Market expansion driven by increasing demand")
-        if metrics['funding_availability'] > 60:
-            opportunities.append("Favorable investment climate for scaling operations")
-        
-        # Threats
-        if metrics['competition_level'] < 40:
-            threats.append("Intense competition from established players")
-        if metrics['regulatory_difficulty'] < 40:
-            threats.append("Regulatory changes could impact business model")
-        if metrics['customer_acquisition_cost'] < 40:
-            threats.append("Rising customer acquisition costs in competitive market")
-        
-        # Ensure minimum items per category
-        if len(strengths) < 2:
-            strengths.extend([
-                "Innovative approach to solving market problems",
-                "Agile development and quick adaptation capabilities"
-            ])
-        
-        if len(weaknesses) < 2:
-            weaknesses.extend([
-                "Limited brand recognition in competitive market",
-                "Resource constraints typical of early-stage ventures"
-            ])
-        
-        if len(opportunities) < 2:
-            opportunities.extend([
-                "Potential for strategic partnerships and collaborations",
-                "Emerging technology trends creating new market segments"
-            ])
-        
-        if len(threats) < 2:
-            threats.extend([
-                "Economic uncertainty affecting investment and spending",
-                "Rapid technological changes requiring continuous innovation"
-            ])
-        
-        return {
-            'strengths': strengths[:4],  # Limit to top 4
-            'weaknesses': weaknesses[:4],
-            'opportunities': opportunities[:4],
-            'threats': threats[:4]
-        }
-    
-    def _generate_recommendations(self, metrics: Dict[str, float], swot: Dict[str, List[str]]) -> List[str]:
-        """Generate strategic recommendations based on SWOT analysis"""
-        recommendations = []
-        
-        # Based on strengths
-        if metrics['tech_complexity'] > 60:
-            recommendations.append("Leverage technical advantages to build strong IP portfolio")
-        
-        # Based on weaknesses
-        if metrics['customer_acquisition_cost'] < 50:
-            recommendations.append("Focus on optimizing customer acquisition channels and reducing CAC")
-        
-        # Based on opportunities
-        if metrics['market_growth_rate'] > 60:
-            recommendations.append("Accelerate market entry to capture growth opportunities")
-        
-        # Based on threats
-        if metrics['competition_level'] < 40:
-            recommendations.append("Develop unique value proposition to differentiate from competitors")
-        
-        # General recommendations
-        recommendations.extend([
-            "Establish key performance indicators to track progress",
-            "Build strategic partnerships to accelerate growth",
-            "Maintain lean operations while scaling capabilities"
-        ])
-        
-        return recommendations[:5]  # Top 5 recommendations
+
+# Scoring engine of a WorkerPool process, built once by _init_pool_worker
+_POOL_ENGINE: Optional[SWOTScoringEngine] = None
+
+
+def _init_pool_worker(model_path: str):
+    global _POOL_ENGINE
+    import signal
+
+    # Ctrl-C is handled by the parent, which shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _POOL_ENGINE = SWOTScoringEngine(model_path=model_path, use_cache=False)
+
+
+def _run_pool_task(method: str, records: List[Dict[str, Any]], options: Dict[str, Any], each: bool = False):
+    start = time.perf_counter()
+    score_batch = partial(getattr(_POOL_ENGINE, method), **options)
+    results = _score_each(score_batch, records) if each else score_batch(records)
+    return os.getpid(), time.perf_counter() - start, results
+
+
+class WorkerPool:
+    """Scoring fanned out over worker processes that share one model artifact
+
+    The artifact's arrays (forest, similarity index) are memory-mapped, so
+    every worker reads the same page-cache copy instead of holding its own
+    model; the metric table is built before forking for the same reason.
+    Single requests are grouped into batches while all workers are busy,
+    so there is no added latency when a worker is idle. Results are cached
+    in this (parent) process; workers send results back in the compact
+    layout, which keeps them small to pickle. Exposes the same scoring and
+    similarity methods as SWOTScoringEngine.
+    """
+
+    def __init__(self, processes: Optional[int] = None, model_path: Optional[str] = None,
+                 max_batch: int = 64, instrumentation: Optional[Instrumentation] = None, use_cache: bool = True):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        if sys.modules.get(__name__) is None:
+            # Tasks are pickled by reference, so workers must be able to find this module
+            raise RuntimeError(f"WorkerPool needs module {__name__!r} registered in sys.modules before it is executed")
+        model_path = model_path or DEFAULT_MODEL_PATH
+        if not os.path.exists(os.path.join(model_path, MANIFEST_NAME)):
+            # Train once here rather than once per worker
+            train(model_path)
+        self.artifact = ModelArtifact.load(model_path)
+        self.processes = processes or os.cpu_count() or 1
+        self.max_batch = max_batch
+        self.cache: Optional[ResultCache] = ResultCache.from_env() if use_cache else None
+        if self.cache is not None:
+            self.cache.bind_model(self.model_version)
+        self.instrumentation = instrumentation or Instrumentation.from_env()
+
+        _box_muller_lookup()
+        start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+        self.executor = ProcessPoolExecutor(
+            self.processes, mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_pool_worker, initargs=(model_path,)
+        )
+        # The executor forks on its first task; do it now, before the caller opens
+        # sockets or starts threads, or the workers would hold open client connections
+        self.executor.submit(os.getpid).result()
+        self.started_at = time.perf_counter()
+        self._stats_lock = threading.Lock()
+        self._worker_stats: Dict[int, Dict[str, float]] = {}
+        self._batcher = _RequestBatcher(self)
+
+    @property
+    def model_version(self) -> Optional[str]:
+        return self.artifact.model_version
+
+    def _submit(self, method: str, records: List[Dict[str, Any]], each: bool = False, **options):
+        """Run an engine batch method on some worker; returns a future of its results
+
+        With each=True a failing batch is retried record by record in the
+        worker and the results are (result, exception) pairs (see _score_each).
+        """
+        from concurrent.futures import Future
+
+        future = self.executor.submit(_run_pool_task, method, records, options, each)
+        result = Future()
+
+        def done(task):
+            try:
+                pid, busy_seconds, results = task.result()
+            except Exception as e:
+                self.instrumentation.count('errors')
+                result.set_exception(e)
+                return
+            with self._stats_lock:
+                stats = self._worker_stats.setdefault(pid, {'tasks': 0, 'rows': 0, 'busy_seconds': 0.0})
+                stats['tasks'] += 1
+                stats['rows'] += len(records)
+                stats['busy_seconds'] += busy_seconds
+            result.set_result(results)
+
+        future.add_done_callback(done)
+        return result
+
+    def _fan_out(self, method: str, records: List[Dict[str, Any]], **options) -> List[Any]:
+        """Split records evenly over the workers and concatenate their results in order"""
+        size = -(-len(records) // self.processes)
+        futures = [self._submit(method, records[start:start + size], **options)
+                   for start in range(0, len(records), size)]
+        return [item for future in futures for item in future.result()]
+
+    def calculate_swot_scores(self, startup_data: Dict[str, Any], explain: Union[bool, str] = False,
+                              compact: bool = False) -> Dict[str, Any]:
+        self.instrumentation.count('calls')
+        explain = _explanation_method(explain)
+        key = cache_key(startup_data, self.model_version, explain) if self.cache is not None else None
+        result = self.cache.get(key) if key else None
+        if result is None:
+            result = self._batcher.submit(startup_data, explain).result()
+            if key:
+                self.cache.put(key, result)
+        return result if compact else render_compact(result)
+
+    def calculate_swot_scores_batch(self, startups, explain: Union[bool, str] = False,
+                                    compact: bool = False) -> List[Dict[str, Any]]:
+        explain = _explanation_method(explain)
+        records = _as_records(startups)
+        self.instrumentation.count('batch_calls')
+        self.instrumentation.count('batch_rows', len(records))
+        if self.cache is None:
+            results = self._fan_out('calculate_swot_scores_batch', records, explain=explain, compact=True) if records else []
+        else:
+            keys = [cache_key(startup_data, self.model_version, explain) for startup_data in records]
+            results = [self.cache.get(key) for key in keys]
+            missing = [i for i, result in enumerate(results) if result is None]
+            if missing:
+                scored = self._fan_out('calculate_swot_scores_batch', [records[i] for i in missing],
+                                       explain=explain, compact=True)
+                for i, result in zip(missing, scored):
+                    self.cache.put(keys[i], result)
+                    results[i] = result
+        return results if compact else [render_compact(result) for result in results]
+
+    def find_similar(self, startup_data: Dict[str, Any], k: int = 5,
+                     n_probe: int = DEFAULT_SIMILARITY_PROBES) -> List[Dict[str, Any]]:
+        return self.find_similar_batch([startup_data], k, n_probe)[0]
+
+    def find_similar_batch(self, startups, k: int = 5,
+                           n_probe: int = DEFAULT_SIMILARITY_PROBES) -> List[List[Dict[str, Any]]]:
+        if self.artifact.similarity is None:
+            raise ValueError("Model artifact has no similarity index; retrain it with this version")
+        records = _as_records(startups)
+        return self._fan_out('find_similar_batch', records, k=k, n_probe=n_probe) if records else []
+
+    def worker_stats(self) -> Dict[str, Any]:
+        """Tasks, rows and busy time per worker process; utilization is busy time over pool uptime"""
+        uptime = time.perf_counter() - self.started_at
+        with self._stats_lock:
+            workers = {
+                str(pid): dict(stats, busy_seconds=round(stats['busy_seconds'], 3),
+                               utilization=round(stats['busy_seconds'] / uptime, 4))
+                for pid, stats in sorted(self._worker_stats.items())
+            }
+        return {'processes': self.processes, 'uptime_seconds': round(uptime, 1), 'workers': workers}
+
+    def close(self):
+        self._batcher.close()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+class _RequestBatcher:
+    """Groups single scoring requests into worker batches
+
+    A request is dispatched as soon as a worker slot is free; while every
+    worker is busy, the requests that arrive meanwhile queue up and go out
+    together (up to max_batch) when the next slot frees.
+    """
+
+    def __init__(self, pool: WorkerPool):
+        import queue
+
+        self.pool = pool
+        self._queue = queue.Queue()
+        self._empty = queue.Empty
+        self._slots = threading.BoundedSemaphore(pool.processes)
+        self._thread = threading.Thread(target=self._run, name='swot-batcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, startup_data: Dict[str, Any], explain: Optional[str]):
+        from concurrent.futures import Future
+
+        future = Future()
+        self._queue.put((startup_data, explain, future))
+        return future
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _drain(self, batch: List[Any]) -> bool:
+        """Move queued requests into batch without blocking; False once close() was called"""
+        while len(batch) < self.pool.max_batch:
+            try:
+                item = self._queue.get_nowait()
+            except self._empty:
+                return True
+            if item is None:
+                return False
+            batch.append(item)
+        return True
+
+    def _run(self):
+        running = True
+        while running:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            running = self._drain(batch)
+            # Waiting for a free worker is what lets a batch fill up under load
+            self._slots.acquire()
+            running = self._drain(batch) and running
+            groups: Dict[Optional[str], List[Any]] = {}
+            for entry in batch:
+                groups.setdefault(entry[1], []).append(entry)
+            for index, (explain, group) in enumerate(groups.items()):
+                if index:
+                    self._slots.acquire()
+                self._dispatch(group, explain)
+
+    def _dispatch(self, group: List[Any], explain: Optional[str]):
+        """Send one batch to the pool; the slot acquired for it is released when it finishes
+
+        The worker retries a failing batch record by record, so a bad request
+        fails alone.
+        """
+        def fail(e):
+            for _, _, future in group:
+                future.set_exception(e)
+
+        try:
+            task = self.pool._submit('calculate_swot_scores_batch', [entry[0] for entry in group],
+                                     each=True, explain=explain, compact=True)
+        except Exception as e:
+            # e.g. BrokenProcessPool: no task will finish to release the slot
+            self._slots.release()
+            fail(e)
+            return
+
+        def done(task):
+            self._slots.release()
+            try:
+                outcomes = task.result()
+            except Exception as e:
+                fail(e)
+                return
+            for (_, _, future), (result, error) in zip(group, outcomes):
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+
+        task.add_done_callback(done)
+
+
+class ScoringOverloaded(RuntimeError):
+    """Raised instead of queueing a request once the scoring queue is full"""
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a request's result is not ready before its deadline"""
+
+
+class _Flight:
+    """One distinct request and every caller waiting for it: scoring, or a similarity lookup when k is set"""
+    __slots__ = ('key', 'startup_data', 'explain', 'k', 'deadline', 'future')
+
+    def __init__(self, key: str, startup_data: Dict[str, Any], explain: Optional[str], deadline: float, future,
+                 k: Optional[int] = None):
+        self.key = key
+        self.startup_data = startup_data
+        self.explain = explain
+        self.k = k
+        self.deadline = deadline
+        self.future = future
+
+
+class AsyncScoringService:
+    """asyncio front end to a SWOTScoringEngine or WorkerPool
+
+    Concurrent requests with the same cache_key share one computation
+    (single-flight). Distinct requests that arrive within batch_window
+    seconds of each other are scored together, with one batch call and so
+    one forest predict; while every batch slot is busy the queue keeps
+    filling, up to max_batch per call. At most max_queue distinct requests
+    wait for a batch, and beyond that new ones fail fast with
+    ScoringOverloaded. Every request has a deadline: its caller gets
+    DeadlineExceeded once it passes, and queued work whose callers have all
+    given up is dropped before it is scored. find_similar lookups go through
+    the same queue, batches and deadlines.
+
+    The engine should be built with use_cache=False; results are cached here
+    so that cache hits are answered without waiting for a batch.
+    """
+
+    def __init__(self, engine, cache: Optional[ResultCache] = None, batch_window: float = 0.002,
+                 max_batch: int = 256, max_queue: int = 1024, timeout: float = 5.0,
+                 max_concurrent_batches: Optional[int] = None):
+        self.engine = engine
+        self.cache = cache
+        if cache is not None:
+            cache.bind_model(engine.model_version)
+        self.instrumentation = engine.instrumentation
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_queue = max_queue
+        self.timeout = timeout
+        # A WorkerPool can score one batch per process at once; in-process scoring holds the GIL anyway
+        self.max_concurrent_batches = max_concurrent_batches or getattr(engine, 'processes', 1)
+        self.counters = {'requests': 0, 'cache_hits': 0, 'coalesced': 0, 'shed': 0, 'deadline_exceeded': 0,
+                         'expired_before_scoring': 0, 'batches': 0, 'batched_rows': 0, 'errors': 0,
+                         'cache_errors': 0}
+        self._inflight: Dict[str, _Flight] = {}
+        self._queue: 'deque[_Flight]' = deque()
+        self._ready = None
+        self._slots = None
+        self._executor = None
+        self._task = None
+
+    @property
+    def model_version(self) -> Optional[str]:
+        return self.engine.model_version
+
+    async def start(self):
+        """Start the batching task on the running event loop"""
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._ready = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+        self._executor = ThreadPoolExecutor(self.max_concurrent_batches, thread_name_prefix='swot-batch')
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        import asyncio
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._executor.shutdown(wait=True)
+
+    async def score(self, startup_data: Dict[str, Any], explain: Union[bool, str] = False, compact: bool = False,
+                    timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Score one startup like SWOTScoringEngine.calculate_swot_scores, within timeout seconds"""
+        import asyncio
+
+        explain = _explanation_method(explain)
+        loop = asyncio.get_running_loop()
+        self.counters['requests'] += 1
+        deadline = loop.time() + (self.timeout if timeout is None else timeout)
+        key = cache_key(startup_data, self.model_version, explain)
+
+        if key not in self._inflight:
+            result = self.cache.get(key) if self.cache is not None else None
+            if result is not None:
+                self.counters['cache_hits'] += 1
+                return result if compact else render_compact(result)
+        flight = self._join(key, startup_data, explain, deadline)
+        # shield() keeps the shared computation alive when this caller gives up
+        result = await self._wait(asyncio.shield(flight.future), deadline)
+        return result if compact else render_compact(result)
+
+    async def find_similar(self, startups: List[Dict[str, Any]], k: int = 5,
+                           timeout: Optional[float] = None) -> List[List[Dict[str, Any]]]:
+        """Like engine.find_similar_batch, with each startup queued, batched and deadlined like score()"""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        self.counters['requests'] += 1
+        deadline = loop.time() + (self.timeout if timeout is None else timeout)
+        if len(self._queue) + len(startups) > self.max_queue:
+            # All or nothing, so a portfolio is not left half-queued
+            self.counters['shed'] += 1
+            raise ScoringOverloaded(f"Scoring queue is full ({self.max_queue} requests waiting)")
+        flights = [self._join(f"similar-{k}-{cache_key(startup_data, self.model_version)}", startup_data,
+                              None, deadline, k) for startup_data in startups]
+        return await self._wait(asyncio.gather(*(asyncio.shield(flight.future) for flight in flights)), deadline)
+
+    def _join(self, key: str, startup_data: Dict[str, Any], explain: Optional[str], deadline: float,
+              k: Optional[int] = None) -> _Flight:
+        """The flight already running for key, or a new one queued for the next batch"""
+        import asyncio
+
+        flight = self._inflight.get(key)
+        if flight is not None:
+            self.counters['coalesced'] += 1
+            flight.deadline = max(flight.deadline, deadline)
+            return flight
+        if len(self._queue) >= self.max_queue:
+            self.counters['shed'] += 1
+            raise ScoringOverloaded(f"Scoring queue is full ({self.max_queue} requests waiting)")
+        flight = self._inflight[key] = _Flight(key, startup_data, explain, deadline,
+                                               asyncio.get_running_loop().create_future(), k)
+        self._queue.append(flight)
+        self._ready.set()
+        return flight
+
+    async def _wait(self, awaitable, deadline: float):
+        """Result of awaitable, or DeadlineExceeded once the loop clock passes deadline"""
+        import asyncio
+
+        try:
+            return await asyncio.wait_for(awaitable, max(deadline - asyncio.get_running_loop().time(), 0.0))
+        except (asyncio.TimeoutError, DeadlineExceeded):
+            self.counters['deadline_exceeded'] += 1
+            raise DeadlineExceeded('Scoring deadline exceeded') from None
+
+    def stats(self) -> Dict[str, Any]:
+        stats = dict(self.counters)
+        stats.update({
+            'queued': len(self._queue),
+            'in_flight': len(self._inflight),
+            'mean_batch_rows': round(stats['batched_rows'] / stats['batches'], 2) if stats['batches'] else 0.0,
+            'batch_window_ms': self.batch_window * 1000,
+            'max_queue': self.max_queue,
+        })
+        return stats
+
+    async def _run(self):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._ready.wait()
+            # Let a batch gather for batch_window unless it is full already; waiting
+            # for a free slot afterwards lets it grow further under load
+            if len(self._queue) < self.max_batch:
+                await asyncio.sleep(self.batch_window)
+            await self._slots.acquire()
+            now = loop.time()
+            batch = []
+            while self._queue and len(batch) < self.max_batch:
+                flight = self._queue.popleft()
+                if flight.deadline <= now:
+                    self.counters['expired_before_scoring'] += 1
+                    self._finish(flight, exception=DeadlineExceeded('Scoring deadline exceeded'))
+                else:
+                    batch.append(flight)
+            if not self._queue:
+                self._ready.clear()
+            if batch:
+                loop.create_task(self._dispatch(batch))
+            else:
+                self._slots.release()
+
+    async def _dispatch(self, batch: List[_Flight]):
+        """Score one batch on the executor; releases the batch slot when done"""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        groups: Dict[Tuple[Optional[str], Optional[int]], List[_Flight]] = {}
+        for flight in batch:
+            groups.setdefault((flight.explain, flight.k), []).append(flight)
+        try:
+            for (explain, k), group in groups.items():
+                self.counters['batches'] += 1
+                self.counters['batched_rows'] += len(group)
+                if k is None:
+                    outcomes = await loop.run_in_executor(self._executor, self._score_group, group, explain)
+                else:
+                    outcomes = await loop.run_in_executor(self._executor, self._similar_group, group, k)
+                for flight, (result, error) in zip(group, outcomes):
+                    if error is not None:
+                        self.counters['errors'] += 1
+                    self._finish(flight, result, error)
+        except Exception as e:
+            # Unfinished flights would stay in _inflight, and later callers would join them until they time out
+            for flight in batch:
+                if not flight.future.done():
+                    self.counters['errors'] += 1
+                    self._finish(flight, exception=e)
+        finally:
+            self._slots.release()
+
+    def _score_group(self, group: List[_Flight], explain: Optional[str]) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+        """(result, error) per flight; a bad request fails alone (see _score_each)"""
+        outcomes = _score_each(
+            lambda records: self.engine.calculate_swot_scores_batch(records, explain=explain, compact=True),
+            [flight.startup_data for flight in group]
+        )
+        if self.cache is not None:
+            for flight, (result, error) in zip(group, outcomes):
+                if error is None:
+                    try:
+                        self.cache.put(flight.key, result)
+                    except Exception as e:
+                        # e.g. a locked shared SQLite tier; the result is still good
+                        self.counters['cache_errors'] += 1
+                        print(f"Result cache write failed: {e}", file=sys.stderr)
+        return outcomes
+
+    def _similar_group(self, group: List[_Flight], k: int) -> List[Tuple[Optional[List[Dict[str, Any]]], Optional[Exception]]]:
+        """(neighbours, error) per flight; a bad request fails alone (see _score_each)"""
+        return _score_each(lambda records: self.engine.find_similar_batch(records, k),
+                           [flight.startup_data for flight in group])
+
+    def _finish(self, flight: _Flight, result: Optional[Dict[str, Any]] = None,
+                exception: Optional[BaseException] = None):
+        self._inflight.pop(flight.key, None)
+        if flight.future.done():
+            return
+        if exception is None:
+            flight.future.set_result(result)
+        else:
+            flight.future.set_exception(exception)
+            # Mark it retrieved: every caller may have given up already
+            flight.future.exception()
+
+
+# Upper bound for GET /debug/profile?seconds=N, which holds a worker thread while it samples
+MAX_PROFILE_SECONDS = 60.0
+# Upper bound for POST /similar?k=N; results are allocated per query up front
+MAX_SIMILAR_K = 100
+
+
+def _read_endpoint(server, path: str, query: Dict[str, List[str]]) -> Optional[Tuple[int, Any, str]]:
+    """(status, body, content type) of the read-only endpoints both servers share, None for other paths
+
+    A dict body is sent as JSON. server is a SWOTScoringServer or an
+    AsyncSWOTServer; its engine is None until the model is loaded.
+    """
+    engine = server.engine
+    if path == '/healthz':
+        return 200, {'status': 'ok', 'uptime_seconds': round(time.time() - server.started_at, 1)}, 'application/json'
+    if path == '/readyz':
+        if engine is not None:
+            return 200, {'status': 'ready'}, 'application/json'
+        if server.engine_error is not None:
+            return 503, {'status': 'failed', 'error': server.engine_error}, 'application/json'
+        return 503, {'status': 'loading'}, 'application/json'
+    if path == '/stats':
+        scorer = engine.engine if isinstance(engine, AsyncScoringService) else engine
+        return 200, {
+            'model_version': engine.model_version if engine else None,
+            'cache': engine.cache.stats() if engine and engine.cache else None,
+            'instrumentation': engine.instrumentation.snapshot() if engine else None,
+            'worker_pool': scorer.worker_stats() if isinstance(scorer, WorkerPool) else None,
+            'front_end': engine.stats() if isinstance(engine, AsyncScoringService) else None,
+        }, 'application/json'
+    if path == '/phrases':
+        # Everything a client needs to render compact results itself
+        return 200, {
+            'version': COMPACT_FORMAT_VERSION,
+            'phrases': PHRASE_TEMPLATES,
+            'sections': SWOT_SECTIONS,
+            'metrics': METRIC_NAMES,
+            'features': EXPLANATION_FEATURES,
+        }, 'application/json'
+    if path == '/metrics':
+        if engine is None:
+            return 503, {'error': 'Scoring engine is not ready'}, 'application/json'
+        if query.get('format') == ['json']:
+            return 200, engine.instrumentation.snapshot(), 'application/json'
+        return (200, engine.instrumentation.prometheus(engine.cache.stats() if engine.cache else None),
+                'text/plain; version=0.0.4')
+    return None
+
+
+# Request fields the engine reads as text
+STARTUP_TEXT_FIELDS = ('industry', 'location', 'audience', 'description')
+
+
+def _check_startup_fields(startup_data: Dict[str, Any]):
+    """ValueError naming the first text field that is present but not a string"""
+    for field in STARTUP_TEXT_FIELDS:
+        if field in startup_data and not isinstance(startup_data[field], str):
+            raise ValueError(f"{field} must be a string")
+
+
+def _similar_request(startup_data: Dict[str, Any],
+                     query: Dict[str, List[str]]) -> Tuple[List[Dict[str, Any]], int, bool]:
+    """(startups, k, portfolio) of a POST /similar request; ValueError when it is malformed
+
+    The body is one startup, or {"startups": [...]} to compare a portfolio.
+    """
+    try:
+        k = int(query.get('k', ['5'])[0])
+    except ValueError:
+        raise ValueError('k must be an integer') from None
+    if not 1 <= k <= MAX_SIMILAR_K:
+        raise ValueError(f"k must be between 1 and {MAX_SIMILAR_K}")
+    portfolio = startup_data.get('startups')
+    startups = portfolio if isinstance(portfolio, list) else [startup_data]
+    if not all(isinstance(startup, dict) for startup in startups):
+        raise ValueError('startups must be a list of JSON objects')
+    for startup in startups:
+        _check_startup_fields(startup)
+    return startups, k, isinstance(portfolio, list)
+
+
+class SWOTRequestHandler:
+    """HTTP handler exposing scoring, health and readiness endpoints
+
+    Mixed into http.server.BaseHTTPRequestHandler by make_server().
+    """
+    protocol_version = 'HTTP/1.1'
+    server_version = 'SWOTScoring/1.0'
+    # Idle keep-alive connections are dropped after this many seconds
+    timeout = 15
+
+    def do_GET(self):
+        from urllib.parse import urlsplit, parse_qs
+
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        response = _read_endpoint(self.server, url.path, query)
+        if response is not None:
+            status, body, content_type = response
+            if isinstance(body, dict):
+                self._send_json(status, body)
+            else:
+                self._send_text(status, body, content_type)
+        elif url.path == '/debug/profile':
+            try:
+                seconds = min(float(query.get('seconds', ['5'])[0]), MAX_PROFILE_SECONDS)
+            except ValueError:
+                self._send_json(400, {'error': 'seconds must be a number'})
+                return
+            if not self.server.profile_lock.acquire(blocking=False):
+                self._send_json(409, {'error': 'A profile is already running'})
+                return
+            try:
+                profiler = SamplingProfiler()
+                profiler.start()
+                time.sleep(max(seconds, 0.0))
+                self._send_text(200, profiler.stop(), 'text/plain')
+            finally:
+                self.server.profile_lock.release()
+        else:
+            self._send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        from urllib.parse import urlsplit, parse_qs
+
+        url = urlsplit(self.path)
+        if url.path not in ('/score', '/similar'):
+            self._drain_body()
+            self._send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+            return
+
+        try:
+            startup_data = json.loads(self._drain_body() or b'{}')
+        except ValueError as e:
+            self._send_json(400, {'error': f"Invalid JSON body: {e}"})
+            return
+        if not isinstance(startup_data, dict):
+            self._send_json(400, {'error': 'Request body must be a JSON object'})
+            return
+
+        engine = self.server.engine
+        if engine is None:
+            self._send_json(503, {'error': 'Scoring engine is not ready'})
+            return
+
+        run = self.server.run_scoring
+        try:
+            query = parse_qs(url.query)
+            if url.path == '/score':
+                _check_startup_fields(startup_data)
+                explain = _explain_param(query)
+                # compact=1 answers in the compact layout, compact=binary packs it with pack_compact
+                compact = query.get('compact', ['0'])[0].lower()
+                if compact == 'binary':
+                    result = run(engine.calculate_swot_scores, startup_data, explain, compact=True)
+                    self._send_body(200, pack_compact(result), 'application/octet-stream')
+                elif compact in ('1', 'true', 'yes'):
+                    self._send_json(200, run(engine.calculate_swot_scores, startup_data, explain, compact=True))
+                else:
+                    self._send_json(200, run(engine.calculate_swot_scores, startup_data, explain))
+                return
+            startups, k, portfolio = _similar_request(startup_data, query)
+            similar = run(engine.find_similar_batch, startups, k)
+            self._send_json(200, {'similar': similar if portfolio else similar[0]})
+        except ScoringOverloaded as e:
+            self._send_json(503, {'error': str(e)}, {'Retry-After': '1'})
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+
+    def _drain_body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length > 0 else b''
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        self._send_text(status, json.dumps(payload, separators=(',', ':')), 'application/json', headers)
+
+    def _send_text(self, status: int, text: str, content_type: str, headers: Optional[Dict[str, str]] = None):
+        self._send_body(status, text.encode(), content_type, headers)
+
+    def _send_body(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep stdout clean; access logs go to stderr like the rest of the diagnostics
+        print(f"{self.address_string()} - {format % args}", file=sys.stderr)
+
+
+class SWOTScoringServer:
+    """Long-lived HTTP server holding one warm SWOTScoringEngine
+
+    Mixed into http.server.ThreadingHTTPServer by make_server(). Each
+    connection gets a thread that only reads and writes; scoring runs on a
+    bounded pool of ``max_workers`` threads, so idle keep-alive connections
+    do not hold a scoring slot. Once ``max_workers`` requests are scoring
+    and ``max_pending`` more are queued, new requests are answered with 503.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+    # socketserver's default listen backlog of 5 drops connections in a burst; clients then retry after 1 s or more
+    request_queue_size = 1024
+
+    def __init__(self, address: Tuple[str, int], handler_class, max_workers: int = 4, max_pending: int = 64,
+                 instrument: bool = False):
+        from concurrent.futures import ThreadPoolExecutor
+
+        super().__init__(address, handler_class)
+        self.instrument = instrument
+        self.profile_lock = threading.Lock()
+        self.engine: Optional[SWOTScoringEngine] = None
+        self.engine_error: Optional[str] = None
+        self.started_at = time.time()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='swot-worker')
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+
+    def load_engine(self):
+        """Build the engine in the background so health checks answer during warm-up"""
+        def _load():
+            try:
+                instrumentation = Instrumentation(enabled=True) if self.instrument else None
+                engine = SWOTScoringEngine(instrumentation=instrumentation)
+                _box_muller_lookup()  # Build the metric table now rather than on the first request
+                self.engine = engine
+                print("Scoring engine ready", file=sys.stderr)
+            except Exception as e:
+                self.engine_error = str(e)
+                print(f"Scoring engine failed to load: {e}", file=sys.stderr)
+
+        threading.Thread(target=_load, name='swot-engine-loader', daemon=True).start()
+
+    def run_scoring(self, fn, *args, **kwargs):
+        """Run fn on the scoring pool and wait for it; raises ScoringOverloaded when the pool is full"""
+        if not self._slots.acquire(blocking=False):
+            raise ScoringOverloaded('Scoring server overloaded')
+        try:
+            future = self.executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False)
+
+
+def make_server(host: str = '127.0.0.1', port: int = 8765, max_workers: int = 4, max_pending: int = 64,
+                instrument: bool = False):
+    """Create the scoring server, importing http.server only now"""
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    handler_class = type('SWOTRequestHandler', (SWOTRequestHandler, BaseHTTPRequestHandler), {})
+    server_class = type('SWOTScoringServer', (SWOTScoringServer, ThreadingHTTPServer), {})
+    return server_class((host, port), handler_class, max_workers=max_workers, max_pending=max_pending,
+                        instrument=instrument)
+
+
+def serve(host: str = '127.0.0.1', port: int = 8765, max_workers: int = 4, max_pending: int = 64,
+          instrument: bool = False, processes: int = 1):
+    """Run the scoring server until interrupted
+
+    With processes > 1 scoring runs on a WorkerPool. It is started before
+    the server's threads so the workers are forked from a single-threaded
+    process, and the server then needs enough threads to keep them fed.
+    """
+    pool = None
+    if processes > 1:
+        pool = WorkerPool(processes, instrumentation=Instrumentation(enabled=True) if instrument else None)
+        max_workers = max(max_workers, 4 * processes)
+    server = make_server(host, port, max_workers, max_pending, instrument)
+    if pool is not None:
+        server.engine = pool
+        print(f"Scoring on {processes} worker processes", file=sys.stderr)
+    else:
+        server.load_engine()
+    print(f"SWOT scoring server listening on http://{host}:{port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if pool is not None:
+            pool.close()
+
+
+# Largest request body the asyncio server reads; larger requests get 413
+MAX_REQUEST_BYTES = 1024 * 1024
+MAX_REQUEST_HEADERS = 100
+HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 408: 'Request Timeout', 409: 'Conflict',
+                411: 'Length Required', 413: 'Payload Too Large', 417: 'Expectation Failed',
+                431: 'Request Header Fields Too Large', 500: 'Internal Server Error', 501: 'Not Implemented',
+                503: 'Service Unavailable', 504: 'Gateway Timeout'}
+
+
+class AsyncSWOTServer:
+    """HTTP/1.1 server on asyncio streams with an AsyncScoringService behind POST /score
+
+    Serves the same endpoints as SWOTScoringServer. Connections cost a
+    coroutine rather than a thread, so a burst of requests reaches the
+    service, where duplicates are coalesced and the rest micro-batched,
+    instead of queueing for a thread. POST /score and POST /similar take
+    ?deadline_ms=N to shorten or extend the default deadline; overload is
+    answered with 503 and a missed deadline with 504. Request bodies need a
+    Content-Length: chunked and other transfer codings are refused and the
+    connection closed.
+    """
+    # Idle keep-alive connections are dropped after this many seconds, and a
+    # request's headers and its body must each arrive within it
+    timeout = 15
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765, instrument: bool = False, scorer=None,
+                 **service_options):
+        self.host = host
+        self.port = port
+        self.instrument = instrument
+        # A prepared scorer (e.g. a WorkerPool), otherwise an in-process engine is loaded
+        self.scorer = scorer
+        self.service_options = service_options
+        self.engine: Optional[AsyncScoringService] = None
+        self.engine_error: Optional[str] = None
+        self.started_at = time.time()
+        self.profiling = False
+
+    def _load_engine(self) -> SWOTScoringEngine:
+        instrumentation = Instrumentation(enabled=True) if self.instrument else None
+        engine = SWOTScoringEngine(use_cache=False, instrumentation=instrumentation)
+        _box_muller_lookup()  # Build the metric table now rather than on the first request
+        return engine
+
+    async def serve_forever(self):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        print(f"SWOT scoring server (asyncio) listening on http://{self.host}:{self.port}", file=sys.stderr)
+        try:
+            # Health checks answer while the model loads
+            try:
+                scorer = self.scorer or await loop.run_in_executor(None, self._load_engine)
+                service = AsyncScoringService(scorer, ResultCache.from_env(), **self.service_options)
+                await service.start()
+                self.engine = service
+                print("Scoring engine ready", file=sys.stderr)
+            except Exception as e:
+                self.engine_error = str(e)
+                print(f"Scoring engine failed to load: {e}", file=sys.stderr)
+            async with server:
+                await server.serve_forever()
+        finally:
+            if self.engine is not None:
+                await self.engine.close()
+
+    async def _handle_connection(self, reader, writer):
+        import asyncio
+
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), self.timeout)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {'error': 'Malformed request line'}, keep_alive=False)
+                    break
+                try:
+                    headers = await asyncio.wait_for(self._read_headers(reader), self.timeout)
+                except asyncio.TimeoutError:
+                    await self._respond(writer, 408, {'error': 'Timed out reading request headers'},
+                                        keep_alive=False)
+                    break
+                except ValueError as e:
+                    # Too many header fields, or one over the stream's line limit
+                    await self._respond(writer, 431, {'error': str(e)}, keep_alive=False)
+                    break
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+
+                error = self._framing_error(headers)
+                if error is not None:
+                    await self._respond(writer, *error, keep_alive=False)
+                    break
+                length = int(headers.get('content-length') or 0)
+                if length > 0 and headers.get('expect', '').lower() == '100-continue':
+                    # The client holds the body back until it sees this
+                    writer.write(b'HTTP/1.1 100 Continue\r\n\r\n')
+                    await writer.drain()
+                try:
+                    body = await asyncio.wait_for(reader.readexactly(length), self.timeout) if length > 0 else b''
+                except asyncio.TimeoutError:
+                    await self._respond(writer, 408, {'error': 'Timed out reading request body'}, keep_alive=False)
+                    break
+                status, payload, content_type, extra_headers = await self._route(method, target, body)
+                await self._respond(writer, status, payload, content_type, extra_headers, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_headers(reader) -> Dict[str, str]:
+        """Header fields up to the blank line, keyed by lower-cased name"""
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                return headers
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+            if len(headers) > MAX_REQUEST_HEADERS:
+                raise ValueError(f"More than {MAX_REQUEST_HEADERS} request headers")
+
+    @staticmethod
+    def _framing_error(headers: Dict[str, str]) -> Optional[Tuple[int, Dict[str, str]]]:
+        """(status, error body) for a request whose body cannot be read, None if it can"""
+        transfer_encoding = headers.get('transfer-encoding', '').lower()
+        if transfer_encoding == 'chunked':
+            return 411, {'error': 'Chunked request bodies are not supported; send Content-Length'}
+        if transfer_encoding:
+            return 501, {'error': f"Unsupported Transfer-Encoding: {transfer_encoding}"}
+        length = headers.get('content-length') or '0'
+        if not (length.isascii() and length.isdigit()):
+            return 400, {'error': f"Invalid Content-Length: {length}"}
+        if int(length) > MAX_REQUEST_BYTES:
+            return 413, {'error': f"Request body over {MAX_REQUEST_BYTES} bytes"}
+        expect = headers.get('expect', '').lower()
+        if expect and expect != '100-continue':
+            return 417, {'error': f"Unsupported Expect: {expect}"}
+        return None
+
+    async def _route(self, method: str, target: str, body: bytes) -> Tuple[int, Any, str, Dict[str, str]]:
+        from urllib.parse import urlsplit, parse_qs
+
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        if method == 'GET':
+            response = _read_endpoint(self, url.path, query)
+            if response is not None:
+                return response + ({},)
+            if url.path == '/debug/profile':
+                return await self._profile(query) + ({},)
+        elif method == 'POST' and url.path in ('/score', '/similar'):
+            try:
+                startup_data = json.loads(body or b'{}')
+            except ValueError as e:
+                return 400, {'error': f"Invalid JSON body: {e}"}, 'application/json', {}
+            if not isinstance(startup_data, dict):
+                return 400, {'error': 'Request body must be a JSON object'}, 'application/json', {}
+            service = self.engine
+            if service is None:
+                return 503, {'error': 'Scoring engine is not ready'}, 'application/json', {}
+            try:
+                deadline_ms = query.get('deadline_ms')
+                timeout = float(deadline_ms[0]) / 1000 if deadline_ms else None
+                if url.path == '/similar':
+                    startups, k, portfolio = _similar_request(startup_data, query)
+                    similar = await service.find_similar(startups, k, timeout=timeout)
+                    return 200, {'similar': similar if portfolio else similar[0]}, 'application/json', {}
+                _check_startup_fields(startup_data)
+                explain = _explain_param(query)
+                compact = query.get('compact', ['0'])[0].lower()
+                result = await service.score(startup_data, explain, compact=compact in ('1', 'true', 'yes', 'binary'),
+                                             timeout=timeout)
+                if compact == 'binary':
+                    return 200, pack_compact(result), 'application/octet-stream', {}
+                return 200, result, 'application/json', {}
+            except ScoringOverloaded as e:
+                return 503, {'error': str(e)}, 'application/json', {'Retry-After': '1'}
+            except DeadlineExceeded as e:
+                return 504, {'error': str(e)}, 'application/json', {}
+            except ValueError as e:
+                return 400, {'error': str(e)}, 'application/json', {}
+            except Exception as e:
+                return 500, {'error': str(e)}, 'application/json', {}
+        return 404, {'error': f"Unknown endpoint: {target}"}, 'application/json', {}
+
+    async def _profile(self, query: Dict[str, List[str]]) -> Tuple[int, Any, str]:
+        import asyncio
+
+        try:
+            seconds = min(float(query.get('seconds', ['5'])[0]), MAX_PROFILE_SECONDS)
+        except ValueError:
+            return 400, {'error': 'seconds must be a number'}, 'application/json'
+        if self.profiling:
+            return 409, {'error': 'A profile is already running'}, 'application/json'
+        self.profiling = True
+        try:
+            profiler = SamplingProfiler()
+            profiler.start()
+            await asyncio.sleep(max(seconds, 0.0))
+            return 200, profiler.stop(), 'text/plain'
+        finally:
+            self.profiling = False
+
+    @staticmethod
+    async def _respond(writer, status: int, payload: Any, content_type: str = 'application/json',
+                       extra_headers: Optional[Dict[str, str]] = None, keep_alive: bool = True):
+        if isinstance(payload, dict):
+            body = json.dumps(payload, separators=(',', ':')).encode()
+        elif isinstance(payload, str):
+            body = payload.encode()
+        else:
+            body = payload
+        head = [f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}", f"Content-Type: {content_type}",
+                f"Content-Length: {len(body)}", 'Server: SWOTScoring/1.0']
+        head.extend(f"{name}: {value}" for name, value in (extra_headers or {}).items())
+        if not keep_alive:
+            head.append('Connection: close')
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+
+def serve_async(host: str = '127.0.0.1', port: int = 8765, instrument: bool = False, processes: int = 1,
+                **service_options):
+    """Run the asyncio scoring server until interrupted; service_options go to AsyncScoringService
+
+    As in serve(), a WorkerPool is started before the event loop and its
+    threads so the workers are forked from a single-threaded process.
+    """
+    import asyncio
+
+    pool = None
+    if processes > 1:
+        pool = WorkerPool(processes, instrumentation=Instrumentation(enabled=True) if instrument else None,
+                          use_cache=False)
+        print(f"Scoring on {processes} worker processes", file=sys.stderr)
+    try:
+        asyncio.run(AsyncSWOTServer(host, port, instrument, pool, **service_options).serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if pool is not None:
+            pool.close()
+
+
+_IMPORT_PROBE = """
+import importlib.util, json, sys, time
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location('swot_scoring', sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+elapsed_ms = (time.perf_counter() - start) * 1000
+loaded = sorted(name for name in module.DEFERRED_MODULES if name in sys.modules)
+print(json.dumps({'elapsed_ms': elapsed_ms, 'deferred_modules_loaded': loaded}))
+"""
+
+
+def check_import_budget(budget_ms: float = IMPORT_BUDGET_MS) -> Dict[str, Any]:
+    """Measure this module's import cost in a fresh interpreter with -X importtime"""
+    import subprocess
+
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _IMPORT_PROBE, os.path.abspath(__file__)],
+        capture_output=True, text=True, check=True
+    )
+    report = json.loads(proc.stdout)
+
+    # importtime lines look like "import time: self | cumulative | name"; top-level
+    # imports are the ones whose name is not indented
+    top_level = {}
+    for line in proc.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and not parts[2].startswith('  ') and parts[1].strip().isdigit():
+            top_level[parts[2].strip()] = int(parts[1]) / 1000
+    numpy_ms = top_level.get('numpy', 0.0)
+
+    report.update({
+        'numpy_ms': round(numpy_ms, 1),
+        'module_ms': round(report['elapsed_ms'] - numpy_ms, 1),
+        'elapsed_ms': round(report['elapsed_ms'], 1),
+        'budget_ms': budget_ms,
+        'slowest_imports_ms': dict(sorted(top_level.items(), key=lambda item: -item[1])[:5]),
+    })
+    report['within_budget'] = report['module_ms'] <= budget_ms and not report['deferred_modules_loaded']
+    return report
+
+
+def benchmark_forest(rows: int = 200, repeats: int = 3) -> Dict[str, Any]:
+    """Per-row latency of sklearn's predict versus the exported FlatForest"""
+    engine = SWOTScoringEngine(train=True, use_cache=False)
+    forest = engine.artifact.forest
+    X, _ = next(engine._iter_mock_training_chunks(rows, rows))
+
+    def per_row_us(fn) -> float:
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        return round(best / len(X) * 1e6, 2)
+
+    return {
+        'rows': len(X),
+        'n_trees': forest.n_trees,
+        'max_depth': forest.max_depth,
+        'parity': forest_parity(forest, engine.model, X, engine.scaler.transform(X)),
+        'per_row_us': {
+            'sklearn_single_row': per_row_us(lambda: [engine.model.predict(engine.scaler.transform(x[None, :])) for x in X]),
+            'flat_forest_single_row': per_row_us(lambda: [forest.predict_one(x) for x in X]),
+            'sklearn_batch': per_row_us(lambda: engine.model.predict(engine.scaler.transform(X))),
+            'flat_forest_batch': per_row_us(lambda: forest.predict(X)),
+        },
+    }
+
+
+def _forest_benchmark_command(argv: List[str]):
+    parser = _argument_parser(prog='swot-scoring.py forest-benchmark',
+                              description='Compare sklearn and FlatForest prediction latency')
+    parser.add_argument('--rows', type=int, default=200)
+    args = parser.parse_args(argv)
+    print(json.dumps(benchmark_forest(args.rows), indent=2))
+
+
+def _import_budget_command(argv: List[str]):
+    parser = _argument_parser(prog='swot-scoring.py import-budget',
+                              description='Check that the scoring import path stays within its time budget')
+    parser.add_argument('--budget-ms', type=float, default=IMPORT_BUDGET_MS,
+                        help='Allowed import time on top of NumPy')
+    args = parser.parse_args(argv)
+    report = check_import_budget(args.budget_ms)
+    print(json.dumps(report, indent=2))
+    if not report['within_budget']:
+        sys.exit(1)
+
+
+def _argument_parser(prog: str, description: str):
+    import argparse
+
+    return argparse.ArgumentParser(prog=prog, description=description)
+
+
+def train(output_path: str = DEFAULT_MODEL_PATH, **training_options) -> Dict[str, Any]:
+    """Fit the model once and persist it as a versioned artifact
+
+    training_options are passed to SWOTScoringEngine._train_model
+    (n_samples, chunk_size, n_estimators, n_jobs, similarity_lists, similarity_rows).
+    """
+    engine = SWOTScoringEngine(train=True, use_cache=False, training_options=training_options)
+    version = engine.artifact.save(output_path)
+    return {
+        'model_path': output_path,
+        'model_version': version,
+        'eval_metrics': engine.artifact.eval_metrics,
+        'forest': {'n_trees': engine.artifact.forest.n_trees, 'n_nodes': engine.artifact.forest.n_nodes},
+        'similarity': {'n_rows': engine.artifact.similarity.n_rows, 'n_lists': engine.artifact.similarity.n_lists},
+        'training_report': engine.artifact.training_report,
+    }
+
+
+def _train_command(argv: List[str]):
+    parser = _argument_parser(prog='swot-scoring.py train', description='Train and save the SWOT model artifact')
+    parser.add_argument('--output', default=DEFAULT_MODEL_PATH, help='Artifact directory')
+    parser.add_argument('--samples', type=int, default=1000, help='Synthetic training rows')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_TRAINING_CHUNK_SIZE,
+                        help='Rows generated and fitted per chunk')
+    parser.add_argument('--trees', type=int, default=100, help='Trees in the forest')
+    parser.add_argument('--n-jobs', type=int, default=-1, help='Cores used to fit trees (-1 for all)')
+    parser.add_argument('--similarity-lists', type=int, help='Inverted lists in the similarity index (default sqrt(rows))')
+    parser.add_argument('--similarity-rows', type=int, default=DEFAULT_SIMILARITY_MAX_ROWS,
+                        help='Training rows kept for the similarity index (a uniform sample beyond this)')
+    args = parser.parse_args(argv)
+    print(json.dumps(train(args.output, n_samples=args.samples, chunk_size=args.chunk_size,
+                           n_estimators=args.trees, n_jobs=args.n_jobs, similarity_lists=args.similarity_lists,
+                           similarity_rows=args.similarity_rows), indent=2))
+
+
+def score_jsonl(input_stream, output_stream, batch_size: int = 1000, engine: Optional[SWOTScoringEngine] = None,
+                score_batch=None):
+    """Score JSON lines from input_stream in batches, writing one result line per input line
+
+    score_batch maps a list of startups to one result dict each; it defaults
+    to engine.calculate_swot_scores_batch.
+    """
+    engine = engine or SWOTScoringEngine()
+    score_batch = score_batch or engine.calculate_swot_scores_batch
+
+    def flush(batch: List[Tuple[Optional[Dict[str, Any]], Optional[str]]]):
+        for result, error in _score_bulk_batch(score_batch, batch):
+            output_stream.write(json.dumps(result if error is None else {'error': error},
+                                           separators=(',', ':')) + '\n')
+
+    batch = []
+    for line_number, line in enumerate(input_stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+            error = None if isinstance(data, dict) else f"Line {line_number}: expected a JSON object"
+        except ValueError as e:
+            data, error = None, f"Line {line_number}: {e}"
+        batch.append((data, error))
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+    output_stream.flush()
+
+
+def _bulk_format(path: str, override: Optional[str] = None) -> str:
+    if override:
+        if override not in set(BULK_FORMATS.values()):
+            raise ValueError(f"Unknown format {override!r}; use one of {sorted(set(BULK_FORMATS.values()))}")
+        return override
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in BULK_FORMATS:
+        raise ValueError(f"Cannot tell the format of {path}; pass it explicitly")
+    return BULK_FORMATS[extension]
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Parquet and Arrow files need pyarrow (pip install pyarrow)") from None
+    return pyarrow
+
+
+def _iter_bulk_input(path: str, file_format: str,
+                     batch_size: int) -> Iterator[List[Tuple[Optional[Dict[str, Any]], Optional[str]]]]:
+    """Batches of (startup, error) read from a file; missing/empty cells are left out of the startup"""
+    if file_format in ('parquet', 'arrow'):
+        pa = _import_pyarrow()
+        if file_format == 'parquet':
+            batches = pa.parquet.ParquetFile(path).iter_batches(batch_size=batch_size)
+        else:
+            with pa.memory_map(path) as source:
+                try:
+                    reader = pa.ipc.open_file(source)
+                    batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+                except pa.ArrowInvalid:
+                    batches = pa.ipc.open_stream(source)
+                for batch in batches:
+                    for start in range(0, batch.num_rows, batch_size):
+                        yield [({k: v for k, v in row.items() if v is not None}, None)
+                               for row in batch.slice(start, batch_size).to_pylist()]
+            return
+        for batch in batches:
+            yield [({k: v for k, v in row.items() if v is not None}, None) for row in batch.to_pylist()]
+        return
+
+    with open(path, newline='' if file_format == 'csv' else None) as f:
+        if file_format == 'csv':
+            import csv
+
+            rows = (({k: v for k, v in row.items() if v}, None) for row in csv.DictReader(f))
+        else:
+            rows = _parse_jsonl(f)
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def _parse_jsonl(lines) -> Iterator[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+            yield (data, None) if isinstance(data, dict) else (None, f"Line {line_number}: expected a JSON object")
+        except ValueError as e:
+            yield None, f"Line {line_number}: {e}"
+
+
+def _score_each(score_batch, records: List[Any]) -> List[Tuple[Any, Optional[Exception]]]:
+    """(result, exception) per record from score_batch, which maps a list of records to one result each
+
+    A failing batch is retried record by record, so one bad record fails
+    alone instead of taking its neighbours with it.
+    """
+    try:
+        return [(result, None) for result in score_batch(records)]
+    except Exception:
+        pass
+    outcomes = []
+    for record in records:
+        try:
+            outcomes.append((score_batch([record])[0], None))
+        except Exception as e:
+            outcomes.append((None, e))
+    return outcomes
+
+
+def _score_bulk_batch(score_batch, batch: List[Tuple[Optional[Dict[str, Any]], Optional[str]]]) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """(result, error message) per (startup, parse error) row; rows that failed to parse keep their error"""
+    scored = iter(_score_each(score_batch, [data for data, error in batch if error is None]))
+    results = []
+    for _, error in batch:
+        if error is None:
+            result, exception = next(scored)
+            results.append((result, None if exception is None else str(exception)))
+        else:
+            results.append((None, error))
+    return results
+
+
+class _BulkWriter:
+    """Writes score_file results as columns
+
+    Scores, component scores and metrics become float columns. SWOT points
+    and recommendations become list columns; in Parquet and Arrow their
+    phrases are dictionary-encoded, because they come from a small set of
+    templates. The dictionaries only grow, so Arrow files carry each batch's
+    additions as dictionary deltas.
+    """
+    SCORE_COLUMNS = ['overall_score', 'success_probability', 'strengths', 'weaknesses', 'opportunities', 'threats']
+    TEXT_COLUMNS = ['swot_strengths', 'swot_weaknesses', 'swot_opportunities', 'swot_threats', 'recommendations']
+
+    def __init__(self, path: str, file_format: str, id_column: Optional[str] = None):
+        self.path = path
+        self.file_format = file_format
+        self.id_column = id_column
+        self.vocabularies: Dict[str, Dict[str, int]] = {column: {} for column in self.TEXT_COLUMNS}
+        self._writer = None
+        self._file = None
+        if file_format in ('parquet', 'arrow'):
+            self._pa = _import_pyarrow()
+            self._schema = self._arrow_schema()
+        else:
+            self._file = open(path, 'w', newline='')
+            if file_format == 'csv':
+                import csv
+
+                self._writer = csv.writer(self._file)
+                self._writer.writerow(self._column_names())
+
+    def _column_names(self) -> List[str]:
+        return (['row'] + ([self.id_column] if self.id_column else []) + self.SCORE_COLUMNS + METRIC_NAMES
+                + self.TEXT_COLUMNS + ['error'])
+
+    def _arrow_schema(self):
+        pa = self._pa
+        phrases = pa.list_(pa.dictionary(pa.int32(), pa.string()))
+        return pa.schema(
+            [('row', pa.int64())] + ([(self.id_column, pa.string())] if self.id_column else [])
+            + [(name, pa.float64()) for name in self.SCORE_COLUMNS + METRIC_NAMES]
+            + [(name, phrases) for name in self.TEXT_COLUMNS] + [('error', pa.string())]
+        )
+
+    @staticmethod
+    def _flatten(result: Dict[str, Any]) -> Dict[str, Any]:
+        row = {'overall_score': result['overall_score'], 'success_probability': result['success_probability']}
+        row.update(result['component_scores'])
+        row.update(result['metrics'])
+        for kind, points in result['swot_analysis'].items():
+            row[f"swot_{kind}"] = points
+        row['recommendations'] = result['recommendations']
+        return row
+
+    def write(self, first_row: int, batch: List[Tuple[Optional[Dict[str, Any]], Optional[str]]],
+              results: List[Tuple[Optional[Dict[str, Any]], Optional[str]]]):
+        rows = [self._flatten(result) if result is not None else {} for result, _ in results]
+        errors = [error for _, error in results]
+        ids = [None if data is None or data.get(self.id_column) is None else str(data[self.id_column])
+               for data, _ in batch] if self.id_column else None
+
+        if self.file_format in ('parquet', 'arrow'):
+            self._write_arrow(first_row, rows, errors, ids)
+        elif self.file_format == 'csv':
+            for i, (row, error) in enumerate(zip(rows, errors)):
+                values = [first_row + i] + ([ids[i]] if ids else [])
+                values += [row.get(name, '') for name in self.SCORE_COLUMNS + METRIC_NAMES]
+                values += ['; '.join(row.get(name, [])) for name in self.TEXT_COLUMNS]
+                self._writer.writerow(values + [error or ''])
+        else:
+            for i, (result, error) in enumerate(results):
+                line = {'row': first_row + i}
+                if ids:
+                    line[self.id_column] = ids[i]
+                line.update(result if error is None else {'error': error})
+                self._file.write(json.dumps(line) + '\n')
+
+    def _write_arrow(self, first_row: int, rows: List[Dict[str, Any]], errors: List[Optional[str]],
+                     ids: Optional[List[Optional[str]]]):
+        pa = self._pa
+        columns = [pa.array(np.arange(first_row, first_row + len(rows)), pa.int64())]
+        if ids is not None:
+            columns.append(pa.array(ids, pa.string()))
+        columns += [pa.array([row.get(name) for row in rows], pa.float64())
+                    for name in self.SCORE_COLUMNS + METRIC_NAMES]
+        for name in self.TEXT_COLUMNS:
+            vocabulary = self.vocabularies[name]
+            offsets, indices = [0], []
+            for row in rows:
+                indices.extend(vocabulary.setdefault(phrase, len(vocabulary)) for phrase in row.get(name, []))
+                offsets.append(len(indices))
+            phrases = pa.DictionaryArray.from_arrays(pa.array(indices, pa.int32()), pa.array(list(vocabulary), pa.string()))
+            columns.append(pa.ListArray.from_arrays(pa.array(offsets, pa.int32()), phrases))
+        columns.append(pa.array(errors, pa.string()))
+        batch = pa.record_batch(columns, schema=self._schema)
+
+        if self._writer is None:
+            if self.file_format == 'parquet':
+                self._writer = pa.parquet.ParquetWriter(self.path, self._schema)
+            else:
+                self._writer = pa.ipc.new_file(self.path, self._schema,
+                                               options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True))
+        self._writer.write_batch(batch)
+
+    def close(self):
+        if self.file_format in ('parquet', 'arrow'):
+            if self._writer is None:
+                # No input rows: still leave a valid, empty file behind
+                self._writer = (self._pa.parquet.ParquetWriter(self.path, self._schema)
+                                if self.file_format == 'parquet' else self._pa.ipc.new_file(self.path, self._schema))
+            self._writer.close()
+        else:
+            self._file.close()
+
+
+def score_file(input_path: str, output_path: str, batch_size: int = DEFAULT_BULK_BATCH_ROWS,
+               engine=None, input_format: Optional[str] = None, output_format: Optional[str] = None,
+               id_column: Optional[str] = None) -> Dict[str, Any]:
+    """Score a Parquet, Arrow, CSV or JSONL file of startups into a columnar output file
+
+    Rows are read, scored and written batch_size at a time, so memory is
+    bounded by the batch rather than the file. Output row i (the 'row'
+    column) is input row i; rows that cannot be scored carry an 'error'.
+    Returns throughput statistics.
+    """
+    input_format = _bulk_format(input_path, input_format)
+    output_format = _bulk_format(output_path, output_format)
+    engine = engine or SWOTScoringEngine(use_cache=False)
+    writer = _BulkWriter(output_path, output_format, id_column)
+
+    start = time.perf_counter()
+    rows = errors = batches = 0
+    try:
+        for batch in _iter_bulk_input(input_path, input_format, batch_size):
+            results = _score_bulk_batch(engine.calculate_swot_scores_batch, batch)
+            writer.write(rows, batch, results)
+            rows += len(batch)
+            errors += sum(error is not None for _, error in results)
+            batches += 1
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    return {
+        'input': input_path, 'output': output_path, 'rows': rows, 'errors': errors, 'batches': batches,
+        'seconds': round(elapsed, 3), 'rows_per_second': round(rows / elapsed, 1) if elapsed else None,
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def _batch_command(argv: List[str]):
+    parser = _argument_parser(prog='swot-scoring.py batch',
+                                     description='Score JSONL startups from stdin, writing JSONL results to stdout')
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--explain', nargs='?', const=True, default=False, choices=EXPLANATION_METHODS,
+                        help='Add per-feature explanations of success_probability (optionally the method: '
+                             'saabas, the default, or the slower exact tree_shap)')
+    parser.add_argument('--compact', action='store_true',
+                        help='Write results in the compact layout (phrase IDs instead of text, see render_compact)')
+    parser.add_argument('--processes', type=int, default=1, help='Worker processes to spread each batch over')
+    args = parser.parse_args(argv)
+    engine = WorkerPool(args.processes) if args.processes > 1 else SWOTScoringEngine()
+    try:
+        score_jsonl(sys.stdin, sys.stdout, args.batch_size, engine,
+                    lambda records: engine.calculate_swot_scores_batch(records, explain=args.explain,
+                                                                       compact=args.compact))
+    finally:
+        if isinstance(engine, WorkerPool):
+            engine.close()
+
+
+def _score_file_command(argv: List[str]):
+    parser = _argument_parser(prog='swot-scoring.py score-file',
+                              description='Score a Parquet/Arrow/CSV/JSONL file of startups into a columnar file')
+    parser.add_argument('input', help='Startups file (.parquet, .arrow/.feather, .csv or .jsonl)')
+    parser.add_argument('output', help='Results file (.parquet, .arrow/.feather, .csv or .jsonl)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BULK_BATCH_ROWS, help='Rows per read/score/write batch')
+    parser.add_argument('--input-format', choices=sorted(set(BULK_FORMATS.values())))
+    parser.add_argument('--output-format', choices=sorted(set(BULK_FORMATS.values())))
+    parser.add_argument('--id-column', help='Input column copied to the output to identify rows')
+    parser.add_argument('--processes', type=int, default=1, help='Worker processes to spread each batch over')
+    args = parser.parse_args(argv)
+    engine = WorkerPool(args.processes, use_cache=False) if args.processes > 1 else SWOTScoringEngine(use_cache=False)
+    try:
+        report = score_file(args.input, args.output, args.batch_size, engine,
+                            args.input_format, args.output_format, args.id_column)
+    except (ImportError, OSError, ValueError) as e:
+        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if isinstance(engine, WorkerPool):
+            engine.close()
+    print(f"Scored {report['rows']} rows ({report['errors']} errors) in {report['seconds']}s, "
+          f"{report['rows_per_second']} rows/s, peak RSS {report['peak_rss_mb']} MB", file=sys.stderr)
+    print(json.dumps(report, indent=2))
+
+
+def _similar_command(argv: List[str]):
+    parser = _argument_parser(prog='swot-scoring.py similar',
+                              description='Find the closest reference startups for each JSONL startup on stdin')
+    parser.add_argument('-k', type=int, default=5, help='Neighbours per startup')
+    parser.add_argument('--probes', type=int, default=DEFAULT_SIMILARITY_PROBES,
+                        help='Index lists scanned per query (more is slower but more exact)')
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args(argv)
+    engine = SWOTScoringEngine()
+    if engine.artifact.similarity is None:
+        print("Model artifact has no similarity index; retrain it with this version", file=sys.stderr)
+        sys.exit(1)
+
+    def similar_batch(records):
+        return [{'similar': neighbours} for neighbours in engine.find_similar_batch(records, args.k, args.probes)]
+
+    score_jsonl(sys.stdin, sys.stdout, args.batch_size, engine, similar_batch)
+
+
+def _parse_sweep_axis(spec: str) -> Tuple[str, np.ndarray]:
+    """'name=start:stop:num' (inclusive linspace) or 'name=v1,v2,...'"""
+    name, sep, values = spec.partition('=')
+    if not sep:
+        raise ValueError(f"Grid axis must look like name=values: {spec}")
+    if ':' in values:
+        start, stop, num = values.split(':')
+        return name, np.linspace(float(start), float(stop), int(num))
+    return name, np.array([float(value) for value in values.split(',')])
+
+
+def _sweep_command(argv: List[str]):
+    parser = _argument_parser(prog='swot-scoring.py sweep',
+                              description='Score a grid of metric overrides for one startup, writing CSV to stdout')
+    parser.add_argument('startup', help='Startup JSON')
+    parser.add_argument('--grid', action='append', default=[], metavar='METRIC=VALUES',
+                        help='Swept metric, as start:stop:num or v1,v2,...; repeat for more axes')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_SWEEP_CHUNK_ROWS)
+    args = parser.parse_args(argv)
+    try:
+        grid = dict(_parse_sweep_axis(spec) for spec in args.grid)
+        chunks = SWOTScoringEngine().sweep(json.loads(args.startup), grid, args.chunk_size)
+        header_written = False
+        for chunk in chunks:
+            if not header_written:
+                sys.stdout.write(','.join(chunk) + '\n')
+                header_written = True
+            np.savetxt(sys.stdout, np.column_stack(list(chunk.values())), delimiter=',', fmt='%.6g')
+    except ValueError as e:
+        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        sys.exit(1)
+
+
+def _serve_command(argv: List[str]):
+    parser = _argument_parser(prog='swot-scoring.py serve', description='Run the SWOT scoring HTTP server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent scoring threads')
+    parser.add_argument('--max-pending', type=int, default=64, help='Queued requests before answering 503')
+    parser.add_argument('--instrument', action='store_true',
+                        help='Time each scoring stage and expose it on /metrics (also SWOT_INSTRUMENTATION=1)')
+    parser.add_argument('--processes', type=int, default=1,
+                        help='Scoring worker processes sharing the memory-mapped model (default 1: in-process)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Serve on asyncio with request coalescing, micro-batching and deadlines '
+                             '(--workers and --max-pending do not apply)')
+    parser.add_argument('--batch-window-ms', type=float, default=2.0,
+                        help='With --async: how long a batch waits for more requests')
+    parser.add_argument('--max-queue', type=int, default=1024,
+                        help='With --async: distinct requests waiting for a batch before answering 503')
+    parser.add_argument('--deadline-ms', type=float, default=5000.0,
+                        help='With --async: default request deadline before answering 504')
+    args = parser.parse_args(argv)
+    if args.use_async:
+        serve_async(args.host, args.port, args.instrument, args.processes, batch_window=args.batch_window_ms / 1000,
+                    max_queue=args.max_queue, timeout=args.deadline_ms / 1000)
+    else:
+        serve(args.host, args.port, args.workers, args.max_pending, args.instrument, args.processes)
+
+
+COMMANDS = {
+    'serve': _serve_command,
+    'train': _train_command,
+    'batch': _batch_command,
+    'score-file': _score_file_command,
+    'similar': _similar_command,
+    'sweep': _sweep_command,
+    'import-budget': _import_budget_command,
+    'forest-benchmark': _forest_benchmark_command,
+}
 
 def main():
     """Main function for command-line usage"""
     if len(sys.argv) < 2:
         print("Usage: python swot-scoring.py '<json_data>'")
+        print("       python swot-scoring.py train [--output PATH]")
+        print("       python swot-scoring.py batch < startups.jsonl > results.jsonl")
+        print("       python swot-scoring.py score-file startups.parquet results.parquet")
+        print("       python swot-scoring.py serve [--host HOST] [--port PORT] [--workers N]")
         sys.exit(1)
+
+    profile_path = os.environ.get('SWOT_PROFILE')
+    if profile_path:
+        # Deterministic profile of the whole command, readable with python -m pstats
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            _run_command(sys.argv[1:])
+        finally:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+            print(f"Profile written to {profile_path}", file=sys.stderr)
+        return
+    _run_command(sys.argv[1:])
+
+
+def _run_command(argv: List[str]):
+    if argv[0] in COMMANDS:
+        COMMANDS[argv[0]](argv[1:])
+        return
     
     try:
-        startup_data = json.loads(sys.argv[1])
+        startup_data = json.loads(argv[0])
         engine = SWOTScoringEngine()
         results = engine.calculate_swot_scores(startup_data)
-        print(json.dumps(results, indent=2))
+        # Pretty-printed for people; callers reading a pipe get it without the whitespace
+        print(json.dumps(results, indent=2) if sys.stdout.isatty() else json.dumps(results, separators=(',', ':')))
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,25 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'swot-scoring.py')
+
+
+@pytest.fixture(scope='session')
+def swot():
+    """services/swot-scoring.py as a module (its file name is not a valid module name)"""
+    spec = importlib.util.spec_from_file_location('swot_scoring', SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='session')
+def trained_engine(swot):
+    """A small model trained in-process (needs scikit-learn), no result cache"""
+    pytest.importorskip('sklearn')
+    return swot.SWOTScoringEngine(train=True, use_cache=False,
+                                  training_options={'n_samples': 400, 'n_estimators': 10, 'n_jobs': 1})
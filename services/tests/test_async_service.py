@@ -0,0 +1,65 @@
+"""AsyncScoringService must finish every flight, whatever fails around the scoring itself"""
+import asyncio
+
+import pytest
+
+STARTUP = {'industry': 'SaaS', 'location': 'US', 'audience': 'small businesses', 'description': 'invoicing'}
+
+
+@pytest.fixture
+def flaky_cache(swot):
+    class FlakyCache(swot.ResultCache):
+        """A cache whose first write fails, like a locked shared SQLite tier"""
+        failures = 1
+
+        def put(self, key, result):
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError('database is locked')
+            super().put(key, result)
+
+    return FlakyCache()
+
+
+def run(service, *calls):
+    async def main():
+        await service.start()
+        try:
+            results = []
+            for call in calls:
+                try:
+                    results.append(await call())
+                except Exception as e:
+                    results.append(e)
+            return results
+        finally:
+            await service.close()
+
+    return asyncio.run(main())
+
+
+def test_cache_write_error_does_not_fail_the_result(swot, trained_engine, flaky_cache):
+    service = swot.AsyncScoringService(trained_engine, flaky_cache, timeout=5.0)
+    first, second = run(service, lambda: service.score(STARTUP), lambda: service.score(STARTUP))
+    expected = trained_engine.calculate_swot_scores(STARTUP)
+    assert first == expected and second == expected
+    assert service.stats()['cache_errors'] == 1
+    assert service.stats()['in_flight'] == 0
+
+
+def test_failed_batch_finishes_its_flights(swot, trained_engine, monkeypatch):
+    service = swot.AsyncScoringService(trained_engine, timeout=2.0)
+    score_group = service._score_group
+    calls = []
+
+    def broken_once(group, explain):
+        calls.append(len(group))
+        if len(calls) == 1:
+            raise RuntimeError('executor job failed')
+        return score_group(group, explain)
+
+    monkeypatch.setattr(service, '_score_group', broken_once)
+    first, *later = run(service, *[lambda: service.score(STARTUP)] * 3)
+    assert isinstance(first, RuntimeError)
+    assert all(result == trained_engine.calculate_swot_scores(STARTUP) for result in later)
+    assert service.stats()['in_flight'] == 0
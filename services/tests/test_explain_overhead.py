@@ -0,0 +1,36 @@
+"""The default explanation must stay within a small multiple of a plain predict
+
+Exact TreeSHAP is far more expensive and only runs when asked for by name
+(explain='tree_shap'); test_tree_shap.py checks its values.
+"""
+import time
+
+import numpy as np
+
+# Saabas measures at about 2x predict, single row and batch
+MAX_EXPLAIN_OVERHEAD = 4.0
+
+
+def best_of(fn, repeats=7):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_default_explanation_overhead(swot, trained_engine):
+    forest = trained_engine.artifact.forest
+    X = trained_engine.artifact.unscale(np.random.default_rng(0).normal(size=(2000, len(swot.FEATURE_COLUMNS))))
+    for rows in (X[:1], X):
+        overhead = best_of(lambda: forest.explain(rows)) / best_of(lambda: forest.predict(rows))
+        assert overhead < MAX_EXPLAIN_OVERHEAD, f"explain costs {overhead:.1f}x predict on {len(rows)} rows"
+
+
+def test_tree_shap_is_opt_in(swot, trained_engine):
+    startup = {'industry': 'SaaS', 'description': 'invoicing'}
+    assert trained_engine.calculate_swot_scores(startup, explain=True)['explanation']['method'] == 'saabas'
+    explanation = trained_engine.calculate_swot_scores(startup, explain='tree_shap')['explanation']
+    assert explanation['method'] == 'tree_shap'
+    assert swot.cache_key(startup, 'v', True) != swot.cache_key(startup, 'v', 'tree_shap')
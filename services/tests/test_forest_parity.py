@@ -0,0 +1,43 @@
+"""FlatForest.from_sklearn must reproduce RandomForestRegressor.predict exactly
+
+The export folds the StandardScaler into the split thresholds, so the flat
+forest runs on raw features while sklearn runs on scaled ones. Rows sitting
+exactly on a folded threshold (and one double above it) check that the fold
+reproduces sklearn's float32 comparison at the boundary.
+"""
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope='module')
+def fitted(swot):
+    ensemble = pytest.importorskip('sklearn.ensemble')
+    preprocessing = pytest.importorskip('sklearn.preprocessing')
+    engine = swot.SWOTScoringEngine.__new__(swot.SWOTScoringEngine)
+    X, raw_score = next(engine._iter_mock_training_chunks(600, 600))
+    scaler = preprocessing.StandardScaler().fit(X)
+    model = ensemble.RandomForestRegressor(n_estimators=20, random_state=42).fit(
+        scaler.transform(X).astype(np.float32), raw_score)
+    forest = swot.FlatForest.from_sklearn(model, scaler.mean_, scaler.scale_)
+    return X, scaler, model, forest
+
+
+def boundary_rows(X, forest):
+    """Training rows moved onto split thresholds: once at the threshold, once just above it"""
+    rng = np.random.default_rng(0)
+    internal = np.flatnonzero(np.isfinite(forest.threshold))
+    nodes = rng.choice(internal, size=min(300, len(internal)), replace=False)
+    rows = np.repeat(X[rng.integers(0, len(X), len(nodes))], 2, axis=0)
+    features = np.repeat(forest.feature[nodes], 2)
+    thresholds = np.repeat(forest.threshold[nodes], 2)
+    thresholds[1::2] = np.nextafter(thresholds[1::2], np.inf)
+    rows[np.arange(len(rows)), features] = thresholds
+    return rows
+
+
+def test_predict_matches_sklearn(fitted):
+    X, scaler, model, forest = fitted
+    for rows in (X, boundary_rows(X, forest)):
+        expected = model.predict(scaler.transform(rows))
+        np.testing.assert_array_equal(forest.predict(rows), expected)
+        np.testing.assert_array_equal([forest.predict_one(row) for row in rows], expected)
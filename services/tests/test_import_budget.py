@@ -0,0 +1,11 @@
+import py_compile
+
+
+def test_import_stays_within_budget(swot):
+    # Deployed code imports from cached bytecode; refresh it so a stale cache is not timed as a recompile
+    py_compile.compile(swot.__file__, doraise=True)
+    # Timings on a loaded machine are noisy, so the best of three probes counts
+    reports = [swot.check_import_budget() for _ in range(3)]
+    assert all(not report['deferred_modules_loaded'] for report in reports), reports
+    best = min(reports, key=lambda report: report['module_ms'])
+    assert best['within_budget'], best
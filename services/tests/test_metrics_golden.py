@@ -0,0 +1,70 @@
+"""Golden metric outputs
+
+The expected values were produced by the original per-call _extract_metrics
+(closures and scalar np.log/np.cos per metric). The table-driven and
+vectorized derivations must reproduce them bit for bit.
+"""
+import pytest
+
+GOLDEN = [
+    ({'industry': 'SaaS', 'location': 'US', 'audience': 'small businesses', 'description': 'invoice automation'},
+     [16.28253851680514, 8.941131965142278, 2.854618787620762, 8.732800836697397, 6.007437111899827,
+      1.9043248707204932, 17.944101084755346, 31.097555387661316, 5697064.700080756]),
+    ({'industry': 'FinTech', 'location': 'Europe', 'audience': 'retail investors', 'description': 'robo-advisor'},
+     [9.73705466812769, 3.696872362849605, 9.354199561622456, 5.633945024333993, 3.721812591429847,
+      4.540363090997852, 10.920284806091917, 201.99117202636347, 4220448.588257351]),
+    ({'industry': 'HealthTech', 'location': 'India', 'audience': 'hospitals', 'description': 'triage assistant'},
+     [16.94588891615986, 3.2516702017777113, 9.63482065598883, 5.327810574405876, 6.629674430518172,
+      2.757634001670255, 20.07263980959097, 264.7477080381358, 8806292.559717651]),
+    ({'industry': 'EdTech', 'location': 'Asia', 'audience': 'students', 'description': ''},
+     [6.252107630748023, 6.781867257180605, 5.75782963857945, 5.393269128262408, 6.1019717517396606,
+      1.7014105901836762, 15.25711335889671, 57.50233879457548, 1592091.2936051502]),
+    ({'industry': 'E-commerce', 'location': 'Global', 'audience': 'developers', 'description': 'storefront API'},
+     [19.916403110653707, 4.246250954851596, 2.8496770818936406, 4.150609787380577, 4.738272975425545,
+      2.401683067060442, 10.680574010341964, 106.86764715571914, 1134828.9382237284]),
+    ({'industry': 'AI/ML', 'location': 'US', 'audience': 'developers', 'description': 'Model Monitoring'},
+     [18.23739407231351, 2.2588579820800203, 4.458430772580891, 7.673659388561081, 7.428264685158194,
+      1.1555426604573595, 9.704085841974688, 275.89635986049655, 1937873.6580563071]),
+    ({'industry': 'Retail', 'location': 'US', 'audience': 'shoppers', 'description': 'ai matches retail'},
+     [16.050355100342962, 4.125355769453128, 4.863468846930375, 8.287112635647375, 4.656017353505837,
+      1.7981129142961736, 17.291804917260674, 197.13099650130764, 5983323.764888661]),
+    ({'industry': 'Blockchain', 'location': 'Global', 'audience': 'retail investors', 'description': 'custody'},
+     [15.5338354797557, 5.62091324477315, 6.0806907088315585, 9.904814727593108, 5.25702650410129,
+      2.748926850146794, 8.57445251973703, 24.41939612189833, 5215258.459530908]),
+    ({'industry': 'IoT'},
+     [10.050675574009208, 5.764499679025267, 4.1210945731305335, 7.4979071717530275, 4.528207190749477,
+      4.612197072303093, 7.946725736131047, 323.4914053081935, 7438154.535112673]),
+    ({},
+     [19.64277752163541, 6.4366071178722715, 2.8109884034883565, 6.57997944123671, 1.0, 6.992315635745057,
+      5.3107332593557715, 318.9043328470452, 6114016.816409489]),
+]
+
+
+@pytest.fixture
+def engine(swot):
+    # Metric extraction needs no model, so skip loading or training one
+    return swot.SWOTScoringEngine.__new__(swot.SWOTScoringEngine)
+
+
+def expected_metrics(swot, values):
+    return dict(zip(swot.METRIC_NAMES, values))
+
+
+def test_single_call_without_table(swot, engine):
+    swot._box_muller_lookup.cache_clear()
+    swot._box_muller_table.cache_clear()
+    for startup, values in GOLDEN:
+        assert engine._extract_metrics(startup) == expected_metrics(swot, values)
+    assert swot._box_muller_table.cache_info().currsize == 0
+
+
+def test_single_call_with_table(swot, engine):
+    swot._box_muller_table()
+    for startup, values in GOLDEN:
+        assert engine._extract_metrics(startup) == expected_metrics(swot, values)
+
+
+def test_batch(swot, engine):
+    columns = engine._extract_metrics_batch([startup for startup, _ in GOLDEN])
+    for i, (_, values) in enumerate(GOLDEN):
+        assert {name: float(column[i]) for name, column in columns.items()} == expected_metrics(swot, values)
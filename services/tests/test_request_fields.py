@@ -0,0 +1,16 @@
+"""Scoring requests with non-string text fields are client errors (400), not 500s"""
+import pytest
+
+
+@pytest.mark.parametrize('startup', [{'industry': 5}, {'location': ['x']}, {'audience': {}}, {'description': None}])
+def test_non_string_field_is_rejected(swot, startup):
+    field = next(iter(startup))
+    with pytest.raises(ValueError, match=f"{field} must be a string"):
+        swot._check_startup_fields(startup)
+    with pytest.raises(ValueError, match=f"{field} must be a string"):
+        swot._similar_request({'startups': [startup]}, {})
+
+
+def test_missing_and_string_fields_pass(swot):
+    swot._check_startup_fields({})
+    swot._check_startup_fields({'industry': 'SaaS', 'location': 'US', 'audience': '', 'description': 'x', 'extra': 1})
@@ -0,0 +1,24 @@
+"""POST /similar request validation and SimilarityIndex.search bounds"""
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize('k', ['0', '-1', '300000000', 'x'])
+def test_bad_k_is_rejected(swot, k):
+    with pytest.raises(ValueError, match='k must'):
+        swot._similar_request({'industry': 'SaaS'}, {'k': [k]})
+
+
+def test_portfolio_must_hold_objects(swot):
+    with pytest.raises(ValueError, match='startups must be a list of JSON objects'):
+        swot._similar_request({'startups': [1, 2]}, {})
+    assert swot._similar_request({'startups': [{}]}, {'k': ['3']}) == ([{}], 3, True)
+    assert swot._similar_request({'industry': 'SaaS'}, {}) == ([{'industry': 'SaaS'}], 5, False)
+
+
+def test_search_caps_k_at_indexed_rows(trained_engine):
+    index = trained_engine.artifact.similarity
+    positions, distances = index.search(np.zeros((2, index.vectors.shape[1])), k=10 ** 9)
+    assert positions.shape == (2, index.n_rows)
+    with pytest.raises(ValueError):
+        index.search(np.zeros((1, index.vectors.shape[1])), k=0)
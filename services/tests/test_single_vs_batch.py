@@ -0,0 +1,31 @@
+"""Single and batch scoring must serialize identically
+
+Compact results are cached and shared between both paths, so the same input
+has to produce the same JSON whichever path scored it first, clipped values
+included.
+"""
+import json
+import random
+
+import pytest
+
+INDUSTRIES = ['SaaS', 'FinTech', 'HealthTech', 'EdTech', 'IoT', 'AI/ML', 'Retail', 'Blockchain']
+LOCATIONS = ['US', 'Europe', 'Asia', 'India', 'Global']
+AUDIENCES = ['small businesses', 'students', 'developers', 'retail investors']
+
+
+@pytest.fixture(scope='module')
+def startups():
+    rng = random.Random(1)
+    return [{'industry': rng.choice(INDUSTRIES), 'location': rng.choice(LOCATIONS),
+             'audience': rng.choice(AUDIENCES), 'description': f"idea {rng.randrange(10 ** 9)}"}
+            for _ in range(1000)]
+
+
+@pytest.mark.parametrize('compact', [False, True])
+@pytest.mark.parametrize('explain', [False, True])
+def test_single_matches_batch(trained_engine, startups, explain, compact):
+    batch = trained_engine.calculate_swot_scores_batch(startups, explain, compact=compact)
+    for startup, result in zip(startups, batch):
+        single = trained_engine.calculate_swot_scores(startup, explain, compact=compact)
+        assert json.dumps(single) == json.dumps(result), startup
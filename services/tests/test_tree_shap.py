@@ -0,0 +1,73 @@
+"""FlatForest.explain against Shapley values computed by brute force
+
+The path-dependent value function of a coalition S walks each tree, following
+the row at splits on features in S and averaging both children by cover
+elsewhere. Enumerating every coalition of a few features gives the exact
+Shapley values TreeSHAP must reproduce.
+"""
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+N_FEATURES = 5
+
+
+def _conditional_expectation(forest, x, coalition):
+    def walk(node):
+        left, right = forest.children[2 * node], forest.children[2 * node + 1]
+        if left == node:
+            return forest.value[node]
+        feature = forest.feature[node]
+        if feature in coalition:
+            return walk(right if x[feature] > forest.threshold[node] else left)
+        return (forest.cover[left] * walk(left) + forest.cover[right] * walk(right)) / forest.cover[node]
+
+    return sum(walk(root) for root in forest.roots) / forest.n_trees
+
+
+def _brute_force_shap(forest, x):
+    values = {coalition: _conditional_expectation(forest, x, set(coalition))
+              for size in range(N_FEATURES + 1) for coalition in itertools.combinations(range(N_FEATURES), size)}
+    shap = np.zeros(N_FEATURES)
+    for i in range(N_FEATURES):
+        others = [j for j in range(N_FEATURES) if j != i]
+        for size in range(N_FEATURES):
+            weight = math.factorial(size) * math.factorial(N_FEATURES - 1 - size) / math.factorial(N_FEATURES)
+            for coalition in itertools.combinations(others, size):
+                shap[i] += weight * (values[tuple(sorted(coalition + (i,)))] - values[coalition])
+    return values[()], shap
+
+
+@pytest.fixture(scope='module')
+def forest(swot):
+    ensemble = pytest.importorskip('sklearn.ensemble')
+    rng = np.random.default_rng(7)
+    X = rng.normal(size=(400, N_FEATURES))
+    y = X[:, 0] * X[:, 1] + np.where(X[:, 2] > 0, 2.0, -1.0) + rng.normal(scale=0.1, size=400)
+    model = ensemble.RandomForestRegressor(n_estimators=4, max_depth=6, random_state=0).fit(X, y)
+    return swot.FlatForest.from_sklearn(model, np.zeros(N_FEATURES), np.ones(N_FEATURES))
+
+
+def test_tree_shap_matches_brute_force(forest):
+    X = np.random.default_rng(8).normal(size=(6, N_FEATURES))
+    base, contributions = forest.explain(X, 'tree_shap')
+    for x, row in zip(X, contributions):
+        expected_base, expected = _brute_force_shap(forest, x)
+        assert base == pytest.approx(expected_base, abs=1e-12)
+        np.testing.assert_allclose(row, expected, atol=1e-12)
+
+
+def test_contributions_add_up_to_prediction(forest):
+    X = np.random.default_rng(9).normal(size=(50, N_FEATURES))
+    for method in ('saabas', 'tree_shap'):
+        base, contributions = forest.explain(X, method)
+        np.testing.assert_allclose(base + contributions.sum(axis=1), forest.predict(X), atol=1e-9)
+
+
+def test_tree_shap_needs_covers(forest, swot):
+    legacy = swot.FlatForest(forest.feature, forest.threshold, forest.children, forest.value, forest.roots,
+                             forest.max_depth)
+    with pytest.raises(ValueError, match='node covers'):
+        legacy.explain(np.zeros((1, N_FEATURES)), 'tree_shap')